@@ -3,7 +3,11 @@ Perform sanity checks on the framework's pydantic serialization and
 deserialization using generated json fixtures files.
 """
 
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, List, Optional
 
 import click
 from rich.progress import BarColumn, Progress, TaskProgressColumn, TextColumn, TimeElapsedColumn
@@ -18,8 +22,14 @@ def count_json_files_exclude_index(start_path: Path) -> int:
     Return the number of json files in the specified directory, excluding
     index.json files.
     """
-    json_file_count = sum(1 for file in start_path.rglob("*.json") if file.name != "index.json")
-    return json_file_count
+    return len(list_json_files_exclude_index(start_path))
+
+
+def list_json_files_exclude_index(start_path: Path) -> List[Path]:
+    """
+    Return the json files in the specified directory, excluding index.json files.
+    """
+    return [file for file in start_path.rglob("*.json") if file.name != "index.json"]
 
 
 def check_json(json_file_path: Path):
@@ -55,6 +65,32 @@ def check_json(json_file_path: Path):
             )
 
 
+@dataclass
+class WorkerError:
+    """
+    Exception raised while checking a json file in a worker process.
+
+    The exceptions are not returned by the workers as they are not guaranteed
+    to be picklable.
+    """
+
+    type_name: str
+    message: str
+    traceback: str
+
+
+def check_json_in_worker(json_file_path: Path) -> Optional[WorkerError]:
+    """
+    Check all fixtures in the specified json file from a worker process, and
+    return the error, if any.
+    """
+    try:
+        check_json(json_file_path)
+    except Exception as e:
+        return WorkerError(type(e).__name__, str(e), traceback.format_exc())
+    return None
+
+
 @click.command()
 @click.option(
     "--input",
@@ -83,9 +119,21 @@ def check_json(json_file_path: Path):
     expose_value=True,
     help="Stop and raise any exceptions encountered while checking fixtures.",
 )
-def check_fixtures(input_dir: str, quiet_mode: bool, stop_on_error: bool):
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes used to check the fixture files.",
+)
+def check_fixtures(input_dir: str, quiet_mode: bool, stop_on_error: bool, workers: int):
     """
     Perform some checks on the fixtures contained in the specified directory.
+
+    With multiple workers, the largest files are checked first and the errors are
+    printed in the same order as with a single worker once all files are checked.
     """
     input_path = Path(input_dir)
     success = True
@@ -94,6 +142,12 @@ def check_fixtures(input_dir: str, quiet_mode: bool, stop_on_error: bool):
     if not quiet_mode:
         file_count = count_json_files_exclude_index(input_path)
 
+    def display_name(json_file_path: Path) -> str:
+        display_filename = json_file_path.name
+        if len(display_filename) > filename_display_width:
+            return display_filename[: filename_display_width - 3] + "..."
+        return display_filename.ljust(filename_display_width)
+
     with Progress(
         TextColumn(
             f"[bold cyan]{{task.fields[filename]:<{filename_display_width}}}[/]", justify="left"
@@ -106,26 +160,49 @@ def check_fixtures(input_dir: str, quiet_mode: bool, stop_on_error: bool):
     ) as progress:
 
         task_id = progress.add_task("Checking fixtures", total=file_count, filename="...")
-        for json_file_path in input_path.rglob("*.json"):
-            if json_file_path.name == "index.json":
-                continue
-
-            display_filename = json_file_path.name
-            if len(display_filename) > filename_display_width:
-                display_filename = display_filename[: filename_display_width - 3] + "..."
-            else:
-                display_filename = display_filename.ljust(filename_display_width)
-
-            try:
-                progress.update(task_id, advance=1, filename=f"Checking {display_filename}")
-                check_json(json_file_path)
-            except Exception as e:
-                success = False
-                if stop_on_error:
-                    raise e
-                else:
+        if workers == 1:
+            for json_file_path in list_json_files_exclude_index(input_path):
+                display_filename = display_name(json_file_path)
+                try:
+                    progress.update(task_id, advance=1, filename=f"Checking {display_filename}")
+                    check_json(json_file_path)
+                except Exception as e:
+                    success = False
+                    if stop_on_error:
+                        raise e
+                    else:
+                        progress.console.print(f"\nError checking {json_file_path}:")
+                        progress.console.print(f"  {e}")
+        else:
+            json_file_paths = list_json_files_exclude_index(input_path)
+            errors: Dict[Path, WorkerError] = {}
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(check_json_in_worker, json_file_path): json_file_path
+                    for json_file_path in sorted(
+                        json_file_paths, key=lambda path: path.stat().st_size, reverse=True
+                    )
+                }
+                for future in as_completed(futures):
+                    json_file_path = futures[future]
+                    progress.update(
+                        task_id, advance=1, filename=f"Checked {display_name(json_file_path)}"
+                    )
+                    error = future.result()
+                    if error is None:
+                        continue
+                    success = False
+                    if stop_on_error:
+                        executor.shutdown(cancel_futures=True)
+                        raise Exception(
+                            f"{error.type_name} checking {json_file_path}: {error.message}\n\n"
+                            f"Worker traceback:\n{error.traceback}"
+                        )
+                    errors[json_file_path] = error
+            for json_file_path in json_file_paths:
+                if json_file_path in errors:
                     progress.console.print(f"\nError checking {json_file_path}:")
-                    progress.console.print(f"  {e}")
+                    progress.console.print(f"  {errors[json_file_path].message}")
 
         reward_string = "🦄" if success else "🐢"
         progress.update(
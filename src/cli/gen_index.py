@@ -5,7 +5,7 @@ import datetime
 import json
 import os
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List
 
 import click
 import rich
@@ -18,12 +18,18 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from ethereum_test_tools.common.base_types import HexNumber
+from ethereum_test_tools.common.base_types import Hash, HexNumber
 from ethereum_test_tools.spec.consume.types import IndexFile, TestCaseIndexFile
 from ethereum_test_tools.spec.file.types import Fixtures
 from evm_transition_tool import FixtureFormats
 
-from .hasher import HashableItem
+from .hasher import (
+    HASH_CACHE_FILE_NAME,
+    HashableItem,
+    HashCacheEntry,
+    hash_fixture_files,
+    iter_fixture_files,
+)
 
 # TODO: remove when these tests are ported or fixed within ethereum/tests.
 fixtures_to_skip = set(
@@ -38,17 +44,22 @@ fixtures_to_skip = set(
 )
 
 
+def iter_indexed_fixture_files(start_path: Path) -> Iterator[Path]:
+    """
+    Iterate over the fixture files in the specified directory that are hashed, see
+    `hasher.iter_fixture_files`, excluding tests in "blockchain_tests_hive".
+    """
+    for file in iter_fixture_files(start_path):
+        if "blockchain_tests_hive" not in file.parts:
+            yield file
+
+
 def count_json_files_exclude_index(start_path: Path) -> int:
     """
-    Return the number of json files in the specified directory, excluding
-    index.json files and tests in "blockchain_tests_hive".
+    Return the number of json and binary fixture files in the specified directory,
+    excluding index.json files and tests in "blockchain_tests_hive".
     """
-    json_file_count = sum(
-        1
-        for file in start_path.rglob("*.json")
-        if file.name != "index.json" and "blockchain_tests_hive" not in file.parts
-    )
-    return json_file_count
+    return sum(1 for _ in iter_indexed_fixture_files(start_path))
 
 
 def infer_fixture_format_from_path(file: Path) -> FixtureFormats:
@@ -107,8 +118,20 @@ def infer_fixture_format_from_path(file: Path) -> FixtureFormats:
     expose_value=True,
     help="Force re-generation of the index file, even if it already exists.",
 )
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    default=False,
+    expose_value=True,
+    help=f"Read and write the '{HASH_CACHE_FILE_NAME}' manifest of the fixture file hashes.",
+)
 def generate_fixtures_index_cli(
-    input_dir: str, quiet_mode: bool, force_flag: bool, disable_infer_format: bool
+    input_dir: str,
+    quiet_mode: bool,
+    force_flag: bool,
+    disable_infer_format: bool,
+    use_cache: bool,
 ):
     """
     The CLI wrapper to an index of all the fixtures in the specified directory.
@@ -118,6 +141,7 @@ def generate_fixtures_index_cli(
         quiet_mode=quiet_mode,
         force_flag=force_flag,
         disable_infer_format=disable_infer_format,
+        use_cache=use_cache,
     )
 
 
@@ -126,10 +150,17 @@ def generate_fixtures_index(
     quiet_mode: bool = False,
     force_flag: bool = False,
     disable_infer_format: bool = False,
+    use_cache: bool = False,
 ):
     """
     Generate an index file (index.json) of all the fixtures in the specified
     directory.
+
+    The test cases of the existing index file are reused for the fixture files
+    whose contents didn't change, so only new or modified files are loaded.
+
+    The manifest of the fixture file hashes is only read from and written to the
+    directory if `use_cache` is set.
     """
     total_files = 0
     if not os.path.isdir(input_path):  # caught by click if using via cli
@@ -138,11 +169,18 @@ def generate_fixtures_index(
         total_files = count_json_files_exclude_index(input_path)
 
     output_file = Path(f"{input_path}/index.json")
+    file_entries: Dict[Path, HashCacheEntry] = {}
     try:
-        root_hash = HashableItem.from_folder(folder_path=input_path).hash()
+        file_entries = hash_fixture_files(input_path, use_cache=use_cache)
+        root_hash = HashableItem.from_folder(
+            folder_path=input_path, file_entries=file_entries
+        ).hash()
     except (KeyError, TypeError):
         root_hash = b""  # just regenerate a new index file
 
+    # test cases of the previous index file, reused for the files that didn't change
+    previous_file_hashes: Dict[Path, Hash] = {}
+    previous_test_cases: Dict[Path, List[TestCaseIndexFile]] = {}
     if not force_flag and output_file.exists():
         index_data: IndexFile
         try:
@@ -152,6 +190,10 @@ def generate_fixtures_index(
                 if not quiet_mode:
                     rich.print(f"Index file [bold cyan]{output_file}[/] is up-to-date.")
                 return
+            if index_data.file_hashes is not None:
+                previous_file_hashes = index_data.file_hashes
+                for test_case in index_data.test_cases:
+                    previous_test_cases.setdefault(test_case.json_path, []).append(test_case)
         except Exception as e:
             rich.print(f"Ignoring exception {e}")
             rich.print(f"...generating a new index file [bold cyan]{output_file}[/]")
@@ -176,35 +218,44 @@ def generate_fixtures_index(
         task_id = progress.add_task("[cyan]Processing files...", total=total_files, filename="...")
 
         test_cases: List[TestCaseIndexFile] = []
-        for file in input_path.rglob("*.json"):
-            if file.name == "index.json":
-                continue
-            if "blockchain_tests_hive" in file.parts:
-                continue
+        file_hashes: Dict[Path, Hash] = {}
+        for file in iter_indexed_fixture_files(input_path):
             if any(fixture in str(file) for fixture in fixtures_to_skip):
                 rich.print(f"Skipping '{file}'")
                 continue
 
-            try:
-                fixture_format = None
-                if not disable_infer_format:
-                    fixture_format = infer_fixture_format_from_path(file)
-                fixtures = Fixtures.from_file(file, fixture_format=fixture_format)
-            except Exception as e:
-                rich.print(f"[red]Error loading fixtures from {file}[/red]")
-                raise e
-
             relative_file_path = Path(file).absolute().relative_to(Path(input_path).absolute())
-            for fixture_name, fixture in fixtures.items():
-                test_cases.append(
-                    TestCaseIndexFile(
-                        id=fixture_name,
-                        json_path=relative_file_path,
-                        fixture_hash=fixture.info.get("hash", None),
-                        fork=fixture.get_fork(),
-                        format=fixture.format,
+            file_hash = None
+            if file in file_entries:
+                file_hash = Hash(bytes.fromhex(file_entries[file].file_hash))
+                file_hashes[relative_file_path] = file_hash
+
+            if (
+                file_hash is not None
+                and relative_file_path in previous_file_hashes
+                and previous_file_hashes[relative_file_path] == file_hash
+            ):
+                test_cases.extend(previous_test_cases.get(relative_file_path, []))
+            else:
+                try:
+                    fixture_format = None
+                    if not disable_infer_format:
+                        fixture_format = infer_fixture_format_from_path(file)
+                    fixtures = Fixtures.from_file(file, fixture_format=fixture_format)
+                except Exception as e:
+                    rich.print(f"[red]Error loading fixtures from {file}[/red]")
+                    raise e
+
+                for fixture_name, fixture in fixtures.items():
+                    test_cases.append(
+                        TestCaseIndexFile(
+                            id=fixture_name,
+                            json_path=relative_file_path,
+                            fixture_hash=fixture.info.get("hash", None),
+                            fork=fixture.get_fork(),
+                            format=fixture.format,
+                        )
                     )
-                )
 
             display_filename = file.name
             if len(display_filename) > filename_display_width:
@@ -225,6 +276,7 @@ def generate_fixtures_index(
         root_hash=root_hash,
         created_at=datetime.datetime.now(),
         test_count=len(test_cases),
+        file_hashes=file_hashes,
     )
 
     with open(output_file, "w") as f:
@@ -4,13 +4,41 @@ Simple CLI tool to hash a directory of JSON fixtures.
 
 import hashlib
 import json
-from dataclasses import dataclass, field
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from enum import IntEnum, auto
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import click
 
+from ethereum_test_tools.spec.file.binary import (
+    BINARY_FIXTURES_FILE_EXTENSION,
+    is_binary_fixtures_file,
+    read_binary_fixtures,
+)
+
+HASH_CACHE_FILE_NAME = ".hash_cache"
+"""
+Name of the manifest, written to the hashed folder, that caches the test hashes of each file.
+"""
+HASH_CACHE_VERSION = 1
+POOL_MIN_FILES = 8
+"""
+Minimum number of files to parse for which a pool of worker processes is used.
+"""
+
+INFO_PATTERN = re.compile(rb'"_info"\s*:\s*')
+TOP_LEVEL_KEY_PATTERN = re.compile(rb'\n    ("(?:[^"\\\n]|\\.)*")\s*:\s*(\S)')
+"""
+Matches the keys of the top-level object of a JSON file indented with 4 spaces, i.e., the
+names of the tests in an indented JSON fixture file.
+"""
+
+json_decoder = json.JSONDecoder()
+
 
 class HashableItemType(IntEnum):
     """
@@ -22,6 +50,238 @@ class HashableItemType(IntEnum):
     TEST = auto()
 
 
+def info_test_hash(key: str, info: Any) -> str:
+    """
+    Returns the hash of a test from its '_info' field.
+    """
+    if not isinstance(info, dict):
+        raise TypeError(f"Expected dict, got {type(info)} for '_info' in {key}")
+
+    # EEST uses 'hash'; ethereum/tests use 'generatedTestHash'
+    hash_value = info.get("hash") or info.get("generatedTestHash")
+    if hash_value is None:
+        raise KeyError(f"Expected 'hash' or 'generatedTestHash' in {key}")
+
+    if not isinstance(hash_value, str):
+        raise TypeError(f"Expected hash to be a string in {key}, got {type(hash_value)}")
+    return hash_value
+
+
+def json_data_test_hashes(data: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Returns the hashes of the tests in the decoded contents of a fixture file.
+    """
+    test_hashes: Dict[str, str] = {}
+    for key, item in data.items():
+        if not isinstance(item, dict):
+            raise TypeError(f"Expected dict, got {type(item)} for {key}")
+        if "_info" not in item:
+            raise KeyError(f"Expected '_info' in {key}")
+        test_hashes[key] = info_test_hash(key, item["_info"])
+    return test_hashes
+
+
+def scan_test_hashes(contents: bytes) -> Optional[Dict[str, str]]:
+    """
+    Returns the hashes of the tests in an indented JSON fixture file by only decoding the
+    '_info' field of each test, or None if the file doesn't have the expected layout.
+
+    The '_info' field of each test must be the only one found between the name of the test
+    and the name of the next test; files that don't match are fully decoded instead.
+    """
+    if not re.match(rb"\s*\{", contents):
+        return None
+    key_matches = list(TOP_LEVEL_KEY_PATTERN.finditer(contents))
+    if not key_matches or any(m.group(2) != b"{" for m in key_matches):
+        return None
+    keys = [(m.start(), json.loads(m.group(1))) for m in key_matches]
+    info_positions = [m.end() for m in INFO_PATTERN.finditer(contents)]
+    if len(keys) != len(info_positions):
+        return None
+    next_key_positions = [position for position, _ in keys[1:]] + [len(contents)]
+    test_hashes: Dict[str, str] = {}
+    for (key_position, key), next_key_position, info_position in zip(
+        keys, next_key_positions, info_positions
+    ):
+        if not key_position < info_position < next_key_position or key in test_hashes:
+            return None
+        info, _ = json_decoder.raw_decode(contents[info_position:next_key_position].decode())
+        test_hashes[key] = info_test_hash(key, info)
+    return test_hashes
+
+
+def scan_payload_test_hash(key: str, payload: bytes) -> str:
+    """
+    Returns the hash of a test from its compact JSON payload in a binary fixture file.
+
+    The '_info' field is written last, so it's only decoded from the end of the payload, and
+    the whole payload is only decoded if it's not found there.
+    """
+    info_position = payload.rfind(b'"_info":')
+    if info_position >= 0:
+        try:
+            text = payload[info_position + len(b'"_info":') :].decode()
+            info, end = json_decoder.raw_decode(text)
+            if text[end:] == "}":
+                return info_test_hash(key, info)
+        except ValueError:
+            pass
+    return json_data_test_hashes({key: json.loads(payload)})[key]
+
+
+def hash_fixture_file(file_path: Path) -> Tuple[str, Dict[str, str]]:
+    """
+    Returns the hash of the contents of a JSON or binary fixture file and the hashes of the
+    tests in it.
+    """
+    if is_binary_fixtures_file(file_path):
+        with open(file_path, "rb") as f:
+            file_hash = hashlib.sha256(f.read()).hexdigest()
+        return file_hash, {
+            key: scan_payload_test_hash(key, payload)
+            for key, payload in read_binary_fixtures(file_path).items()
+        }
+    with open(file_path, "rb") as f:
+        contents = f.read()
+    test_hashes = scan_test_hashes(contents)
+    if test_hashes is None:
+        test_hashes = json_data_test_hashes(json.loads(contents))
+    return hashlib.sha256(contents).hexdigest(), test_hashes
+
+
+def iter_fixture_files(folder_path: Path) -> Iterator[Path]:
+    """
+    Iterate over the fixture files in the folder and its sub-folders, as hashed.
+    """
+    for file_path in sorted(folder_path.iterdir()):
+        if file_path.name == "index.json":
+            continue
+        if file_path.is_file() and file_path.suffix in (".json", BINARY_FIXTURES_FILE_EXTENSION):
+            yield file_path
+        elif file_path.is_dir():
+            yield from iter_fixture_files(file_path)
+
+
+@dataclass(kw_only=True)
+class HashCacheEntry:
+    """
+    The cached hashes of a fixture file, valid as long as its size and mtime are unchanged.
+    """
+
+    size: int
+    mtime_ns: int
+    file_hash: str
+    tests: Dict[str, str]
+
+
+@dataclass(kw_only=True)
+class HashCache:
+    """
+    Manifest of the hashes of the fixture files in a folder, indexed by their path relative to
+    the folder, stored in the folder to skip parsing unchanged files.
+    """
+
+    folder_path: Path
+    entries: Dict[str, HashCacheEntry] = field(default_factory=dict)
+
+    @property
+    def file_path(self) -> Path:
+        """
+        The path of the manifest file.
+        """
+        return self.folder_path / HASH_CACHE_FILE_NAME
+
+    @classmethod
+    def load(cls, folder_path: Path) -> "HashCache":
+        """
+        Loads the manifest of the folder, or returns an empty manifest if it doesn't exist or
+        can't be read.
+        """
+        hash_cache = cls(folder_path=folder_path)
+        try:
+            with open(hash_cache.file_path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == HASH_CACHE_VERSION:
+                hash_cache.entries = {
+                    path: HashCacheEntry(**entry) for path, entry in data["files"].items()
+                }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            pass
+        return hash_cache
+
+    def save(self) -> None:
+        """
+        Writes the manifest to the folder, ignoring folders that are not writable.
+        """
+        data = {
+            "version": HASH_CACHE_VERSION,
+            "files": {path: asdict(entry) for path, entry in sorted(self.entries.items())},
+        }
+        temp_file_path = self.file_path.with_name(f"{HASH_CACHE_FILE_NAME}.{os.getpid()}")
+        try:
+            with open(temp_file_path, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_file_path, self.file_path)
+        except OSError:
+            pass
+
+    def get(self, file_path: Path) -> Optional[HashCacheEntry]:
+        """
+        Returns the cached hashes of the file, if the file is unchanged.
+        """
+        entry = self.entries.get(file_path.relative_to(self.folder_path).as_posix())
+        if entry is None:
+            return None
+        stat = file_path.stat()
+        if entry.size != stat.st_size or entry.mtime_ns != stat.st_mtime_ns:
+            return None
+        return entry
+
+    def update(self, file_entries: Dict[Path, HashCacheEntry]) -> bool:
+        """
+        Replaces the cached entries with the entries of the current files of the folder, and
+        returns whether the manifest changed.
+        """
+        entries = {
+            file_path.relative_to(self.folder_path).as_posix(): entry
+            for file_path, entry in file_entries.items()
+        }
+        changed = entries != self.entries
+        self.entries = entries
+        return changed
+
+
+def hash_fixture_files(
+    folder_path: Path, max_workers: Optional[int] = None, use_cache: bool = False
+) -> Dict[Path, HashCacheEntry]:
+    """
+    Returns the hashes of all the fixture files in the folder.
+
+    Unchanged files are read from the manifest of the folder, if enabled, and the remaining
+    files are parsed from a pool of worker processes if there are enough of them. The manifest
+    is only written to the folder if enabled.
+    """
+    hash_cache = HashCache.load(folder_path) if use_cache else HashCache(folder_path=folder_path)
+    file_entries: Dict[Path, Optional[HashCacheEntry]] = {
+        file_path: hash_cache.get(file_path) for file_path in iter_fixture_files(folder_path)
+    }
+    stale_file_paths = [file_path for file_path, entry in file_entries.items() if entry is None]
+    stats = [file_path.stat() for file_path in stale_file_paths]
+    if len(stale_file_paths) >= POOL_MIN_FILES and (max_workers is None or max_workers > 1):
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(hash_fixture_file, stale_file_paths, chunksize=4))
+    else:
+        results = [hash_fixture_file(file_path) for file_path in stale_file_paths]
+    for file_path, stat, (file_hash, tests) in zip(stale_file_paths, stats, results):
+        file_entries[file_path] = HashCacheEntry(
+            size=stat.st_size, mtime_ns=stat.st_mtime_ns, file_hash=file_hash, tests=tests
+        )
+    entries = {file_path: entry for file_path, entry in file_entries.items() if entry is not None}
+    if use_cache and hash_cache.update(entries):
+        hash_cache.save()
+    return entries
+
+
 @dataclass(kw_only=True)
 class HashableItem:
     """
@@ -67,52 +327,71 @@ class HashableItem:
                 item.print(name=key, level=next_level, print_type=print_type)
 
     @classmethod
-    def from_json_file(cls, *, file_path: Path, parents: List[str]) -> "HashableItem":
+    def from_test_hashes(
+        cls, *, test_hashes: Dict[str, str], file_name: str, parents: List[str]
+    ) -> "HashableItem":
         """
-        Create a hashable item from a JSON file.
+        Create a hashable item from the hashes of the tests in a fixture file.
         """
         items = {}
-        with file_path.open("r") as f:
-            data = json.load(f)
-        for key, item in sorted(data.items()):
-            if not isinstance(item, dict):
-                raise TypeError(f"Expected dict, got {type(item)} for {key}")
-            if "_info" not in item:
-                raise KeyError(f"Expected '_info' in {key}")
-
-            # EEST uses 'hash'; ethereum/tests use 'generatedTestHash'
-            hash_value = item["_info"].get("hash") or item["_info"].get("generatedTestHash")
-            if hash_value is None:
-                raise KeyError(f"Expected 'hash' or 'generatedTestHash' in {key}")
-
-            if not isinstance(hash_value, str):
-                raise TypeError(f"Expected hash to be a string in {key}, got {type(hash_value)}")
-
+        for key, hash_value in sorted(test_hashes.items()):
             item_hash_bytes = bytes.fromhex(hash_value[2:])
             items[key] = cls(
                 type=HashableItemType.TEST,
                 root=item_hash_bytes,
-                parents=parents + [file_path.name],
+                parents=parents + [file_name],
             )
         return cls(type=HashableItemType.FILE, items=items, parents=parents)
 
     @classmethod
-    def from_folder(cls, *, folder_path: Path, parents: List[str] = []) -> "HashableItem":
+    def from_json_file(cls, *, file_path: Path, parents: List[str]) -> "HashableItem":
+        """
+        Create a hashable item from a JSON file or a binary fixture file.
+        """
+        _, test_hashes = hash_fixture_file(file_path)
+        return cls.from_test_hashes(
+            test_hashes=test_hashes, file_name=file_path.name, parents=parents
+        )
+
+    @classmethod
+    def from_folder(
+        cls,
+        *,
+        folder_path: Path,
+        parents: List[str] = [],
+        max_workers: Optional[int] = None,
+        use_cache: bool = False,
+        file_entries: Optional[Dict[Path, HashCacheEntry]] = None,
+    ) -> "HashableItem":
         """
         Create a hashable item from a folder.
+
+        The fixture files of the folder are hashed up front, see `hash_fixture_files`, unless
+        their hashes are given.
         """
+        if file_entries is None:
+            file_entries = hash_fixture_files(
+                folder_path, max_workers=max_workers, use_cache=use_cache
+            )
         items = {}
         for file_path in sorted(folder_path.iterdir()):
             if file_path.name == "index.json":
                 continue
-            if file_path.is_file() and file_path.suffix == ".json":
-                item = cls.from_json_file(
-                    file_path=file_path, parents=parents + [folder_path.name]
+            if file_path.is_file() and file_path.suffix in (
+                ".json",
+                BINARY_FIXTURES_FILE_EXTENSION,
+            ):
+                items[file_path.name] = cls.from_test_hashes(
+                    test_hashes=file_entries[file_path].tests,
+                    file_name=file_path.name,
+                    parents=parents + [folder_path.name],
                 )
-                items[file_path.name] = item
             elif file_path.is_dir():
-                item = cls.from_folder(folder_path=file_path, parents=parents + [folder_path.name])
-                items[file_path.name] = item
+                items[file_path.name] = cls.from_folder(
+                    folder_path=file_path,
+                    parents=parents + [folder_path.name],
+                    file_entries=file_entries,
+                )
         return cls(type=HashableItemType.FOLDER, items=items, parents=parents)
 
 
@@ -123,12 +402,31 @@ class HashableItem:
 @click.option("--files", "-f", is_flag=True, help="Print hash of files")
 @click.option("--tests", "-t", is_flag=True, help="Print hash of tests")
 @click.option("--root", "-r", is_flag=True, help="Only print hash of root folder")
-def main(folder_path_str: str, files: bool, tests: bool, root: bool) -> None:
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Number of processes used to parse the changed files. Default: CPU count",
+)
+@click.option(
+    "--cache",
+    is_flag=True,
+    help=f"Read and write the '{HASH_CACHE_FILE_NAME}' manifest in the hashed folder",
+)
+def main(
+    folder_path_str: str,
+    files: bool,
+    tests: bool,
+    root: bool,
+    workers: Optional[int],
+    cache: bool,
+) -> None:
     """
     Hash folders of JSON fixtures and print their hashes.
     """
     folder_path: Path = Path(folder_path_str)
-    item = HashableItem.from_folder(folder_path=folder_path)
+    item = HashableItem.from_folder(folder_path=folder_path, max_workers=workers, use_cache=cache)
 
     if root:
         print(f"0x{item.hash().hex()}")
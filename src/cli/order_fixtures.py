@@ -5,6 +5,7 @@ example: Usage
 
     ```
     order_fixtures -i input_dir -o output_dir
+    order_fixtures -i input_dir --in-place --workers 8
     ```
 
 
@@ -13,11 +14,17 @@ directory. It recursively processes each .json file in the input directory and
 its subdirectories, and sorts lists and dictionaries alphabetically and
 writes the sorted output to .json files to the corresponding locations in the
 output directory.
+
+With --in-place, the files are sorted in the input directory instead, and files
+that are already sorted are left untouched.
 """
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 import click
 
@@ -51,28 +58,93 @@ def recursive_sort(item: Union[Dict[str, Any], List[Any]]) -> Union[Dict[str, An
         return item
 
 
-def order_fixture(input_path: Path, output_path: Path) -> None:
+def is_sorted(item: Any) -> bool:
+    """
+    Checks whether an item is already sorted, i.e., equal to the output of
+    `recursive_sort`, without building a sorted copy of the item.
+
+    Sorting an already sorted list only takes a single pass over it, so the
+    check is linear in the size of the item if it is sorted.
+
+    Args:
+        item: The item to be checked.
+
+    Returns:
+        True if the item is sorted.
+    """
+    if isinstance(item, dict):
+        keys = list(item.keys())
+        return keys == sorted(keys) and all(is_sorted(v) for v in item.values())
+    elif isinstance(item, list):
+        if not all(is_sorted(x) for x in item):
+            return False
+        try:
+            sorted_item = sorted(item)
+        except TypeError:
+            sorted_item = sorted(item, key=str)
+        return all(x is y for x, y in zip(item, sorted_item))
+    else:
+        return True
+
+
+def order_fixture(input_path: Path, output_path: Path, skip_sorted: bool = False) -> bool:
     """
     Sorts a .json fixture.
 
     Reads a .json file from the input path, sorts the .json data and writes it
-    to the output path.
+    to the output path. The data is written to a temporary file that then
+    replaces the output file, so that the input file is left intact if sorting
+    in place fails.
 
     Args:
         input_path: The Path object of the input .json file.
         output_path: The Path object of the output .json file.
+        skip_sorted: Don't write the output file if the data is already sorted.
 
     Returns:
-        None.
+        True if the output file was written.
     """
     with input_path.open("r") as f:
         data = json.load(f)
+    if skip_sorted and is_sorted(data):
+        return False
     data = recursive_sort(data)
-    with output_path.open("w") as f:
-        json.dump(data, f, indent=4)
+    temp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}")
+    try:
+        with temp_path.open("w") as f:
+            json.dump(data, f, indent=4)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def list_fixtures(input_dir: Path, output_dir: Path) -> List[Tuple[Path, Path]]:
+    """
+    Lists the .json files in the input directory and its subdirectories, with
+    the corresponding paths in the output directory, creating the output
+    directories.
+
+    Args:
+        input_dir: The Path object of the input directory.
+        output_dir: The Path object of the output directory.
+
+    Returns:
+        The (input path, output path) pairs of the .json files.
+    """
+    if not output_dir.exists():
+        output_dir.mkdir(parents=True)
+    fixtures: List[Tuple[Path, Path]] = []
+    for child in input_dir.iterdir():
+        if child.is_dir():
+            fixtures += list_fixtures(child, output_dir / child.name)
+        elif child.suffix == ".json":
+            fixtures.append((child, output_dir / child.name))
+    return fixtures
 
 
-def process_directory(input_dir: Path, output_dir: Path):
+def process_directory(input_dir: Path, output_dir: Optional[Path] = None, workers: int = 1) -> int:
     """
     Process a directory.
 
@@ -82,18 +154,26 @@ def process_directory(input_dir: Path, output_dir: Path):
 
     Args:
         input_dir: The Path object of the input directory.
-        output_dir: The Path object of the output directory.
+        output_dir: The Path object of the output directory. If None, the files
+            are sorted in place, and the files that are already sorted are not
+            rewritten.
+        workers: The number of processes used to sort the files.
 
     Returns:
-        None.
+        The number of files written.
     """
-    if not output_dir.exists():
-        output_dir.mkdir(parents=True)
-    for child in input_dir.iterdir():
-        if child.is_dir():
-            process_directory(child, output_dir / child.name)
-        elif child.suffix == ".json":
-            order_fixture(child, output_dir / child.name)
+    skip_sorted = output_dir is None
+    fixtures = list_fixtures(input_dir, input_dir if output_dir is None else output_dir)
+    input_paths = [input_path for input_path, _ in fixtures]
+    output_paths = [output_path for _, output_path in fixtures]
+    if workers > 1 and len(fixtures) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            written = list(
+                executor.map(order_fixture, input_paths, output_paths, repeat(skip_sorted))
+            )
+    else:
+        written = list(map(order_fixture, input_paths, output_paths, repeat(skip_sorted)))
+    return sum(written)
 
 
 @click.command()
@@ -110,16 +190,34 @@ def process_directory(input_dir: Path, output_dir: Path):
     "-o",
     "output_dir",
     type=click.Path(writable=True, file_okay=False, dir_okay=True),
-    required=True,
+    required=False,
     help="The output directory",
 )
-def order_fixtures(input_dir, output_dir):
+@click.option(
+    "--in-place",
+    "in_place",
+    is_flag=True,
+    default=False,
+    help="Sort the files in the input directory, skipping the files that are already sorted",
+)
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes used to sort the files",
+)
+def order_fixtures(input_dir, output_dir, in_place, workers):
     """
     Order json fixture by key recursively from the input directory.
     """
+    if in_place == (output_dir is not None):
+        raise click.UsageError("Exactly one of '--output' and '--in-place' must be specified.")
     input_dir = Path(input_dir)
-    output_dir = Path(output_dir)
-    process_directory(input_dir, output_dir)
+    output_dir = None if in_place else Path(output_dir)
+    process_directory(input_dir, output_dir, workers=workers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+"""
+Common pytest fixtures for the cli tests.
+"""
+
+import shutil
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import pytest
+
+FIXTURES_PATH = (
+    Path(__file__).parents[2] / "ethereum_test_tools" / "tests" / "test_filling" / "fixtures"
+)
+
+CopyFixtureFiles = Callable[..., Path]
+
+
+@pytest.fixture
+def copy_fixture_files(tmp_path: Path) -> CopyFixtureFiles:
+    """
+    Returns a function that copies the fixture files with the given names, or all the fixture
+    files, from `FIXTURES_PATH` into a sub-folder of the temporary folder, and returns the
+    sub-folder.
+    """
+
+    def copy(sub_dir: str, file_names: Optional[Iterable[str]] = None) -> Path:
+        destination = tmp_path / sub_dir
+        destination.mkdir(parents=True, exist_ok=True)
+        if file_names is None:
+            file_names = sorted(file_path.name for file_path in FIXTURES_PATH.glob("*.json"))
+        for file_name in file_names:
+            shutil.copy(FIXTURES_PATH / file_name, destination)
+        return destination
+
+    return copy
@@ -0,0 +1,56 @@
+"""
+Tests for the check_fixtures module and click CLI.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from ethereum_test_tools.spec.base.base_test import HashMismatchException
+
+from ..check_fixtures import check_fixtures
+from .conftest import CopyFixtureFiles
+
+
+@pytest.fixture
+def fixtures_dir(tmp_path: Path, copy_fixture_files: CopyFixtureFiles) -> Path:
+    """
+    A folder of fixture files, two of which have an invalid info hash.
+    """
+    for sub_dir in ["a", "b"]:
+        copy_fixture_files(sub_dir)
+    for file_path in [
+        tmp_path / "a" / "blockchain_london_valid_filled.json",
+        tmp_path / "b" / "chainid_paris_state_test.json",
+    ]:
+        json_data = json.loads(file_path.read_text())
+        next(iter(json_data.values()))["_info"]["hash"] = "0x" + "00" * 32
+        file_path.write_text(json.dumps(json_data, indent=4))
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_check_fixtures_workers(fixtures_dir: Path, workers: int):
+    """
+    Test that checking the fixtures with multiple workers reports the same errors, in the same
+    order, as checking them with a single worker.
+    """
+    runner = CliRunner()
+    serial_result = runner.invoke(check_fixtures, ["-i", str(fixtures_dir), "-q"])
+    assert serial_result.exit_code == 0
+    assert serial_result.output.count("Error checking") == 2
+    result = runner.invoke(check_fixtures, ["-i", str(fixtures_dir), "-q", "-w", str(workers)])
+    assert result.exit_code == 0
+    assert result.output == serial_result.output
+
+    serial_result = runner.invoke(check_fixtures, ["-i", str(fixtures_dir), "-q", "-s"])
+    assert isinstance(serial_result.exception, HashMismatchException)
+    result = runner.invoke(
+        check_fixtures, ["-i", str(fixtures_dir), "-q", "-w", str(workers), "--stop-on-error"]
+    )
+    assert result.exception is not None
+    assert str(result.exception).startswith("HashMismatchException checking ")
+    assert "Worker traceback:\nTraceback" in str(result.exception)
+    assert "raise HashMismatchException(" in str(result.exception)
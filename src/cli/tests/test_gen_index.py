@@ -0,0 +1,104 @@
+"""
+Tests for the gen_index module.
+"""
+
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ethereum_test_tools.spec.consume.types import IndexFile
+from ethereum_test_tools.spec.file.types import Fixtures
+
+from .. import gen_index
+from ..gen_index import generate_fixtures_index
+from ..hasher import HASH_CACHE_FILE_NAME, iter_fixture_files
+from .conftest import CopyFixtureFiles
+
+
+@pytest.fixture
+def fixtures_dir(tmp_path: Path, copy_fixture_files: CopyFixtureFiles) -> Path:
+    """
+    A folder of blockchain, blockchain hive and state test fixture files.
+    """
+    copy_fixture_files(
+        "fixtures/blockchain_tests",
+        ["blockchain_london_valid_filled.json", "chainid_london_blockchain_test.json"],
+    )
+    copy_fixture_files("fixtures/state_tests", ["chainid_paris_state_test.json"])
+    copy_fixture_files(
+        "fixtures/blockchain_tests_hive", ["blockchain_shanghai_valid_filled_hive.json"]
+    )
+    return tmp_path / "fixtures"
+
+
+@pytest.fixture
+def loaded_files(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    """
+    The names of the fixture files loaded while generating the index.
+    """
+    loaded_files: List[str] = []
+    from_file = Fixtures.from_file
+
+    def recording_from_file(file_path: Path, *args, **kwargs):
+        loaded_files.append(file_path.name)
+        return from_file(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(gen_index.Fixtures, "from_file", recording_from_file)
+    return loaded_files
+
+
+def read_index(fixtures_dir: Path) -> IndexFile:  # noqa: D103
+    with open(fixtures_dir / "index.json") as f:
+        return IndexFile(**json.load(f))
+
+
+def test_generate_index_incrementally(
+    fixtures_dir: Path, loaded_files: List[str], copy_fixture_files: CopyFixtureFiles
+):
+    """
+    Test that only the fixture files that changed are loaded when the index is regenerated,
+    and that the index is the same as a fully regenerated index.
+    """
+    generate_fixtures_index(fixtures_dir, quiet_mode=True)
+    assert sorted(loaded_files) == [
+        "blockchain_london_valid_filled.json",
+        "chainid_london_blockchain_test.json",
+        "chainid_paris_state_test.json",
+    ]
+    index = read_index(fixtures_dir)
+    assert index.file_hashes is not None and len(index.file_hashes) == 3
+    assert set(index.file_hashes) == {
+        file.relative_to(fixtures_dir)
+        for file in iter_fixture_files(fixtures_dir)
+        if "blockchain_tests_hive" not in file.parts
+    }
+    assert not (fixtures_dir / HASH_CACHE_FILE_NAME).exists()
+
+    loaded_files.clear()
+    generate_fixtures_index(fixtures_dir, quiet_mode=True)
+    assert loaded_files == []
+
+    changed_file = fixtures_dir / "state_tests" / "chainid_paris_state_test.json"
+    json_data = json.loads(changed_file.read_text())
+    name, fixture = next(iter(json_data.items()))
+    json_data[f"{name}_copy"] = fixture
+    changed_file.write_text(json.dumps(json_data, indent=4))
+    copy_fixture_files("fixtures/state_tests", ["chainid_shanghai_state_test.json"])
+    (fixtures_dir / "blockchain_tests" / "chainid_london_blockchain_test.json").unlink()
+    generate_fixtures_index(fixtures_dir, quiet_mode=True)
+    assert sorted(loaded_files) == [
+        "chainid_paris_state_test.json",
+        "chainid_shanghai_state_test.json",
+    ]
+    incremental_index = read_index(fixtures_dir)
+
+    generate_fixtures_index(fixtures_dir, quiet_mode=True, force_flag=True)
+    full_index = read_index(fixtures_dir)
+    assert incremental_index.root_hash == full_index.root_hash
+    assert incremental_index.file_hashes == full_index.file_hashes
+    assert incremental_index.test_count == full_index.test_count
+    assert sorted(incremental_index.test_cases, key=lambda t: t.id) == sorted(
+        full_index.test_cases, key=lambda t: t.id
+    )
@@ -0,0 +1,147 @@
+"""
+Tests for the hasher module and click CLI.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from ethereum_test_tools.spec.file.types import Fixtures
+
+from ..hasher import (
+    HASH_CACHE_FILE_NAME,
+    HashableItem,
+    HashableItemType,
+    HashCache,
+    hash_fixture_file,
+    json_data_test_hashes,
+    main,
+)
+from .conftest import FIXTURES_PATH, CopyFixtureFiles
+
+
+@pytest.fixture
+def fixtures_dir(tmp_path: Path, copy_fixture_files: CopyFixtureFiles) -> Path:
+    """
+    A folder of fixture files in sub-folders, including a binary fixture file and a compact
+    JSON fixture file.
+    """
+    fixtures_dir = tmp_path / "fixtures"
+    for fixture_file in sorted(FIXTURES_PATH.glob("*.json")):
+        copy_fixture_files(f"fixtures/{fixture_file.name.split('_')[0]}", [fixture_file.name])
+    fixtures = Fixtures.from_file(FIXTURES_PATH / "blockchain_london_valid_filled.json")
+    fixtures.collect_into_file(fixtures_dir / "blockchain" / "binary.bin", binary=True)
+    with open(fixtures_dir / "compact.json", "w") as f:
+        json.dump({name: fixture.json_dict_with_info() for name, fixture in fixtures.items()}, f)
+    (fixtures_dir / "empty").mkdir()
+    return fixtures_dir
+
+
+def reference_root_hash(fixtures_dir: Path) -> bytes:
+    """
+    Hash the folder from fully decoded fixture files, without the manifest.
+    """
+    file_entries = {}
+    for file_path in fixtures_dir.rglob("*"):
+        if file_path.suffix == ".json":
+            with open(file_path) as f:
+                file_entries[file_path] = json_data_test_hashes(json.load(f))
+        elif file_path.suffix == ".bin":
+            fixtures = Fixtures.from_file(file_path)
+            file_entries[file_path] = {
+                name: fixture.hash for name, fixture in fixtures.items()  # type: ignore
+            }
+
+    def folder_item(folder_path: Path, parents):
+        items = {}
+        for path in sorted(folder_path.iterdir()):
+            if path in file_entries:
+                items[path.name] = HashableItem.from_test_hashes(
+                    test_hashes=file_entries[path],
+                    file_name=path.name,
+                    parents=parents + [folder_path.name],
+                )
+            elif path.is_dir():
+                items[path.name] = folder_item(path, parents + [folder_path.name])
+        return HashableItem(type=HashableItemType.FOLDER, items=items)
+
+    return folder_item(fixtures_dir, []).hash()
+
+
+@pytest.mark.parametrize("file_name", sorted(p.name for p in FIXTURES_PATH.glob("*.json")))
+def test_hash_fixture_file(file_name: str):
+    """
+    Test that the test hashes scanned from a fixture file match the fully decoded file.
+    """
+    _, test_hashes = hash_fixture_file(FIXTURES_PATH / file_name)
+    with open(FIXTURES_PATH / file_name) as f:
+        assert test_hashes == json_data_test_hashes(json.load(f))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_hash_folder_with_cache(fixtures_dir: Path, max_workers: int):
+    """
+    Test that the folder hash is the same with and without the manifest, and that the manifest
+    is updated when a file changes.
+    """
+    expected_hash = reference_root_hash(fixtures_dir)
+    assert HashableItem.from_folder(folder_path=fixtures_dir).hash() == expected_hash
+    assert not (fixtures_dir / HASH_CACHE_FILE_NAME).exists()
+
+    item = HashableItem.from_folder(
+        folder_path=fixtures_dir, max_workers=max_workers, use_cache=True
+    )
+    assert item.hash() == expected_hash
+    hash_cache = HashCache.load(fixtures_dir)
+    assert len(hash_cache.entries) == 12
+    assert HashableItem.from_folder(folder_path=fixtures_dir, use_cache=True).hash() == (
+        expected_hash
+    )
+
+    compact_file = fixtures_dir / "compact.json"
+    json_data = json.loads(compact_file.read_text())
+    name = list(json_data)[0]
+    json_data[name]["_info"]["hash"] = "0x" + "00" * 32
+    compact_file.write_text(json.dumps(json_data, indent=4))
+    changed_hash = HashableItem.from_folder(folder_path=fixtures_dir, use_cache=True).hash()
+    assert changed_hash != expected_hash
+    assert changed_hash == reference_root_hash(fixtures_dir)
+    assert HashCache.load(fixtures_dir).entries["compact.json"].tests[name] == "0x" + "00" * 32
+
+    compact_file.unlink()
+    HashableItem.from_folder(folder_path=fixtures_dir, use_cache=True)
+    assert "compact.json" not in HashCache.load(fixtures_dir).entries
+
+
+def test_hash_invalid_fixture_file(fixtures_dir: Path):
+    """
+    Test that fixture files without test hashes are rejected.
+    """
+    with open(fixtures_dir / "invalid.json", "w") as f:
+        json.dump({"test": {"_info": {}}}, f, indent=4)
+    with pytest.raises(KeyError):
+        HashableItem.from_folder(folder_path=fixtures_dir)
+    for json_data in [{"test": []}, {"test": {"_info": {"hash": "0x00"}}, "other": 1}]:
+        with open(fixtures_dir / "invalid.json", "w") as f:
+            json.dump(json_data, f, indent=4)
+        with pytest.raises(TypeError):
+            HashableItem.from_folder(folder_path=fixtures_dir)
+
+
+def test_hasher_cli(fixtures_dir: Path):
+    """
+    Test the root hash printed by the CLI, and that the manifest is only written if requested.
+    """
+    runner = CliRunner()
+    expected_output = f"0x{reference_root_hash(fixtures_dir).hex()}"
+    result = runner.invoke(main, [str(fixtures_dir), "--root"])
+    assert result.exit_code == 0
+    assert result.output.strip() == expected_output
+    assert not (fixtures_dir / HASH_CACHE_FILE_NAME).exists()
+
+    result = runner.invoke(main, [str(fixtures_dir), "--root", "--cache"])
+    assert result.exit_code == 0
+    assert result.output.strip() == expected_output
+    assert (fixtures_dir / HASH_CACHE_FILE_NAME).exists()
@@ -9,7 +9,8 @@ from tempfile import TemporaryDirectory
 import pytest
 from click.testing import CliRunner
 
-from ..order_fixtures import order_fixtures, process_directory
+from .. import order_fixtures as order_fixtures_module
+from ..order_fixtures import is_sorted, order_fixtures, process_directory, recursive_sort
 
 
 def create_temp_json_file(directory, name, content):  # noqa: D103
@@ -92,3 +93,87 @@ def test_input_directory_does_not_exist():
 
         assert result.exit_code != 0
         assert "Error: Invalid value for '--input'" in result.output
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        {},
+        [],
+        0,
+        {"a": [1, 2, 3], "z": 0},
+        {"z": 0, "a": [1, 2, 3]},
+        {"a": [3, 2, 1]},
+        {"a": [{"b": 1, "a": 2}]},
+        {"a": [1, "a", None]},
+        {"a": [None, 1]},
+        [[1, 2], [1, 1]],
+        [{"b": 1}, {"a": 2}],
+    ],
+)
+def test_is_sorted(item):
+    """
+    Test that an item is sorted if, and only if, it is equal to its sorted version.
+    """
+    assert is_sorted(item) == (json.dumps(item) == json.dumps(recursive_sort(item)))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_process_directory_in_place(input_output_dirs, workers: int):
+    """
+    Test that sorting in place only rewrites the files that are not sorted, and that the
+    result does not depend on the number of workers.
+    """
+    input_dir, output_dir = input_output_dirs
+    (input_dir / "sub").mkdir()
+    create_temp_json_file(input_dir, "sorted.json", {"a": [1, 2, 3], "z": 0})
+    create_temp_json_file(input_dir, "unsorted.json", {"z": 0, "a": [3, 2, 1]})
+    create_temp_json_file(input_dir / "sub", "unsorted.json", {"b": [{"d": 1, "c": 2}]})
+
+    assert process_directory(input_dir, output_dir, workers=workers) == 3
+    assert (output_dir / "sub" / "unsorted.json").exists()
+
+    sorted_contents = (input_dir / "sorted.json").read_text()
+    assert process_directory(input_dir, workers=workers) == 2
+    assert (input_dir / "sorted.json").read_text() == sorted_contents
+    for file_path in output_dir.rglob("*.json"):
+        input_path = input_dir / file_path.relative_to(output_dir)
+        assert json.loads(input_path.read_text()) == json.loads(file_path.read_text())
+    assert process_directory(input_dir, workers=workers) == 0
+
+
+def test_process_directory_in_place_failure(input_output_dirs, monkeypatch):
+    """
+    Test that a file that fails to be written in place is left intact.
+    """
+    input_dir, _ = input_output_dirs
+    file_path = create_temp_json_file(input_dir, "unsorted.json", {"z": 0, "a": [3, 2, 1]})
+    contents = file_path.read_text()
+
+    def failing_dump(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(order_fixtures_module.json, "dump", failing_dump)
+    with pytest.raises(OSError, match="disk full"):
+        process_directory(input_dir)
+    assert file_path.read_text() == contents
+    assert [path.name for path in input_dir.iterdir()] == ["unsorted.json"]
+
+
+def test_cli_in_place(input_output_dirs):
+    """
+    Test the CLI interface in place, and that exactly one of the output directory and in place
+    mode must be specified.
+    """
+    runner = CliRunner()
+    input_dir, output_dir = input_output_dirs
+    create_temp_json_file(input_dir, "test.json", {"c": 2, "b": [4, 3, 5]})
+
+    result = runner.invoke(order_fixtures, ["--input", str(input_dir), "--in-place", "-w", "2"])
+    assert result.exit_code == 0
+    assert json.loads((input_dir / "test.json").read_text()) == {"b": [3, 4, 5], "c": 2}
+
+    for args in [[], ["--in-place", "--output", str(output_dir)]]:
+        result = runner.invoke(order_fixtures, ["--input", str(input_dir), *args])
+        assert result.exit_code != 0
+        assert "Exactly one of '--output' and '--in-place'" in result.output
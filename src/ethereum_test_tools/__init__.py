@@ -55,6 +55,7 @@ from .spec import (
     EOFTest,
     EOFTestFiller,
     FixtureCollector,
+    FixtureFileWriter,
     StateTest,
     StateTestFiller,
     TestInfo,
@@ -88,6 +89,7 @@ __all__ = (
     "EOFTest",
     "EOFTestFiller",
     "FixtureCollector",
+    "FixtureFileWriter",
     "Hash",
     "Header",
     "Initcode",
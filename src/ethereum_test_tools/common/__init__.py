@@ -34,7 +34,7 @@ from .helpers import (
     cost_memory_bytes,
     eip_2028_transaction_data_cost,
 )
-from .json import to_json
+from .json import to_json, to_json_bytes
 from .types import (
     EOA,
     AccessList,
@@ -90,4 +90,5 @@ __all__ = (
     "cost_memory_bytes",
     "eip_2028_transaction_data_cost",
     "to_json",
+    "to_json_bytes",
 )
@@ -28,6 +28,8 @@ class ToStringSchema:
     Type converter to add a simple pydantic schema that correctly parses and serializes the type.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def __get_pydantic_core_schema__(
         source_type: Any, handler: GetCoreSchemaHandler
@@ -46,6 +48,8 @@ class Number(int, ToStringSchema):
     Class that helps represent numbers in tests.
     """
 
+    __slots__ = ()
+
     def __new__(cls, input: NumberConvertible | N):
         """
         Creates a new Number object.
@@ -79,6 +83,8 @@ class HexNumber(Number):
     Class that helps represent an hexadecimal numbers in tests.
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """
         Returns the string representation of the number.
@@ -91,6 +97,8 @@ class ZeroPaddedHexNumber(HexNumber):
     Class that helps represent zero padded hexadecimal numbers in tests.
     """
 
+    __slots__ = ()
+
     def hex(self) -> str:
         """
         Returns the hexadecimal representation of the number.
@@ -159,6 +167,8 @@ class FixedSizeHexNumber(int, ToStringSchema):
     length.
     """
 
+    __slots__ = ()
+
     byte_length: ClassVar[int]
     max_value: ClassVar[int]
 
@@ -168,6 +178,7 @@ class FixedSizeHexNumber(int, ToStringSchema):
         """
 
         class Sized(cls):  # type: ignore
+            __slots__ = ()
             byte_length = length
             max_value = 2 ** (8 * length) - 1
 
@@ -209,7 +220,7 @@ class HashInt(FixedSizeHexNumber[32]):  # type: ignore
     Class that helps represent hashes in tests.
     """
 
-    pass
+    __slots__ = ()
 
 
 T = TypeVar("T", bound="FixedSizeBytes")
@@ -2,13 +2,159 @@
 JSON encoding and decoding for Ethereum types.
 """
 
-from typing import Any, Dict
+import json
+from json.encoder import encode_basestring_ascii  # type: ignore
+from typing import Any, Dict, Iterator, List, TextIO, Tuple
 
 from pydantic import BaseModel, RootModel
 
+JSON_WHITESPACE = " \t\n\r"
+
 
 def to_json(input: BaseModel | RootModel) -> Dict[str, Any]:
     """
     Converts a model to its json data representation.
     """
     return input.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+def to_json_bytes(input: BaseModel | RootModel) -> bytes:
+    """
+    Converts a model directly to its JSON encoded representation.
+
+    Equivalent to encoding the output of `to_json`, but serialized by pydantic-core without
+    building the intermediate Python objects.
+    """
+    return input.__pydantic_serializer__.to_json(input, by_alias=True, exclude_none=True)
+
+
+def iter_object_items(fd: TextIO, chunk_size: int = 1 << 20) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally decodes a JSON document whose top level is an object, yielding its
+    (key, value) pairs as soon as each value has been read from the stream.
+
+    Only the value being decoded is kept in memory, so the memory used is bounded by the
+    size of the largest value of the object instead of the size of the document.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def read(size: int) -> None:
+        nonlocal buffer, pos, eof
+        chunk = fd.read(size)
+        if not chunk:
+            eof = True
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    def skip_whitespace() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in JSON_WHITESPACE:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if eof:
+                raise ValueError("unexpected end of JSON stream")
+            read(chunk_size)
+
+    def decode() -> Any:
+        nonlocal pos
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                # A value that ends with the buffer, e.g. a number, might continue in the stream
+                if end < len(buffer) or eof:
+                    pos = end
+                    return value
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            # Read at least as much as is already buffered, so that a large value is decoded
+            # a logarithmic number of times.
+            read(max(chunk_size, len(buffer) - pos))
+
+    if skip_whitespace() != "{":
+        raise ValueError("JSON stream is not an object")
+    pos += 1
+    if skip_whitespace() == "}":
+        return
+    while True:
+        key = decode()
+        if not isinstance(key, str):
+            raise ValueError(f"invalid JSON object key: {key!r}")
+        if skip_whitespace() != ":":
+            raise ValueError(f"expected ':' after JSON object key {key!r}")
+        pos += 1
+        skip_whitespace()
+        yield key, decode()
+        separator = skip_whitespace()
+        pos += 1
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError(f"expected ',' or '}}' after the value of JSON object key {key!r}")
+        skip_whitespace()
+
+
+def dumps_canonical_and_indented(value: Any, level: int = 0) -> Tuple[str, str]:
+    """
+    Encodes the json data into both its canonical encoding, as
+    `json.dumps(value, sort_keys=True, separators=(",", ":"))`, and its indented encoding, as
+    `json.dumps(value, indent=4)`, in a single pass over the data.
+
+    The level is the nesting level of the value, used to indent the lines of the indented
+    encoding of a value that is embedded in an enclosing indented document.
+    """
+    return _dumps_canonical_and_indented(value, "\n" + "    " * level)
+
+
+def _dumps_canonical_and_indented(value: Any, newline: str) -> Tuple[str, str]:
+    value_type = type(value)
+    if value_type is str:
+        encoded = encode_basestring_ascii(value)
+        return encoded, encoded
+    if value_type is dict:
+        if not value:
+            return "{}", "{}"
+        inner_newline = newline + "    "
+        canonical_items: List[Tuple[str, str]] = []
+        indented_items: List[str] = []
+        for key, item in value.items():
+            if type(key) is not str:
+                raise TypeError(f"keys must be str, not {type(key).__name__}")
+            encoded_key = encode_basestring_ascii(key)
+            if type(item) is str:
+                canonical = indented = encode_basestring_ascii(item)
+            else:
+                canonical, indented = _dumps_canonical_and_indented(item, inner_newline)
+            canonical_items.append((key, f"{encoded_key}:{canonical}"))
+            indented_items.append(f"{encoded_key}: {indented}")
+        canonical_items.sort()
+        return (
+            "{" + ",".join([canonical for _, canonical in canonical_items]) + "}",
+            "{" + inner_newline + f",{inner_newline}".join(indented_items) + newline + "}",
+        )
+    if value_type is list:
+        if not value:
+            return "[]", "[]"
+        inner_newline = newline + "    "
+        canonical_elements: List[str] = []
+        indented_elements: List[str] = []
+        for element in value:
+            if type(element) is str:
+                canonical = indented = encode_basestring_ascii(element)
+            else:
+                canonical, indented = _dumps_canonical_and_indented(element, inner_newline)
+            canonical_elements.append(canonical)
+            indented_elements.append(indented)
+        return (
+            "[" + ",".join(canonical_elements) + "]",
+            "[" + inner_newline + f",{inner_newline}".join(indented_elements) + newline + "]",
+        )
+    if isinstance(value, (bool, int, float)) or value is None:
+        encoded = json.dumps(value)
+        return encoded, encoded
+    raise TypeError(f"Object of type {value_type.__name__} is not JSON serializable")
@@ -3,11 +3,14 @@ Useful types for generating Ethereum tests.
 """
 
 import inspect
+import json
+import threading
 from dataclasses import dataclass
 from enum import IntEnum
-from functools import cache, cached_property
+from functools import cache, cached_property, lru_cache
 from itertools import count
 from typing import (
+    Annotated,
     Any,
     ClassVar,
     Dict,
@@ -16,6 +19,7 @@ from typing import (
     List,
     Sequence,
     SupportsBytes,
+    Tuple,
     Type,
     TypeAlias,
     TypeVar,
@@ -25,13 +29,12 @@ from coincurve.keys import PrivateKey, PublicKey
 from ethereum import rlp as eth_rlp
 from ethereum.base_types import U256, Uint
 from ethereum.crypto.hash import keccak256
-from ethereum.frontier.fork_types import Account as FrontierAccount
-from ethereum.frontier.fork_types import Address as FrontierAddress
-from ethereum.frontier.state import State, set_account, set_storage, state_root
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PlainSerializer,
+    PlainValidator,
     PrivateAttr,
     RootModel,
     TypeAdapter,
@@ -59,7 +62,8 @@ from .base_types import (
     ZeroPaddedHexNumber,
 )
 from .constants import TestAddress, TestPrivateKey, TestPrivateKey2
-from .conversions import BytesConvertible, FixedSizeBytesConvertible, NumberConvertible
+from .conversions import BytesConvertible, FixedSizeBytesConvertible, NumberConvertible, to_number
+from .json import to_json_bytes
 
 
 # Sentinel classes
@@ -109,12 +113,50 @@ StorageKeyValueType = HashInt
 StorageKeyValueTypeAdapter = TypeAdapter(StorageKeyValueType)
 
 
-class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
+def to_storage_int(input: StorageKeyValueTypeConvertible | StorageKeyValueType) -> int:
+    """
+    Converts the input to the plain `int` used to store a key or value in `Storage`, with the
+    same conversion and range checks as `StorageKeyValueType`.
+    """
+    i = input if type(input) is int else int(to_number(input))
+    if i < 0:
+        i += StorageKeyValueType.max_value + 1
+        if i <= 0:
+            raise ValueError(f"Value {i} is too small for {StorageKeyValueType.byte_length} bytes")
+    elif i > StorageKeyValueType.max_value:
+        raise ValueError(f"Value {i} is too large for {StorageKeyValueType.byte_length} bytes")
+    return i
+
+
+def storage_int_hex(i: int) -> str:
+    """
+    Returns the hexadecimal representation of a storage key or value, as `StorageKeyValueType`.
+    """
+    if i == 0:
+        return "0x00"
+    hex_str = hex(i)[2:]
+    if len(hex_str) % 2 == 1:
+        return "0x0" + hex_str
+    return "0x" + hex_str
+
+
+StorageInt = Annotated[
+    int,
+    PlainValidator(to_storage_int),
+    PlainSerializer(storage_int_hex, return_type=str, when_used="json-unless-none"),
+]
+"""
+Key or value of a storage as kept by `Storage`: a plain `int`, which is only wrapped as a
+`StorageKeyValueType` when accessed through the methods of `Storage`.
+"""
+
+
+class Storage(RootModel[Dict[StorageInt, StorageInt]]):
     """
     Definition of a storage in pre or post state of a test
     """
 
-    root: Dict[StorageKeyValueType, StorageKeyValueType] = Field(default_factory=dict)
+    root: Dict[StorageInt, StorageInt] = Field(default_factory=dict)
 
     _current_slot: Iterator[int] = count(0)
 
@@ -207,13 +249,13 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
 
     def __contains__(self, key: StorageKeyValueTypeConvertible | StorageKeyValueType) -> bool:
         """Checks for an item in the storage"""
-        return StorageKeyValueTypeAdapter.validate_python(key) in self.root
+        return to_storage_int(key) in self.root
 
     def __getitem__(
         self, key: StorageKeyValueTypeConvertible | StorageKeyValueType
     ) -> StorageKeyValueType:
         """Returns an item from the storage"""
-        return self.root[StorageKeyValueTypeAdapter.validate_python(key)]
+        return StorageKeyValueType(self.root[to_storage_int(key)])
 
     def __setitem__(
         self,
@@ -221,17 +263,15 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         value: StorageKeyValueTypeConvertible | StorageKeyValueType,
     ):  # noqa: SC200
         """Sets an item in the storage"""
-        self.root[
-            StorageKeyValueTypeAdapter.validate_python(key)
-        ] = StorageKeyValueTypeAdapter.validate_python(value)
+        self.root[to_storage_int(key)] = to_storage_int(value)
 
     def __delitem__(self, key: StorageKeyValueTypeConvertible | StorageKeyValueType):
         """Deletes an item from the storage"""
-        del self.root[StorageKeyValueTypeAdapter.validate_python(key)]
+        del self.root[to_storage_int(key)]
 
     def __iter__(self):
         """Returns an iterator over the storage"""
-        return iter(self.root)
+        return map(StorageKeyValueType, self.root)
 
     def __eq__(self, other) -> bool:
         """
@@ -255,7 +295,7 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
 
     def keys(self) -> set[StorageKeyValueType]:
         """Returns the keys of the storage"""
-        return set(self.root.keys())
+        return set(map(StorageKeyValueType, self.root))
 
     def store_next(
         self, value: StorageKeyValueTypeConvertible | StorageKeyValueType | bool
@@ -266,9 +306,9 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         Increments the key counter so the next time this function is called,
         the next key is used.
         """
-        slot = StorageKeyValueTypeAdapter.validate_python(next(self._current_slot))
-        self[slot] = StorageKeyValueTypeAdapter.validate_python(value)
-        return slot
+        slot = to_storage_int(next(self._current_slot))
+        self.root[slot] = to_storage_int(value)
+        return StorageKeyValueType(slot)
 
     def contains(self, other: "Storage") -> bool:
         """
@@ -277,10 +317,10 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         Used for comparison with test expected post state and alloc returned
         by the transition tool.
         """
-        for key in other.keys():
-            if key not in self:
+        for key, value in other.root.items():
+            if key not in self.root:
                 return False
-            if self[key] != other[key]:
+            if self.root[key] != value:
                 return False
         return True
 
@@ -292,14 +332,14 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         by the transition tool.
         Raises detailed exception when a difference is found.
         """
-        for key in other.keys():
-            if key not in self:
+        for key, value in other.root.items():
+            if key not in self.root:
                 # storage[key]==0 is equal to missing storage
-                if other[key] != 0:
+                if value != 0:
                     raise Storage.MissingKey(key=key)
-            elif self[key] != other[key]:
+            elif self.root[key] != value:
                 raise Storage.KeyValueMismatch(
-                    address=address, key=key, want=self[key], got=other[key]
+                    address=address, key=key, want=self.root[key], got=value
                 )
 
     def must_be_equal(self, address: Address, other: "Storage | None"):
@@ -309,20 +349,24 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         # Test keys contained in both storage objects
         if other is None:
             other = Storage({})
-        for key in self.keys() & other.keys():
-            if self[key] != other[key]:
+        for key in self.root.keys() & other.root.keys():
+            if self.root[key] != other.root[key]:
                 raise Storage.KeyValueMismatch(
-                    address=address, key=key, want=self[key], got=other[key]
+                    address=address, key=key, want=self.root[key], got=other.root[key]
                 )
 
         # Test keys contained in either one of the storage objects
-        for key in self.keys() ^ other.keys():
-            if key in self:
-                if self[key] != 0:
-                    raise Storage.KeyValueMismatch(address=address, key=key, want=self[key], got=0)
+        for key in self.root.keys() ^ other.root.keys():
+            if key in self.root:
+                if self.root[key] != 0:
+                    raise Storage.KeyValueMismatch(
+                        address=address, key=key, want=self.root[key], got=0
+                    )
 
-            elif other[key] != 0:
-                raise Storage.KeyValueMismatch(address=address, key=key, want=0, got=other[key])
+            elif other.root[key] != 0:
+                raise Storage.KeyValueMismatch(
+                    address=address, key=key, want=0, got=other.root[key]
+                )
 
 
 class Account(CopyValidateModel):
@@ -576,6 +620,54 @@ def contract_address_iterator(
     return iter(Address(start_address + (i * increments)) for i in count())
 
 
+@lru_cache(maxsize=4096)
+def account_trie_leaf(
+    nonce: int, balance: int, code: bytes, storage: Tuple[Tuple[int, int], ...]
+) -> bytes:
+    """
+    Returns the RLP encoded account as stored in the state trie, memoized by the contents of
+    the account so the storage root and code hash of a given account are only computed once.
+    """
+    storage_trie = HexaryTrie(db={})
+    for key, value in storage:
+        if value != 0:
+            storage_trie.set(keccak256(key.to_bytes(32, "big")), eth_rlp.encode(U256(value)))
+    return eth_rlp.encode([Uint(nonce), U256(balance), storage_trie.root_hash, keccak256(code)])
+
+
+class StateTrie:
+    """
+    Secure state trie that is updated in place between state root computations.
+
+    Only the leaves that differ from the previously computed state are written to the trie, so
+    the root of a state that is nearly identical to the previous one, e.g., the same pre-state
+    filled for another fork, only requires re-hashing the modified paths.
+    """
+
+    def __init__(self):
+        self._trie = HexaryTrie(db={}, prune=True)
+        self._leaves: Dict[bytes, bytes] = {}
+        self._lock = threading.Lock()
+
+    def root(self, leaves: Dict[bytes, bytes]) -> bytes:
+        """
+        Returns the root of the trie containing exactly the given leaves, indexed by the hash of
+        their address.
+        """
+        with self._lock:
+            with self._trie.squash_changes() as trie:
+                for key in self._leaves.keys() - leaves.keys():
+                    del trie[key]
+                for key, leaf in leaves.items():
+                    if self._leaves.get(key) != leaf:
+                        trie[key] = leaf
+            self._leaves = leaves
+            return self._trie.root_hash
+
+
+state_trie = StateTrie()
+
+
 class AllocMode(IntEnum):
     """
     Allocation mode for the state.
@@ -597,6 +689,14 @@ class Alloc(RootModel[Dict[Address, Account | None]]):
         default_factory=contract_address_iterator
     )
     _eoa_iterator: Iterator[EOA] = PrivateAttr(default_factory=eoa_iterator)
+    _t8n_accounts: Dict[str, Tuple[Any, bytes, Address, Tuple[Any, ...]]] = PrivateAttr(
+        default_factory=dict
+    )
+    """
+    Accounts applied from the output of the transition tool, indexed by the address as output
+    by the tool: the JSON of the account, its encoded `"address":{...}` entry, its address, and
+    a snapshot of the contents of the account used to detect in-place modifications.
+    """
 
     @dataclass(kw_only=True)
     class UnexpectedAccount(Exception):
@@ -678,6 +778,81 @@ class Alloc(RootModel[Dict[Address, Account | None]]):
             address = Address(address)
         self.root.pop(address, None)
 
+    def _is_t8n_account_unmodified(
+        self, t8n_account: Tuple[Any, bytes, Address, Tuple[Any, ...]]
+    ) -> bool:
+        """
+        Returns True if the account applied from the output of the transition tool was neither
+        replaced nor modified in place since, e.g., via `alloc[address].storage[key] = value`.
+        """
+        account = self.root.get(t8n_account[2])
+        if account is None:
+            return False
+        nonce, balance, code, storage = t8n_account[3]
+        return (
+            account.nonce == nonce
+            and account.balance == balance
+            and account.code == code
+            and account.storage.root == storage
+        )
+
+    def apply_t8n_alloc(self, t8n_alloc: Dict[str, Any]) -> "Alloc":
+        """
+        Returns the allocation output by the transition tool for a state transition that used
+        this allocation as input.
+
+        The output is applied as a delta: the accounts whose JSON is unchanged since the
+        previous output applied to this allocation, and that were not modified since, share the
+        same `Account` object and encoding, and only the other accounts are validated and
+        encoded.
+        """
+        t8n_accounts: Dict[str, Tuple[Any, bytes, Address, Tuple[Any, ...]]] = {}
+        root: Dict[Address, Account | None] = {}
+        for t8n_address, account_json in t8n_alloc.items():
+            t8n_account = self._t8n_accounts.get(t8n_address)
+            if (
+                t8n_account is not None
+                and t8n_account[0] == account_json
+                and self._is_t8n_account_unmodified(t8n_account)
+            ):
+                address = t8n_account[2]
+                root[address] = self.root[address]
+            else:
+                address = Address(t8n_address)
+                account = Account.model_validate(account_json)
+                root[address] = account
+                encoded_account = json.dumps(account_json, separators=(",", ":"))
+                t8n_account = (
+                    account_json,
+                    f'"{t8n_address}":{encoded_account}'.encode(),
+                    address,
+                    (account.nonce, account.balance, account.code, dict(account.storage.root)),
+                )
+            t8n_accounts[t8n_address] = t8n_account
+        alloc = Alloc.model_construct(root=root)
+        alloc._t8n_accounts = t8n_accounts
+        return alloc
+
+    def to_t8n_json_bytes(self) -> bytes:
+        """
+        Returns the JSON encoded allocation used as input of the transition tool.
+
+        The encoding of the accounts applied from the output of the transition tool is
+        re-used, and only the accounts that were added, replaced or modified since are encoded.
+        """
+        if not self._t8n_accounts:
+            return to_json_bytes(self)
+        t8n_accounts = {t8n_account[2]: t8n_account for t8n_account in self._t8n_accounts.values()}
+        encoded_accounts: List[bytes] = []
+        for address, account in self.root.items():
+            t8n_account = t8n_accounts.get(address)
+            if t8n_account is not None and self._is_t8n_account_unmodified(t8n_account):
+                encoded_accounts.append(t8n_account[1])
+            else:
+                encoded_alloc = to_json_bytes(Alloc.model_construct(root={address: account}))
+                encoded_accounts.append(encoded_alloc[1:-1])
+        return b"{" + b",".join(encoded_accounts) + b"}"
+
     def __eq__(self, other) -> bool:
         """
         Returns True if both allocations are equal.
@@ -703,29 +878,25 @@ class Alloc(RootModel[Dict[Address, Account | None]]):
     def state_root(self) -> bytes:
         """
         Returns the state root of the allocation.
+
+        The root is computed by the process-wide `state_trie`, which only updates the accounts
+        that changed since the previous computation.
         """
-        state = State()
+        leaves: Dict[bytes, bytes] = {}
         for address, account in self.root.items():
             if account is None:
                 continue
-            set_account(
-                state=state,
-                address=FrontierAddress(address),
-                account=FrontierAccount(
-                    nonce=Uint(account.nonce) if account.nonce is not None else Uint(0),
-                    balance=(U256(account.balance) if account.balance is not None else U256(0)),
-                    code=account.code if account.code is not None else b"",
+            leaves[keccak256(address)] = account_trie_leaf(
+                int(account.nonce or 0),
+                int(account.balance or 0),
+                bytes(account.code or b""),
+                (
+                    tuple((int(key), int(value)) for key, value in account.storage.root.items())
+                    if account.storage is not None
+                    else ()
                 ),
             )
-            if account.storage is not None:
-                for key, value in account.storage.root.items():
-                    set_storage(
-                        state=state,
-                        address=FrontierAddress(address),
-                        key=Hash(key),
-                        value=U256(value),
-                    )
-        return state_root(state)
+        return state_trie.root(leaves)
 
     def verify_post_alloc(self, got_alloc: "Alloc"):
         """
@@ -14,7 +14,7 @@ from .eof.eof_test import (
     EOFTestFiller,
     EOFTestSpec,
 )
-from .fixture_collector import FixtureCollector, TestInfo
+from .fixture_collector import FixtureCollector, FixtureFileWriter, TestInfo
 from .state.state_test import StateTest, StateTestFiller, StateTestOnly, StateTestSpec
 
 SPEC_TYPES: List[Type[BaseTest]] = [
@@ -39,6 +39,7 @@ __all__ = (
     "EOFTestFiller",
     "EOFTestSpec",
     "FixtureCollector",
+    "FixtureFileWriter",
     "StateTest",
     "StateTestFiller",
     "StateTestOnly",
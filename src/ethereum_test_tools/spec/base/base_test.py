@@ -9,7 +9,7 @@ from functools import cached_property, reduce
 from itertools import count
 from os import path
 from pathlib import Path
-from typing import Any, Callable, ClassVar, Dict, Generator, Iterator, List, Optional
+from typing import Any, Callable, ClassVar, Dict, Generator, Iterator, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -18,6 +18,7 @@ from evm_transition_tool import FixtureFormats, TransitionTool
 
 from ...common import Environment, Transaction, Withdrawal
 from ...common.conversions import to_hex
+from ...common.json import dumps_canonical_and_indented
 from ...common.types import CamelModel, Result
 from ...reference_spec.reference_spec import ReferenceSpec
 
@@ -65,6 +66,35 @@ def verify_result(result: Result, env: Environment):
         assert result.withdrawals_root == to_hex(Withdrawal.list_root(env.withdrawals))
 
 
+def fixture_hash(canonical_json: str) -> str:
+    """
+    Returns the hash of a fixture from the canonical JSON encoding of its JSON representation.
+    """
+    h = hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+    return f"0x{h}"
+
+
+def indented_fixture_json(
+    json_dict: Dict[str, Any], info: Dict[str, str], level: int = 1
+) -> Tuple[str, str]:
+    """
+    Returns the hash of the fixture and the `indent=4` JSON encoding of the fixture with its
+    info field, as written to the fixture files, from a single pass over the JSON
+    representation of the fixture.
+
+    The level is the nesting level of the fixture in the fixture file.
+    """
+    canonical_json, indented_json = dumps_canonical_and_indented(json_dict, level)
+    hash_value = fixture_hash(canonical_json)
+    _, indented_info = dumps_canonical_and_indented({"hash": hash_value, **info}, level + 1)
+    newline = "\n" + "    " * level
+    info_entry = f'{newline}    "_info": {indented_info}{newline}}}'
+    if not json_dict:
+        return hash_value, "{" + info_entry
+    # the info field is the last item of the fixture
+    return hash_value, indented_json[: -len(newline) - 1] + "," + info_entry
+
+
 class BaseFixture(CamelModel):
     """Represents a base Ethereum test fixture of any type."""
 
@@ -83,9 +113,7 @@ class BaseFixture(CamelModel):
         """
         Returns the hash of the fixture.
         """
-        json_str = json.dumps(self.json_dict, sort_keys=True, separators=(",", ":"))
-        h = hashlib.sha256(json_str.encode("utf-8")).hexdigest()
-        return f"0x{h}"
+        return fixture_hash(json.dumps(self.json_dict, sort_keys=True, separators=(",", ":")))
 
     def json_dict_with_info(self, hash_only: bool = False) -> Dict[str, Any]:
         """
@@ -2,6 +2,9 @@
 Ethereum blockchain test spec definition and filler.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
 from pprint import pprint
 from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Tuple, Type
 
@@ -12,8 +15,8 @@ from evm_transition_tool import FixtureFormats, TransitionTool
 
 from ...common import Alloc, EmptyTrieRoot, Environment, Hash, Requests, Transaction, Withdrawal
 from ...common.constants import EmptyOmmersRoot
-from ...common.json import to_json
-from ...common.types import DepositRequest, TransitionToolOutput, WithdrawalRequest
+from ...common.json import to_json_bytes
+from ...common.types import DepositRequest, Result, WithdrawalRequest
 from ..base.base_test import BaseFixture, BaseTest, verify_result, verify_transactions
 from ..debugging import print_traces
 from .types import (
@@ -32,6 +35,31 @@ from .types import (
     InvalidFixtureBlock,
 )
 
+GENESIS_CACHE_SIZE = 256
+"""
+Maximum number of genesis blocks kept in the genesis cache of the process.
+"""
+genesis_cache: OrderedDict[Tuple[Fork, bytes, bytes], Tuple[Alloc, FixtureBlock]] = OrderedDict()
+"""
+Pre-allocations and genesis blocks of the process, indexed by the fork, the hash of the
+JSON-encoded pre-allocation of the test and the JSON-encoded genesis environment.
+"""
+genesis_cache_lock = threading.Lock()
+
+
+def copy_genesis(pre_alloc: Alloc, genesis_block: FixtureBlock) -> Tuple[Alloc, FixtureBlock]:
+    """
+    Returns deep copies of a pre-allocation and its genesis block.
+
+    The accounts are copied one by one because the private attributes of `Alloc` hold
+    generators, which cannot be deep copied.
+    """
+    root = {
+        address: account.model_copy(deep=True) if account is not None else None
+        for address, account in pre_alloc.root.items()
+    }
+    return Alloc.model_construct(root=root), genesis_block.model_copy(deep=True)
+
 
 def environment_from_parent_header(parent: "FixtureHeader") -> "Environment":
     """
@@ -101,6 +129,36 @@ class BlockchainTest(BaseTest):
     ) -> Tuple[Alloc, FixtureBlock]:
         """
         Create a genesis block from the blockchain test definition.
+
+        The genesis is shared by all the tests of the process with the same fork, pre-allocation
+        and genesis environment, e.g., the same test filled for another fixture format. Each call
+        returns deep copies of the cached pre-allocation and genesis block, so they can be
+        modified by the caller.
+        """
+        genesis_key = (
+            fork,
+            hashlib.sha256(to_json_bytes(self.pre)).digest(),
+            to_json_bytes(self.genesis_environment),
+        )
+        with genesis_cache_lock:
+            if genesis_key in genesis_cache:
+                genesis_cache.move_to_end(genesis_key)
+                return copy_genesis(*genesis_cache[genesis_key])
+
+        pre_alloc, genesis_block = self.generate_genesis(fork)
+        with genesis_cache_lock:
+            genesis_cache[genesis_key] = (pre_alloc, genesis_block)
+            if len(genesis_cache) > GENESIS_CACHE_SIZE:
+                genesis_cache.popitem(last=False)
+        return copy_genesis(pre_alloc, genesis_block)
+
+    def generate_genesis(
+        self,
+        fork: Fork,
+    ) -> Tuple[Alloc, FixtureBlock]:
+        """
+        Generate the pre-allocation, including the fork's system contracts, and the genesis
+        block of the test.
         """
         env = self.genesis_environment.set_fork_requirements(fork)
         assert (
@@ -168,6 +226,9 @@ class BlockchainTest(BaseTest):
     ) -> Tuple[FixtureHeader, List[Transaction], Requests | None, Alloc, Environment]:
         """
         Generate common block data for both make_fixture and make_hive_fixture.
+
+        The alloc output by the transition tool is applied to the previous alloc as a delta, so
+        only the accounts modified by the block are validated and re-encoded for the next block.
         """
         if block.rlp and block.exception is not None:
             raise Exception(
@@ -192,29 +253,26 @@ class BlockchainTest(BaseTest):
                     + "must be the last transaction in the block"
                 )
 
-        transition_tool_output = TransitionToolOutput(
-            **t8n.evaluate(
-                alloc=to_json(previous_alloc),
-                txs=[to_json(tx) for tx in txs],
-                env=to_json(env),
-                fork_name=fork.transition_tool_name(
-                    block_number=env.number, timestamp=env.timestamp
-                ),
-                chain_id=self.chain_id,
-                reward=fork.get_reward(env.number, env.timestamp),
-                eips=eips,
-                debug_output_path=self.get_next_transition_tool_output_path(),
-            )
+        transition_tool_output = t8n.evaluate(
+            alloc=previous_alloc.to_t8n_json_bytes(),
+            txs=b"[" + b",".join(to_json_bytes(tx) for tx in txs) + b"]",
+            env=to_json_bytes(env),
+            fork_name=fork.transition_tool_name(block_number=env.number, timestamp=env.timestamp),
+            chain_id=self.chain_id,
+            reward=fork.get_reward(env.number, env.timestamp),
+            eips=eips,
+            debug_output_path=self.get_next_transition_tool_output_path(),
         )
+        result = Result.model_validate(transition_tool_output["result"])
 
         try:
-            rejected_txs = verify_transactions(txs, transition_tool_output.result)
-            verify_result(transition_tool_output.result, env)
+            rejected_txs = verify_transactions(txs, result)
+            verify_result(result, env)
         except Exception as e:
             print_traces(t8n.get_traces())
-            pprint(transition_tool_output.result)
+            pprint(result)
             pprint(previous_alloc)
-            pprint(transition_tool_output.alloc)
+            pprint(transition_tool_output["alloc"])
             raise e
 
         if len(rejected_txs) > 0 and block.exception is None:
@@ -237,7 +295,7 @@ class BlockchainTest(BaseTest):
 
         header = FixtureHeader(
             **(
-                transition_tool_output.result.model_dump(
+                result.model_dump(
                     exclude_none=True, exclude={"blob_gas_used", "transactions_trie"}
                 )
                 | env.model_dump(exclude_none=True, exclude={"blob_gas_used"})
@@ -260,10 +318,10 @@ class BlockchainTest(BaseTest):
         requests = None
         if fork.header_requests_required(header.number, header.timestamp):
             requests_list: List[DepositRequest | WithdrawalRequest] = []
-            if transition_tool_output.result.deposit_requests is not None:
-                requests_list += transition_tool_output.result.deposit_requests
-            if transition_tool_output.result.withdrawal_requests is not None:
-                requests_list += transition_tool_output.result.withdrawal_requests
+            if result.deposit_requests is not None:
+                requests_list += result.deposit_requests
+            if result.withdrawal_requests is not None:
+                requests_list += result.withdrawal_requests
             requests = Requests(root=requests_list)
 
         if requests is not None and requests.trie_root != header.requests_root:
@@ -281,7 +339,7 @@ class BlockchainTest(BaseTest):
             header,
             txs,
             requests,
-            transition_tool_output.alloc,
+            previous_alloc.apply_t8n_alloc(transition_tool_output["alloc"]),
             env,
         )
 
@@ -3,17 +3,16 @@ Defines models for index files and consume test cases.
 """
 
 import datetime
-import json
 from pathlib import Path
-from typing import List, TextIO
+from typing import Dict, List, TextIO
 
 from pydantic import BaseModel, RootModel
 
 from evm_transition_tool import FixtureFormats
 
-from ...common.base_types import HexNumber
+from ...common.base_types import Hash, HexNumber
 from ..blockchain.types import Fixture as BlockchainFixture
-from ..file.types import Fixtures
+from ..file.types import LazyFixtures
 from ..state.types import Fixture as StateFixture
 
 
@@ -67,6 +66,11 @@ class IndexFile(BaseModel):
     created_at: datetime.datetime
     test_count: int
     test_cases: List[TestCaseIndexFile]
+    file_hashes: Dict[Path, Hash] | None = None
+    """
+    The sha256 hash of the contents of each indexed fixture file, used to only re-index the
+    fixture files that changed when the index file is regenerated.
+    """
 
 
 class TestCases(RootModel):
@@ -125,10 +129,12 @@ class TestCases(RootModel):
     def from_stream(cls, fd: TextIO) -> "TestCases":
         """
         Create a TestCases object from a stream.
+
+        The fixtures are validated one at a time as they are read from the stream, so the JSON
+        document is never loaded as a whole.
         """
-        fixtures = Fixtures.from_json_data(json.load(fd))
         test_cases = []
-        for fixture_name, fixture in fixtures.items():
+        for fixture_name, fixture in LazyFixtures.iter_from_stream(fd):
             if fixture.format == FixtureFormats.BLOCKCHAIN_TEST_HIVE:
                 print("Skipping hive fixture", fixture_name)
             test_cases.append(
@@ -2,12 +2,15 @@
 Test spec debugging tools.
 """
 import pprint
-from typing import Dict, List
 
+from evm_transition_tool import Traces
 
-def print_traces(traces: List[List[List[Dict]]] | None):
+
+def print_traces(traces: Traces | None):
     """
     Print the traces from the transition tool for debugging.
+
+    The traces are read lazily, one step at a time, from the trace files of the transition tool.
     """
     if traces is None:
         print("Traces not collected. Use `--traces` to see detailed execution information.")
@@ -16,8 +19,8 @@ def print_traces(traces: List[List[List[Dict]]] | None):
     pp = pprint.PrettyPrinter(indent=2)
     for block_number, block in enumerate(traces):
         print(f"Block {block_number}:")
-        for tx_number, tx in enumerate(block):
-            print(f"Transaction {tx_number}:")
+        for tx in block:
+            print(f"Transaction {tx.tx_index}:")
             for exec_step, trace in enumerate(tx):
                 print(f"Step {exec_step}:")
                 pp.pprint(trace)
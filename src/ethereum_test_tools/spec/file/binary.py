@@ -0,0 +1,192 @@
+"""
+Binary container for fixture files, an alternative to the indented JSON fixture files that is
+smaller and supports reading a single fixture without decoding the whole file.
+
+Layout of a binary fixture file:
+
+    | magic (8 bytes) | header length (4 bytes, big-endian) | header | payloads |
+
+The header is the compact JSON encoding of the index of the fixtures in the file, a list of
+`[name, offset, length]` entries, where the offset of each payload is relative to the end of the
+header. Each payload is the compact JSON encoding of a single fixture, as it would appear in a
+JSON fixture file, and can be decoded independently of the other fixtures in the file.
+
+In compressed binary fixture files, marked by their own magic bytes, each payload is compressed
+separately with zlib, so that a single fixture can still be read without decompressing the
+whole file.
+"""
+
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Tuple
+
+BINARY_FIXTURES_MAGIC = b"EESTFIX\x01"
+"""
+Magic bytes at the start of every binary fixture file, including the version of the layout.
+"""
+COMPRESSED_BINARY_FIXTURES_MAGIC = b"EESTFIX\x02"
+"""
+Magic bytes at the start of every compressed binary fixture file.
+"""
+BINARY_FIXTURES_FILE_EXTENSION = ".bin"
+"""
+Extension of the binary fixture files, used instead of the extension of the fixture format.
+"""
+HEADER_LENGTH_SIZE = 4
+PREFIX_SIZE = len(BINARY_FIXTURES_MAGIC) + HEADER_LENGTH_SIZE
+
+BinaryFixturesIndex = List[Tuple[str, int, int]]
+
+
+class InvalidBinaryFixturesFile(Exception):
+    """
+    Exception raised when a binary fixture file is malformed.
+    """
+
+    pass
+
+
+def is_binary_fixtures_file(file_path: Path) -> bool:
+    """
+    Returns True if the file is a binary fixture file, compressed or not.
+    """
+    with open(file_path, "rb") as f:
+        return f.read(len(BINARY_FIXTURES_MAGIC)) in (
+            BINARY_FIXTURES_MAGIC,
+            COMPRESSED_BINARY_FIXTURES_MAGIC,
+        )
+
+
+def encode_binary_fixtures(payloads: Dict[str, bytes], compress: bool = False) -> bytes:
+    """
+    Encodes the compact JSON payloads of the fixtures, indexed by fixture name, into the
+    contents of a binary fixture file.
+
+    If compress is set, each payload is compressed separately.
+    """
+    if compress:
+        payloads = {name: zlib.compress(payload) for name, payload in payloads.items()}
+    index: BinaryFixturesIndex = []
+    offset = 0
+    for name, payload in payloads.items():
+        index.append((name, offset, len(payload)))
+        offset += len(payload)
+    header = json.dumps(index, separators=(",", ":")).encode()
+    return b"".join(
+        [
+            COMPRESSED_BINARY_FIXTURES_MAGIC if compress else BINARY_FIXTURES_MAGIC,
+            len(header).to_bytes(HEADER_LENGTH_SIZE, "big"),
+            header,
+            *payloads.values(),
+        ]
+    )
+
+
+def decode_prefix(prefix: bytes) -> Tuple[bool, int]:
+    """
+    Decodes the magic bytes and header length at the start of a binary fixture file, and
+    returns whether the payloads are compressed and the length of the header.
+    """
+    magic = prefix[: len(BINARY_FIXTURES_MAGIC)]
+    if len(prefix) < PREFIX_SIZE or magic not in (
+        BINARY_FIXTURES_MAGIC,
+        COMPRESSED_BINARY_FIXTURES_MAGIC,
+    ):
+        raise InvalidBinaryFixturesFile("missing binary fixture file magic bytes")
+    header_length = int.from_bytes(prefix[len(BINARY_FIXTURES_MAGIC) : PREFIX_SIZE], "big")
+    return magic == COMPRESSED_BINARY_FIXTURES_MAGIC, header_length
+
+
+def decode_payload(payload: bytes, compressed: bool, name: str) -> bytes:
+    """
+    Decompresses the payload of a fixture read from a compressed binary fixture file.
+    """
+    if not compressed:
+        return payload
+    try:
+        return zlib.decompress(payload)
+    except zlib.error as e:
+        raise InvalidBinaryFixturesFile(f"corrupt payload of fixture {name}") from e
+
+
+def check_index(index: BinaryFixturesIndex, payloads_length: int):
+    """
+    Checks that all the payloads in the index are within the payloads of the file.
+    """
+    for name, offset, length in index:
+        if offset + length > payloads_length:
+            raise InvalidBinaryFixturesFile(f"truncated payload of fixture {name}")
+
+
+def decode_binary_fixtures(data: bytes) -> Dict[str, bytes]:
+    """
+    Decodes the contents of a binary fixture file into the compact JSON payloads of the
+    fixtures, indexed by fixture name.
+    """
+    compressed, header_length = decode_prefix(data[:PREFIX_SIZE])
+    payloads_start = PREFIX_SIZE + header_length
+    index: BinaryFixturesIndex = json.loads(data[PREFIX_SIZE:payloads_start])
+    check_index(index, len(data) - payloads_start)
+    return {
+        name: decode_payload(
+            data[payloads_start + offset : payloads_start + offset + length], compressed, name
+        )
+        for name, offset, length in index
+    }
+
+
+class BinaryFixtures(Mapping[str, bytes]):
+    """
+    The compact JSON payloads of the fixtures in a binary fixture file, indexed by fixture name.
+
+    Only the header is read when the file is opened; each payload is read from the file, and
+    decompressed if required, when it is accessed.
+    """
+
+    file_path: Path
+    compressed: bool
+    payloads_start: int
+    index: Dict[str, Tuple[int, int]]
+
+    def __init__(self, file_path: Path):  # noqa: D107
+        self.file_path = file_path
+        with open(file_path, "rb") as f:
+            self.compressed, header_length = decode_prefix(f.read(PREFIX_SIZE))
+            header = f.read(header_length)
+        if len(header) != header_length:
+            raise InvalidBinaryFixturesFile("truncated binary fixture file header")
+        self.payloads_start = PREFIX_SIZE + header_length
+        index: BinaryFixturesIndex = json.loads(header)
+        check_index(index, os.path.getsize(file_path) - self.payloads_start)
+        self.index = {name: (offset, length) for name, offset, length in index}
+
+    def __getitem__(self, name: str) -> bytes:  # noqa: D105
+        offset, length = self.index[name]
+        with open(self.file_path, "rb") as f:
+            f.seek(self.payloads_start + offset)
+            return decode_payload(f.read(length), self.compressed, name)
+
+    def __iter__(self) -> Iterator[str]:  # noqa: D105
+        return iter(self.index)
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self.index)
+
+
+def write_binary_fixtures(file_path: Path, payloads: Dict[str, bytes], compress: bool = False):
+    """
+    Writes the compact JSON payloads of the fixtures, indexed by fixture name, to a binary
+    fixture file.
+    """
+    with open(file_path, "wb") as f:
+        f.write(encode_binary_fixtures(payloads, compress=compress))
+
+
+def read_binary_fixtures(file_path: Path) -> BinaryFixtures:
+    """
+    Reads the compact JSON payloads of the fixtures, indexed by fixture name, from a binary
+    fixture file.
+    """
+    return BinaryFixtures(file_path)
@@ -3,15 +3,18 @@ Defines models for interacting with JSON fixture files.
 """
 import json
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Iterator, Literal, Mapping, Optional, TextIO, Tuple, Type
 
-from pydantic import RootModel
+from pydantic import RootModel, TypeAdapter
 
 from evm_transition_tool import FixtureFormats
 
+from ...common.json import iter_object_items
+from ..base.base_test import fixture_hash, indented_fixture_json
 from ..blockchain.types import Fixture as BlockchainFixture
 from ..blockchain.types import HiveFixture as BlockchainHiveFixture
 from ..state.types import Fixture as StateFixture
+from .binary import is_binary_fixtures_file, read_binary_fixtures, write_binary_fixtures
 
 FixtureFormatsValues = Literal[
     "blockchain_test_hive", "blockchain_test", "state_test", "unset_test_format"
@@ -20,6 +23,42 @@ FixtureFormatsValues = Literal[
 FixtureModel = BlockchainFixture | BlockchainHiveFixture | StateFixture
 
 
+JsonFixture = Tuple[Dict[str, Any], Dict[str, str]]
+"""
+The JSON representation of a fixture, without the info field, and its info field.
+"""
+
+
+def write_fixtures_file(
+    file_path: Path,
+    json_fixtures: Dict[str, JsonFixture],
+    binary: bool = False,
+    compress: bool = False,
+):
+    """
+    Writes the JSON representation of the fixtures, with their hash added to their info field,
+    to an indented JSON fixture file or, if binary is set, to a binary fixture file.
+
+    Only takes plain json data, so that it can be used from a worker process.
+    """
+    if binary:
+        payloads: Dict[str, bytes] = {}
+        for name, (json_dict, info) in json_fixtures.items():
+            canonical_json = json.dumps(json_dict, sort_keys=True, separators=(",", ":"))
+            json_fixture = {**json_dict, "_info": {"hash": fixture_hash(canonical_json), **info}}
+            payloads[name] = json.dumps(json_fixture, separators=(",", ":")).encode()
+        write_binary_fixtures(file_path, payloads, compress=compress)
+        return
+    # equivalent to json.dump(..., indent=4) of the fixtures with their info field, but
+    # the hash and the indented encoding of each fixture are computed in a single pass
+    entries = [
+        f"    {json.dumps(name)}: {indented_fixture_json(json_dict, info)[1]}"
+        for name, (json_dict, info) in json_fixtures.items()
+    ]
+    with open(file_path, "w") as f:
+        f.write("{\n" + ",\n".join(entries) + "\n}" if entries else "{}")
+
+
 class BaseFixturesRootModel(RootModel):
     """
     A base class for defining top-level models that encapsulate multiple test
@@ -58,18 +97,28 @@ class BaseFixturesRootModel(RootModel):
     def items(self):  # noqa: D102
         return self.root.items()
 
-    def collect_into_file(self, file_path: Path):
+    def collect_into_file(self, file_path: Path, binary: bool = False, compress: bool = False):
         """
         For all formats, we join the fixtures as json into a single file.
 
+        If binary is set, the fixtures are instead written as compact json payloads into a
+        binary fixture file, see `binary.py`, and, if compress is also set, each payload is
+        compressed separately.
+
         Note: We don't use pydantic model_dump_json() on the Fixtures object as we
         add the hash to the info field on per-fixture basis.
         """
-        json_fixtures: Dict[str, Dict[str, Any]] = {}
+        write_fixtures_file(file_path, self.json_fixtures(), binary=binary, compress=compress)
+
+    def json_fixtures(self) -> Dict[str, JsonFixture]:
+        """
+        Returns the JSON representation and the info field of each fixture, as taken by
+        `write_fixtures_file`.
+        """
+        json_fixtures: Dict[str, JsonFixture] = {}
         for name, fixture in self.items():
-            json_fixtures[name] = fixture.json_dict_with_info()
-        with open(file_path, "w") as f:
-            json.dump(json_fixtures, f, indent=4)
+            json_fixtures[name] = (fixture.json_dict, fixture.info)
+        return json_fixtures
 
     @classmethod
     def from_file(
@@ -80,9 +129,17 @@ class BaseFixturesRootModel(RootModel):
         """
         Dynamically create a fixture model from the specified json file and,
         optionally, model format.
+
+        Binary fixture files, compressed or not, are detected and read transparently.
         """
-        with open(file_path, "r") as f:
-            json_data = json.load(f)
+        if is_binary_fixtures_file(file_path):
+            json_data = {
+                name: json.loads(payload)
+                for name, payload in read_binary_fixtures(file_path).items()
+            }
+        else:
+            with open(file_path, "r") as f:
+                json_data = json.load(f)
         return cls.from_json_data(json_data, fixture_format)
 
     @classmethod
@@ -100,6 +157,17 @@ class BaseFixturesRootModel(RootModel):
         If json_data only contains fixtures of one model type, specifying the
         fixture_format will provide a speed-up.
         """
+        return cls.model_for_format(fixture_format)(root=json_data)
+
+    @classmethod
+    def model_for_format(
+        cls,
+        fixture_format: Optional[FixtureFormats | FixtureFormatsValues] = None,
+    ) -> Type["BaseFixturesRootModel"]:
+        """
+        Returns the model used to load fixtures of the specified format, or this model if no
+        format is provided.
+        """
         model_mapping = {
             FixtureFormats.BLOCKCHAIN_TEST: BlockchainFixtures,
             FixtureFormats.BLOCKCHAIN_TEST_HIVE: BlockchainHiveFixtures,
@@ -112,11 +180,8 @@ class BaseFixturesRootModel(RootModel):
         if fixture_format not in [None, "unset_test_format", FixtureFormats.UNSET_TEST_FORMAT]:
             if fixture_format not in model_mapping:
                 raise TypeError(f"Unsupported fixture format: {fixture_format}")
-            model_class = model_mapping[fixture_format]
-        else:
-            model_class = cls
-
-        return model_class(root=json_data)
+            return model_mapping[fixture_format]
+        return cls
 
 
 class Fixtures(BaseFixturesRootModel):
@@ -155,3 +220,116 @@ class StateFixtures(BaseFixturesRootModel):
     """
 
     root: Dict[str, StateFixture]
+
+
+class LazyFixtures(Mapping[str, FixtureModel]):
+    """
+    A read-only collection of fixtures, indexed by name, that are only validated the first
+    time they are accessed.
+
+    Used to load fixture files of which only some fixtures are required, e.g., by the consume
+    plugins, without validating the blocks and allocations of all the fixtures in the file.
+    If the fixture format is known, each fixture is validated directly with the model of the
+    format instead of the union of all the fixture models.
+    """
+
+    fixture_models: Dict[Type[BaseFixturesRootModel], Type[FixtureModel]] = {
+        BlockchainFixtures: BlockchainFixture,
+        BlockchainHiveFixtures: BlockchainHiveFixture,
+        StateFixtures: StateFixture,
+    }
+    fixture_model_adapter: TypeAdapter[FixtureModel] = TypeAdapter(FixtureModel)
+
+    def __init__(
+        self,
+        json_data: Mapping[str, Any],
+        fixture_model: Optional[Type[FixtureModel]] = None,
+    ):
+        self._json_data = json_data
+        self._fixture_model = fixture_model
+        self._fixtures: Dict[str, FixtureModel] = {}
+
+    def __getitem__(self, name: str) -> FixtureModel:
+        """
+        Returns the fixture with the given name, validating it on first access.
+        """
+        if name not in self._fixtures:
+            self._fixtures[name] = self.validate_fixture(
+                self._json_data[name], self._fixture_model
+            )
+        return self._fixtures[name]
+
+    def __iter__(self) -> Iterator[str]:  # noqa: D105
+        return iter(self._json_data)
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._json_data)
+
+    @classmethod
+    def validate_fixture(
+        cls, json_data: Any, fixture_model: Optional[Type[FixtureModel]] = None
+    ) -> FixtureModel:
+        """
+        Validates a single fixture with the given model or, if none is given, with the union
+        of all the fixture models.
+
+        The fixture is either decoded json data or, as read from binary fixture files, its
+        compact json encoding.
+        """
+        if isinstance(json_data, bytes):
+            json_data = json.loads(json_data)
+        if fixture_model is not None:
+            return fixture_model.model_validate(json_data)
+        return cls.fixture_model_adapter.validate_python(json_data)
+
+    @classmethod
+    def from_file(
+        cls,
+        file_path: Path,
+        fixture_format: Optional[FixtureFormats | FixtureFormatsValues] = None,
+    ) -> "LazyFixtures":
+        """
+        Create a lazy fixture collection from the specified json file and, optionally, model
+        format.
+
+        Binary fixture files, compressed or not, are detected and read transparently, and each
+        fixture is only read and decoded from its payload when it is first accessed.
+        """
+        json_data: Mapping[str, Any]
+        if is_binary_fixtures_file(file_path):
+            json_data = read_binary_fixtures(file_path)
+        else:
+            with open(file_path, "r") as f:
+                json_data = json.load(f)
+        return cls.from_json_data(json_data, fixture_format)
+
+    @classmethod
+    def from_json_data(
+        cls,
+        json_data: Mapping[str, Any],
+        fixture_format: Optional[FixtureFormats | FixtureFormatsValues] = None,
+    ) -> "LazyFixtures":
+        """
+        Create a lazy fixture collection from the specified json data and, optionally, model
+        format.
+        """
+        model_class = BaseFixturesRootModel.model_for_format(fixture_format)
+        return cls(json_data, cls.fixture_models.get(model_class))
+
+    @classmethod
+    def iter_from_stream(
+        cls,
+        fd: TextIO,
+        fixture_format: Optional[FixtureFormats | FixtureFormatsValues] = None,
+    ) -> Iterator[Tuple[str, FixtureModel]]:
+        """
+        Incrementally reads the fixtures of a json stream, e.g., a very large fixture file or
+        stdin, yielding each (fixture-name, fixture) pair as soon as the fixture is read.
+
+        Only the JSON data of the fixture being read is kept in memory.
+        """
+        fixture_model = cls.fixture_models.get(
+            BaseFixturesRootModel.model_for_format(fixture_format)
+        )
+        for name, json_data in iter_object_items(fd):
+            yield name, cls.validate_fixture(json_data, fixture_model)
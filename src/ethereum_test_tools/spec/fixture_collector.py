@@ -4,18 +4,21 @@ fixtures.
 """
 
 import json
+import multiprocessing
 import os
 import re
 import sys
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Literal, Optional, Tuple
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from evm_transition_tool import FixtureFormats, TransitionTool
 
 from ..common.json import to_json
 from .base.base_test import BaseFixture
-from .file.types import Fixtures
+from .file.binary import BINARY_FIXTURES_FILE_EXTENSION
+from .file.types import Fixtures, JsonFixture, write_fixtures_file
 
 
 def strip_test_prefix(name: str) -> str:
@@ -43,6 +46,123 @@ def get_module_relative_output_dir(test_module: Path, filler_path: Path) -> Path
     return module_path
 
 
+def dump_indented_items(items: List[Tuple[str, Any]]) -> List[str]:
+    """
+    Returns the entries of the items, as they appear in the `indent=4` JSON encoding of an
+    object containing them, without the separators between the entries.
+    """
+    return [
+        f"    {json.dumps(key)}: " + json.dumps(value, indent=4).replace("\n", "\n    ")
+        for key, value in items
+    ]
+
+
+class FixtureFileWriter:
+    """
+    Writes fixture files from a pool of worker processes.
+
+    The fixture files are written in the background, so that the JSON encoding of the
+    fixtures of a module is overlapped with the execution of the tests of the next modules.
+    If no workers are requested, the fixture files are written immediately by the calling
+    process.
+
+    The workers are spawned instead of forked, as the calling process may be running threads,
+    e.g., those of the transition tool servers.
+    """
+
+    executor: Optional[Executor]
+    max_workers: int
+    pending: List[Tuple[Path, Future]]
+
+    def __init__(self, max_workers: int):  # noqa: D107
+        self.max_workers = max_workers
+        self.executor = (
+            ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            if max_workers > 0
+            else None
+        )
+        self.pending = []
+
+    def write(
+        self,
+        file_path: Path,
+        json_fixtures: Dict[str, JsonFixture],
+        binary: bool = False,
+        compress: bool = False,
+    ) -> None:
+        """
+        Writes the JSON representation of the fixtures to a fixture file, see
+        `write_fixtures_file`.
+
+        Raises the first error that occurred while writing the previously submitted fixture
+        files that are already done.
+        """
+        if self.executor is None:
+            write_fixtures_file(file_path, json_fixtures, binary=binary, compress=compress)
+            return
+        self.pending, done = [], self.pending
+        for pending_file_path, future in done:
+            if future.done():
+                self._result(pending_file_path, future)
+            else:
+                self.pending.append((pending_file_path, future))
+        self.pending.append(
+            (
+                file_path,
+                self.executor.submit(
+                    write_fixtures_file, file_path, json_fixtures, binary=binary, compress=compress
+                ),
+            )
+        )
+
+    @staticmethod
+    def _result(file_path: Path, future: Future) -> None:
+        """
+        Raises the error that occurred while writing the fixture file, if any.
+        """
+        try:
+            future.result()
+        except Exception as e:
+            raise Exception(f"Failed writing fixture file {file_path}") from e
+
+    def dumps(self, json_data: Dict[str, Any]) -> str:
+        """
+        Returns the `indent=4` JSON encoding of the object, encoding its items in parallel.
+        """
+        if self.executor is None or not json_data:
+            return json.dumps(json_data, indent=4)
+        items = list(json_data.items())
+        chunk_size = -(-len(items) // self.max_workers)
+        chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+        entries = [
+            entry
+            for chunk_entries in self.executor.map(dump_indented_items, chunks)
+            for entry in chunk_entries
+        ]
+        return "{\n" + ",\n".join(entries) + "\n}"
+
+    def wait(self) -> None:
+        """
+        Waits until all the submitted fixture files have been written, raising the first
+        error that occurred while writing them.
+        """
+        pending, self.pending = self.pending, []
+        for file_path, future in pending:
+            self._result(file_path, future)
+
+    def shutdown(self) -> None:
+        """
+        Waits until all the submitted fixture files have been written and stops the workers.
+        """
+        try:
+            self.wait()
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown()
+
+
 @dataclass(kw_only=True)
 class TestInfo:
     """
@@ -105,6 +225,9 @@ class FixtureCollector:
     single_fixture_per_file: bool
     filler_path: Path
     base_dump_dir: Optional[Path] = None
+    binary_output: bool = False
+    compress_output: bool = False
+    writer: Optional[FixtureFileWriter] = None
 
     # Internal state
     all_fixtures: Dict[Path, Fixtures] = field(default_factory=dict)
@@ -139,7 +262,11 @@ class FixtureCollector:
         fixture_path = (
             self.output_dir
             / fixture.format.output_base_dir_name
-            / fixture_basename.with_suffix(fixture.format.output_file_extension)
+            / fixture_basename.with_suffix(
+                BINARY_FIXTURES_FILE_EXTENSION
+                if self.binary_output
+                else fixture.format.output_file_extension
+            )
         )
         if fixture_path not in self.all_fixtures.keys():  # relevant when we group by test function
             self.all_fixtures[fixture_path] = Fixtures(root={})
@@ -157,19 +284,34 @@ class FixtureCollector:
             combined_fixtures = {
                 k: to_json(v) for fixture in self.all_fixtures.values() for k, v in fixture.items()
             }
-            json.dump(combined_fixtures, sys.stdout, indent=4)
+            if self.writer is None:
+                json.dump(combined_fixtures, sys.stdout, indent=4)
+            else:
+                sys.stdout.write(self.writer.dumps(combined_fixtures))
             return
         os.makedirs(self.output_dir, exist_ok=True)
         for fixture_path, fixtures in self.all_fixtures.items():
             os.makedirs(fixture_path.parent, exist_ok=True)
             if len({fixture.format for fixture in fixtures.values()}) != 1:
                 raise TypeError("All fixtures in a single file must have the same format.")
-            fixtures.collect_into_file(fixture_path)
+            if self.writer is None:
+                fixtures.collect_into_file(
+                    fixture_path, binary=self.binary_output, compress=self.compress_output
+                )
+            else:
+                self.writer.write(
+                    fixture_path,
+                    fixtures.json_fixtures(),
+                    binary=self.binary_output,
+                    compress=self.compress_output,
+                )
 
     def verify_fixture_files(self, evm_fixture_verification: TransitionTool) -> None:
         """
         Runs `evm [state|block]test` on each fixture.
         """
+        if self.writer is not None:
+            self.writer.wait()
         for fixture_path, name_fixture_dict in self.all_fixtures.items():
             for fixture_name, fixture in name_fixture_dict.items():
                 if FixtureFormats.is_verifiable(fixture.format):
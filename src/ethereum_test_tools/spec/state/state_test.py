@@ -9,7 +9,7 @@ from evm_transition_tool import FixtureFormats, TransitionTool
 
 from ...common import Alloc, Environment, Transaction
 from ...common.constants import EngineAPIError
-from ...common.json import to_json
+from ...common.json import to_json_bytes
 from ...common.types import TransitionToolOutput
 from ..base.base_test import BaseFixture, BaseTest
 from ..blockchain.blockchain_test import Block, BlockchainTest
@@ -133,9 +133,9 @@ class StateTest(BaseTest):
         )
         transition_tool_output = TransitionToolOutput(
             **t8n.evaluate(
-                alloc=to_json(pre_alloc),
-                txs=[to_json(tx)],
-                env=to_json(env),
+                alloc=to_json_bytes(pre_alloc),
+                txs=b"[" + to_json_bytes(tx) + b"]",
+                env=to_json_bytes(env),
                 fork_name=fork_name,
                 chain_id=self.chain_id,
                 reward=0,  # Reward on state tests is always zero
@@ -181,6 +181,7 @@ class StateTest(BaseTest):
                 t8n=t8n, fork=fork, fixture_format=fixture_format, eips=eips
             )
         elif fixture_format == FixtureFormats.STATE_TEST:
+            t8n.reset_traces()
             return self.make_state_test_fixture(t8n, fork, eips)
 
         raise Exception(f"Unknown fixture format: {fixture_format}")
@@ -0,0 +1,298 @@
+"""
+Test loading JSON fixture files.
+"""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from evm_transition_tool import FixtureFormats
+
+from ..common.json import dumps_canonical_and_indented, iter_object_items
+from ..spec.blockchain.types import Fixture as BlockchainFixture
+from ..spec.blockchain.types import HiveFixture as BlockchainHiveFixture
+from ..spec.file.binary import (
+    BINARY_FIXTURES_FILE_EXTENSION,
+    InvalidBinaryFixturesFile,
+    decode_binary_fixtures,
+    encode_binary_fixtures,
+    is_binary_fixtures_file,
+    read_binary_fixtures,
+)
+from ..spec.file.types import Fixtures, LazyFixtures
+from ..spec.fixture_collector import FixtureFileWriter
+from ..spec.state.types import Fixture as StateFixture
+
+FIXTURES_PATH = Path(__file__).parent / "test_filling" / "fixtures"
+
+
+@pytest.mark.parametrize(
+    "file_name,fixture_format,fixture_model",
+    [
+        ("blockchain_london_valid_filled.json", None, BlockchainFixture),
+        (
+            "blockchain_london_valid_filled.json",
+            FixtureFormats.BLOCKCHAIN_TEST,
+            BlockchainFixture,
+        ),
+        (
+            "blockchain_shanghai_valid_filled_hive.json",
+            FixtureFormats.BLOCKCHAIN_TEST_HIVE,
+            BlockchainHiveFixture,
+        ),
+        ("chainid_paris_state_test.json", "state_test", StateFixture),
+    ],
+)
+def test_lazy_fixtures(file_name: str, fixture_format, fixture_model):
+    """
+    Test that the lazily loaded fixtures are only validated when accessed, and are equal to
+    the fixtures loaded up front.
+    """
+    fixtures = Fixtures.from_file(FIXTURES_PATH / file_name, fixture_format=fixture_format)
+    lazy_fixtures = LazyFixtures.from_file(
+        FIXTURES_PATH / file_name, fixture_format=fixture_format
+    )
+    assert list(lazy_fixtures) == list(fixtures.keys())
+    assert len(lazy_fixtures) == len(fixtures)
+    assert lazy_fixtures._fixtures == {}
+
+    name = list(fixtures.keys())[-1]
+    fixture = lazy_fixtures[name]
+    assert isinstance(fixture, fixture_model)
+    assert fixture == fixtures[name]
+    assert lazy_fixtures[name] is fixture
+    assert list(lazy_fixtures._fixtures) == [name]
+
+    assert dict(lazy_fixtures.items()) == dict(fixtures.items())
+
+
+def test_lazy_fixtures_invalid_entry(tmp_path: Path):
+    """
+    Test that an invalid fixture only fails when it is accessed.
+    """
+    with open(FIXTURES_PATH / "chainid_paris_state_test.json") as f:
+        json_data = json.load(f)
+    json_data["invalid"] = {"env": {}}
+    lazy_fixtures = LazyFixtures.from_json_data(json_data, FixtureFormats.STATE_TEST)
+    assert len(lazy_fixtures) == 2
+    with pytest.raises(ValueError):
+        lazy_fixtures["invalid"]
+    with pytest.raises(TypeError):
+        LazyFixtures.from_json_data(json_data, "eof_test")  # type: ignore
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+@pytest.mark.parametrize(
+    "json_data",
+    [
+        {},
+        {"a": 1},
+        {"a": 12345, "b": [1, {"c": "}{,:"}], "d": '"\\"', "e": 1.5e3, "f": None, "g": True},
+        {f"fixture_{i}": {"blocks": list(range(i))} for i in range(20)},
+    ],
+)
+@pytest.mark.parametrize("indent", [None, 4])
+def test_iter_object_items(json_data: dict, indent: int | None, chunk_size: int):
+    """
+    Test that the items of a JSON object are incrementally decoded from a stream.
+    """
+    stream = io.StringIO(json.dumps(json_data, indent=indent))
+    assert list(iter_object_items(stream, chunk_size=chunk_size)) == list(json_data.items())
+
+
+@pytest.mark.parametrize(
+    "json_str", ["", "[]", '{"a": 1', '{"a" 1}', '{"a": 1 "b": 2}', '{"a": }', "{1: 2}"]
+)
+def test_iter_object_items_invalid(json_str: str):
+    """
+    Test that invalid JSON streams raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        list(iter_object_items(io.StringIO(json_str), chunk_size=2))
+
+
+def test_fixtures_iter_from_stream():
+    """
+    Test that the fixtures read from a stream are equal to the fixtures loaded from the file.
+    """
+    file_path = FIXTURES_PATH / "blockchain_london_invalid_filled.json"
+    fixtures = Fixtures.from_file(file_path)
+    with open(file_path) as f:
+        assert list(LazyFixtures.iter_from_stream(f)) == list(fixtures.items())
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize(
+    "file_name,fixture_format",
+    [
+        ("blockchain_london_valid_filled.json", FixtureFormats.BLOCKCHAIN_TEST),
+        ("blockchain_shanghai_invalid_filled_hive.json", None),
+        ("chainid_paris_state_test.json", FixtureFormats.STATE_TEST),
+    ],
+)
+def test_binary_fixtures_file(tmp_path: Path, file_name: str, fixture_format, compress: bool):
+    """
+    Test that binary fixture files, compressed or not, are read back transparently as the same
+    fixtures.
+    """
+    fixtures = Fixtures.from_file(FIXTURES_PATH / file_name, fixture_format=fixture_format)
+    json_file_path = tmp_path / file_name
+    binary_file_path = json_file_path.with_suffix(BINARY_FIXTURES_FILE_EXTENSION)
+    fixtures.collect_into_file(json_file_path)
+    fixtures.collect_into_file(binary_file_path, binary=True, compress=compress)
+    assert not is_binary_fixtures_file(json_file_path)
+    assert is_binary_fixtures_file(binary_file_path)
+    assert binary_file_path.stat().st_size < json_file_path.stat().st_size
+
+    binary_fixtures = Fixtures.from_file(binary_file_path, fixture_format=fixture_format)
+    assert binary_fixtures == Fixtures.from_file(json_file_path, fixture_format=fixture_format)
+    assert [fixture.hash for fixture in binary_fixtures.values()] == [
+        fixture.hash for fixture in fixtures.values()
+    ]
+    lazy_fixtures = LazyFixtures.from_file(binary_file_path, fixture_format=fixture_format)
+    assert dict(lazy_fixtures.items()) == dict(binary_fixtures.items())
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_binary_fixtures_invalid(tmp_path: Path, compress: bool):
+    """
+    Test that malformed binary fixture files are rejected.
+    """
+    payloads = {"a": b'{"b":1}', "c": b"{}"}
+    data = encode_binary_fixtures(payloads, compress=compress)
+    assert decode_binary_fixtures(data) == payloads
+    with pytest.raises(InvalidBinaryFixturesFile):
+        decode_binary_fixtures(data[1:])
+    with pytest.raises(InvalidBinaryFixturesFile):
+        decode_binary_fixtures(data[:-1])
+
+    file_path = tmp_path / f"fixtures{BINARY_FIXTURES_FILE_EXTENSION}"
+    file_path.write_bytes(data[:-1])
+    with pytest.raises(InvalidBinaryFixturesFile):
+        read_binary_fixtures(file_path)
+    file_path.write_bytes(data[:8])
+    with pytest.raises(InvalidBinaryFixturesFile):
+        read_binary_fixtures(file_path)
+    if compress:
+        file_path.write_bytes(data[:-2] + b"\x00\x00")
+        binary_fixtures = read_binary_fixtures(file_path)
+        assert binary_fixtures["a"] == payloads["a"]
+        with pytest.raises(InvalidBinaryFixturesFile):
+            binary_fixtures["c"]
+
+
+def test_binary_fixtures_random_access(tmp_path: Path):
+    """
+    Test that single fixtures are read from a compressed binary fixture file without
+    decompressing the other fixtures.
+    """
+    payloads = {
+        f"fixture_{i}": json.dumps({"blocks": [{"number": j} for j in range(10 * i)]}).encode()
+        for i in range(20)
+    }
+    file_path = tmp_path / f"fixtures{BINARY_FIXTURES_FILE_EXTENSION}"
+    file_path.write_bytes(encode_binary_fixtures(payloads, compress=True))
+    assert len(file_path.read_bytes()) < len(encode_binary_fixtures(payloads))
+
+    binary_fixtures = read_binary_fixtures(file_path)
+    assert list(binary_fixtures) == list(payloads)
+    assert binary_fixtures["fixture_7"] == payloads["fixture_7"]
+    assert dict(binary_fixtures.items()) == payloads
+
+
+@pytest.mark.parametrize("max_workers", [0, 1, 3])
+@pytest.mark.parametrize("binary", [False, True])
+def test_fixture_file_writer(tmp_path: Path, max_workers: int, binary: bool):
+    """
+    Test that the fixture files written by the worker processes are identical to the files
+    written by the test process.
+    """
+    writer = FixtureFileWriter(max_workers=max_workers)
+    file_names = [
+        "blockchain_london_valid_filled.json",
+        "blockchain_shanghai_invalid_filled_hive.json",
+        "chainid_paris_state_test.json",
+    ]
+    try:
+        for file_name in file_names:
+            fixtures = Fixtures.from_file(FIXTURES_PATH / file_name)
+            fixtures.collect_into_file(tmp_path / f"expected_{file_name}", binary=binary)
+            writer.write(tmp_path / file_name, fixtures.json_fixtures(), binary=binary)
+        writer.wait()
+
+        json_data = json.loads((FIXTURES_PATH / file_names[0]).read_text())
+        for data in [json_data, {}, {"a": {}, "b": [], "c": {"d": [1, "\n"]}}]:
+            assert writer.dumps(data) == json.dumps(data, indent=4)
+    finally:
+        writer.shutdown()
+    for file_name in file_names:
+        assert (tmp_path / file_name).read_bytes() == (
+            tmp_path / f"expected_{file_name}"
+        ).read_bytes()
+
+
+def test_fixture_file_writer_error(tmp_path: Path):
+    """
+    Test that an error of a worker process is raised with the path of the fixture file, at the
+    latest by the next write once the failed write is done.
+    """
+    writer = FixtureFileWriter(max_workers=1)
+    fixtures = Fixtures.from_file(FIXTURES_PATH / "chainid_paris_state_test.json")
+    file_path = tmp_path / "missing" / "fixtures.json"
+    try:
+        writer.write(file_path, fixtures.json_fixtures())
+        writer.pending[0][1].exception()
+        with pytest.raises(Exception, match=f"Failed writing fixture file {file_path}"):
+            writer.write(tmp_path / "fixtures.json", fixtures.json_fixtures())
+        writer.write(file_path, fixtures.json_fixtures())
+        with pytest.raises(Exception, match=f"Failed writing fixture file {file_path}"):
+            writer.wait()
+    finally:
+        writer.shutdown()
+
+
+@pytest.mark.parametrize(
+    "json_data",
+    [
+        {},
+        [],
+        "",
+        0,
+        {"a": 1},
+        {"b": [], "a": {}, "c": [{}, [[]], None, True, False, -1, 1.5e300, 2**80]},
+        {"z": {"é": '\u20ac\n"\\', "\x00": ["0x00", {"y": "", "x": [1]}]}, "a": "b"},
+    ],
+)
+def test_dumps_canonical_and_indented(json_data):
+    """
+    Test that the canonical and indented encodings match the ones of `json.dumps`, at any
+    nesting level.
+    """
+    canonical, indented = dumps_canonical_and_indented(json_data)
+    assert canonical == json.dumps(json_data, sort_keys=True, separators=(",", ":"))
+    assert indented == json.dumps(json_data, indent=4)
+    _, nested_indented = dumps_canonical_and_indented(json_data, level=2)
+    nested_json = json.dumps({"a": {"b": json_data}}, indent=4)
+    assert nested_json == '{\n    "a": {\n        "b": ' + nested_indented + "\n    }\n}"
+    with pytest.raises(TypeError):
+        dumps_canonical_and_indented({1: json_data})
+    with pytest.raises(TypeError):
+        dumps_canonical_and_indented([b""])
+
+
+@pytest.mark.parametrize("file_name", sorted(p.name for p in FIXTURES_PATH.glob("*.json")))
+def test_collect_into_file_byte_compatible(tmp_path: Path, file_name: str):
+    """
+    Test that the fixture files, and the hashes in them, are identical to the `indent=4` JSON
+    encoding of the fixtures with their info field.
+    """
+    fixtures = Fixtures.from_file(FIXTURES_PATH / file_name)
+    fixtures.collect_into_file(tmp_path / file_name)
+    expected_json = json.dumps(
+        {name: fixture.json_dict_with_info() for name, fixture in fixtures.items()}, indent=4
+    )
+    assert (tmp_path / file_name).read_text() == expected_json
+    Fixtures(root={}).collect_into_file(tmp_path / "empty.json")
+    assert (tmp_path / "empty.json").read_text() == "{}"
@@ -2,11 +2,16 @@
 Test suite for test spec submodules of the `ethereum_test` module.
 """
 
-from typing import Type
+from collections import OrderedDict
+from typing import List, Type
 
 import pytest
 
-from ..common import Account, Alloc
+from ethereum_test_forks import Cancun, Fork, Shanghai
+
+from ..common import Account, Alloc, ZeroPaddedHexNumber
+from ..spec import BlockchainTest
+from ..spec.blockchain import blockchain_test
 
 
 @pytest.fixture()
@@ -113,3 +118,45 @@ def test_verify_post_alloc(
     else:
         with pytest.raises(expected_exception_type) as _:
             post.verify_post_alloc(alloc)
+
+
+def test_make_genesis_cache(monkeypatch):
+    """
+    Test that the genesis of identical blockchain tests is only generated once per fork, and
+    that modifying the returned genesis does not affect the cached one.
+    """
+
+    def make_test(storage_value: int) -> BlockchainTest:
+        pre = Alloc({0x1000: Account(code="0x00", storage={0: storage_value})})
+        return BlockchainTest(pre=pre, post={}, blocks=[])
+
+    generate_genesis = BlockchainTest.generate_genesis
+    generated_forks: List[Fork] = []
+
+    def recording_generate_genesis(self: BlockchainTest, fork: Fork):
+        generated_forks.append(fork)
+        return generate_genesis(self, fork)
+
+    monkeypatch.setattr(BlockchainTest, "generate_genesis", recording_generate_genesis)
+    monkeypatch.setattr(blockchain_test, "genesis_cache", OrderedDict())
+
+    cancun_pre, cancun_genesis = make_test(1).make_genesis(Cancun)
+    expected_pre = cancun_pre.model_dump()
+    expected_genesis = cancun_genesis.model_dump()
+    account = cancun_pre[0x1000]
+    assert account is not None and account.storage is not None
+    account.storage[0] = 2
+    account.nonce = ZeroPaddedHexNumber(5)
+    cancun_pre[0x2000] = Account(balance=1)
+    cancun_genesis.header.gas_limit = ZeroPaddedHexNumber(1)
+
+    cached_pre, cached_genesis = make_test(1).make_genesis(Cancun)
+    assert generated_forks == [Cancun]
+    assert cached_pre.model_dump() == expected_pre
+    assert cached_genesis.model_dump() == expected_genesis
+
+    _, shanghai_genesis = make_test(1).make_genesis(Shanghai)
+    assert shanghai_genesis.header.state_root != cancun_genesis.header.state_root
+
+    _, modified_genesis = make_test(2).make_genesis(Cancun)
+    assert modified_genesis.header.state_root != cancun_genesis.header.state_root
@@ -2,9 +2,14 @@
 Test suite for `ethereum_test` module.
 """
 
+from json import loads
 from typing import Any, Dict, List
 
 import pytest
+from ethereum.base_types import U256, Bytes32, Uint
+from ethereum.frontier.fork_types import Account as FrontierAccount
+from ethereum.frontier.fork_types import Address as FrontierAddress
+from ethereum.frontier.state import State, set_account, set_storage, state_root
 from pydantic import TypeAdapter
 
 from ..common import (
@@ -16,9 +21,17 @@ from ..common import (
     Transaction,
     Withdrawal,
 )
-from ..common.base_types import Address, Bloom, Bytes, Hash, HeaderNonce, ZeroPaddedHexNumber
+from ..common.base_types import (
+    Address,
+    Bloom,
+    Bytes,
+    Hash,
+    HashInt,
+    HeaderNonce,
+    ZeroPaddedHexNumber,
+)
 from ..common.constants import TestAddress, TestAddress2, TestPrivateKey
-from ..common.json import to_json
+from ..common.json import to_json, to_json_bytes
 from ..common.types import Alloc, DepositRequest, Requests
 from ..exceptions import BlockException, TransactionException
 from ..spec.blockchain.types import (
@@ -100,6 +113,14 @@ def test_storage():
         "0x02": ("0x0300"),
     }
 
+    # Keys and values are kept as plain ints, and only wrapped when accessed
+    assert all(type(k) is int and type(v) is int for k, v in s.root.items())
+    assert type(s[0]) is HashInt
+    assert all(type(k) is HashInt for k in s)
+    assert s.model_dump() == {0: 0x100, 1: 0x200, 2: 0x300}
+    with pytest.raises(ValueError):
+        Storage({2**256: 0})
+
 
 @pytest.mark.parametrize(
     ["account"],
@@ -405,6 +426,109 @@ def test_alloc_fund_sender():
     assert alloc[sender_2].balance == 10**18
 
 
+def test_alloc_apply_t8n_alloc():
+    """
+    Test `Alloc.apply_t8n_alloc` functionallity.
+    """
+    account_1 = {"nonce": "0x1", "balance": "0x0a", "code": "0x", "storage": {}}
+    account_2 = {"balance": "0x0b", "code": "0x6000", "storage": {"0x01": "0x02"}}
+    t8n_alloc = {
+        "0x0000000000000000000000000000000000000001": account_1,
+        "0x0000000000000000000000000000000000000002": account_2,
+    }
+    pre = Alloc({0x01: Account(nonce=1, balance=10)})
+    alloc = pre.apply_t8n_alloc(t8n_alloc)
+    assert pre == Alloc({0x01: Account(nonce=1, balance=10)})
+    assert alloc == Alloc.model_validate(t8n_alloc)
+    assert loads(alloc.to_t8n_json_bytes()) == t8n_alloc
+
+    # Unchanged accounts are shared with the previous alloc
+    t8n_alloc = t8n_alloc | {
+        "0x0000000000000000000000000000000000000002": account_2 | {"balance": "0x0c"},
+    }
+    next_alloc = alloc.apply_t8n_alloc(t8n_alloc)
+    assert next_alloc[0x01] is alloc[0x01]
+    assert next_alloc[0x02] is not alloc[0x02]
+    assert next_alloc[0x02].balance == 12
+    assert alloc[0x02].balance == 11
+    assert loads(next_alloc.to_t8n_json_bytes()) == t8n_alloc
+
+    # Accounts modified in place are encoded again, the other accounts are not
+    modified_account = next_alloc[0x02]
+    assert modified_account is not None
+    modified_account.storage[1] = 3
+    t8n_json_bytes = next_alloc.to_t8n_json_bytes()
+    assert Alloc.model_validate_json(t8n_json_bytes) == next_alloc
+    assert b'"0x0000000000000000000000000000000000000001":{"nonce":"0x1"' in t8n_json_bytes
+    assert next_alloc.apply_t8n_alloc(t8n_alloc)[0x02] == Account.model_validate(
+        t8n_alloc["0x0000000000000000000000000000000000000002"]
+    )
+
+    # Replaced, funded, added and deleted accounts are encoded again
+    next_alloc[0x01] = Account(nonce=2)
+    next_alloc.fund_address(Address(0x02), 1)
+    next_alloc[0x03] = Account(balance=1)
+    assert Alloc.model_validate_json(next_alloc.to_t8n_json_bytes()) == next_alloc
+    del next_alloc[0x03]
+    assert Alloc.model_validate_json(next_alloc.to_t8n_json_bytes()) == next_alloc
+    assert next_alloc.apply_t8n_alloc(t8n_alloc)[0x01] == Account(nonce=1, balance=10)
+
+
+def frontier_state_root(alloc: Alloc) -> bytes:
+    """
+    Computes the state root of the allocation with the frontier implementation of the state.
+    """
+    state = State()
+    for address, account in alloc.root.items():
+        if account is None:
+            continue
+        set_account(
+            state=state,
+            address=FrontierAddress(address),
+            account=FrontierAccount(
+                nonce=Uint(account.nonce or 0),
+                balance=U256(account.balance or 0),
+                code=account.code or b"",
+            ),
+        )
+        for key, value in (account.storage or Storage()).root.items():
+            set_storage(
+                state=state,
+                address=FrontierAddress(address),
+                key=Bytes32(Hash(key)),
+                value=U256(value),
+            )
+    return state_root(state)
+
+
+def test_alloc_state_root():
+    """
+    Test that the state root computed from the previous state is the same as the state root
+    computed from scratch, as the accounts of the allocation change.
+    """
+    alloc = Alloc(
+        {
+            0x01: Account(nonce=1, balance=10**18),
+            0x02: Account(code=Op.SSTORE(0, 1), storage={0: 0, 1: 2, 3: 4}),
+            0x03: Account(),
+            0x04: None,
+        }
+    )
+    expected_roots = [frontier_state_root(alloc)]
+    roots = [alloc.state_root()]
+    alloc[0x05] = Account(storage={2**256 - 1: 2**256 - 1})
+    alloc[0x02].storage[1] = 0
+    del alloc[0x03]
+    for _ in range(2):
+        expected_roots.append(frontier_state_root(alloc))
+        roots.append(alloc.state_root())
+    assert Alloc().state_root() == frontier_state_root(Alloc())
+    roots.append(Alloc(alloc.root.copy()).state_root())
+    expected_roots.append(expected_roots[-1])
+    assert roots == expected_roots
+    assert roots[0] != roots[1]
+
+
 @pytest.mark.parametrize(
     ["account_1", "account_2", "expected_account"],
     [
@@ -1515,6 +1639,14 @@ class TestPydanticModelConversion:
         """
         assert to_json(model_instance) == json
 
+    def test_json_bytes_serialization(
+        self, can_be_deserialized: bool, model_instance: Any, json: str | Dict[str, Any]
+    ):
+        """
+        Test that to_json_bytes returns the encoding of the expected JSON for the given object.
+        """
+        assert loads(to_json_bytes(model_instance)) == json
+
     def test_json_deserialization(
         self, can_be_deserialized: bool, model_instance: Any, json: str | Dict[str, Any]
     ):
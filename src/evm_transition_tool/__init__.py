@@ -3,14 +3,18 @@ Library of Python wrappers for the different implementations of transition tools
 """
 
 from .besu import BesuTransitionTool
+from .cache import DEFAULT_CACHE_MAX_SIZE_BYTES, TransitionToolCache
 from .evmone import EvmOneTransitionTool
-from .execution_specs import ExecutionSpecsTransitionTool
+from .execution_specs import ExecutionSpecsInProcessTransitionTool, ExecutionSpecsTransitionTool
 from .geth import GethTransitionTool
+from .metrics import TransitionToolCall, TransitionToolMetrics
 from .nimbus import NimbusTransitionTool
+from .traces import TraceFilter, Traces, TransactionTrace
 from .transition_tool import (
     FixtureFormats,
     TransitionTool,
     TransitionToolNotFoundInPath,
+    TransitionToolServer,
     UnknownTransitionTool,
 )
 
@@ -18,12 +22,21 @@ TransitionTool.set_default_tool(GethTransitionTool)
 
 __all__ = (
     "BesuTransitionTool",
+    "DEFAULT_CACHE_MAX_SIZE_BYTES",
     "EvmOneTransitionTool",
+    "ExecutionSpecsInProcessTransitionTool",
     "ExecutionSpecsTransitionTool",
     "FixtureFormats",
     "GethTransitionTool",
     "NimbusTransitionTool",
+    "TraceFilter",
+    "Traces",
+    "TransactionTrace",
     "TransitionTool",
+    "TransitionToolCache",
+    "TransitionToolCall",
+    "TransitionToolMetrics",
     "TransitionToolNotFoundInPath",
+    "TransitionToolServer",
     "UnknownTransitionTool",
 )
@@ -2,21 +2,16 @@
 Hyperledger Besu Transition tool frontend.
 """
 
-import json
-import os
 import re
 import subprocess
 import tempfile
-import textwrap
 from pathlib import Path
 from re import compile
-from typing import Any, Dict, List, Optional
-
-import requests
+from typing import Optional
 
 from ethereum_test_forks import Fork
 
-from .transition_tool import TransitionTool, dump_files_to_directory
+from .transition_tool import TransitionTool, TransitionToolServer
 
 
 class BesuTransitionTool(TransitionTool):
@@ -27,12 +22,11 @@ class BesuTransitionTool(TransitionTool):
     default_binary = Path("evm")
     detect_binary_pattern = compile(r"^Hyperledger Besu evm .*$")
 
+    t8n_use_server = True
+
     binary: Path
     cached_version: Optional[str] = None
     trace: bool
-    process: Optional[subprocess.Popen] = None
-    server_url: str
-    besu_trace_dir: Optional[tempfile.TemporaryDirectory]
 
     def __init__(
         self,
@@ -49,11 +43,13 @@ class BesuTransitionTool(TransitionTool):
         except Exception as e:
             raise Exception(f"Unexpected exception calling evm tool: {e}.")
         self.help_string = result.stdout
-        self.besu_trace_dir = tempfile.TemporaryDirectory() if self.trace else None
 
-    def start_server(self):
+    def start_server(self) -> TransitionToolServer:
         """
-        Starts the t8n-server process, extracts the port, and leaves it running for future re-use.
+        Starts a t8n-server process, extracts the port, and leaves it running for future re-use.
+
+        Each server listens on its own OS assigned port and writes its traces to its own
+        directory, so that several servers can be used concurrently.
         """
         args = [
             str(self.binary),
@@ -61,138 +57,34 @@ class BesuTransitionTool(TransitionTool):
             "--port=0",  # OS assigned server port
         ]
 
+        trace_dir = None
         if self.trace:
+            trace_dir = tempfile.TemporaryDirectory()
             args.append("--trace")
-            args.append(f"--output.basedir={self.besu_trace_dir.name}")
+            args.append(f"--output.basedir={trace_dir.name}")
 
-        self.process = subprocess.Popen(
+        process = subprocess.Popen(
             args=args,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
         )
 
+        assert process.stdout is not None
         while True:
-            line = str(self.process.stdout.readline())
+            line = process.stdout.readline().decode()
 
             if not line or "Failed to start transition server" in line:
+                process.kill()
+                process.wait()
+                if trace_dir is not None:
+                    trace_dir.cleanup()
                 raise Exception("Failed starting Besu subprocess\n" + line)
-            if "Transition server listening on" in line:
-                port = re.search("Transition server listening on (\\d+)", line).group(1)
-                self.server_url = f"http://localhost:{port}/"
-                break
-
-    def shutdown(self):
-        """
-        Stops the t8n-server process if it was started
-        """
-        if self.process:
-            self.process.kill()
-        if self.besu_trace_dir:
-            self.besu_trace_dir.cleanup()
-
-    def evaluate(
-        self,
-        alloc: Any,
-        txs: Any,
-        env: Any,
-        fork_name: str,
-        chain_id: int = 1,
-        reward: int = 0,
-        eips: Optional[List[int]] = None,
-        debug_output_path: str = "",
-    ) -> Dict[str, Any]:
-        """
-        Executes `evm t8n` with the specified arguments.
-        """
-        if not self.process:
-            self.start_server()
-
-        if eips is not None:
-            fork_name = "+".join([fork_name] + [str(eip) for eip in eips])
-
-        input_json = {
-            "alloc": alloc,
-            "txs": txs,
-            "env": env,
-        }
-        state_json = {
-            "fork": fork_name,
-            "chainid": chain_id,
-            "reward": reward,
-        }
-
-        post_data = {"state": state_json, "input": input_json}
-
-        if debug_output_path:
-            post_data_string = json.dumps(post_data, indent=4)
-            additional_indent = " " * 16  # for pretty indentation in t8n.sh
-            indented_post_data_string = "{\n" + "\n".join(
-                additional_indent + line for line in post_data_string[1:].splitlines()
-            )
-            t8n_script = textwrap.dedent(
-                f"""\
-                #!/bin/bash
-                # Use $1 as t8n-server port if provided, else default to 3000
-                PORT=${{1:-3000}}
-                curl http://localhost:${{PORT}}/ -X POST -H "Content-Type: application/json" \\
-                --data '{indented_post_data_string}'
-                """  # noqa: E221
-            )
-            dump_files_to_directory(
-                debug_output_path,
-                {
-                    "state.json": state_json,
-                    "input/alloc.json": input_json["alloc"],
-                    "input/env.json": input_json["env"],
-                    "input/txs.json": input_json["txs"],
-                    "t8n.sh+x": t8n_script,
-                },
-            )
-
-        response = requests.post(self.server_url, json=post_data, timeout=5)
-        response.raise_for_status()  # exception visible in pytest failure output
-        output = response.json()
-
-        if debug_output_path:
-            dump_files_to_directory(
-                debug_output_path,
-                {
-                    "response.txt": response.text,
-                    "status_code.txt": response.status_code,
-                    "time_elapsed_seconds.txt": response.elapsed.total_seconds(),
-                },
-            )
-
-        if response.status_code != 200:
-            raise Exception(
-                f"t8n-server returned status code {response.status_code}, "
-                f"response: {response.text}"
-            )
-        if not all([x in output for x in ["alloc", "result", "body"]]):
-            raise Exception(
-                "Malformed t8n output: missing 'alloc', 'result' or 'body', server response: "
-                f"{response.text}"
-            )
-
-        if debug_output_path:
-            dump_files_to_directory(
-                debug_output_path,
-                {
-                    "output/alloc.json": output["alloc"],
-                    "output/result.json": output["result"],
-                    "output/txs.rlp": output["body"],
-                },
-            )
-
-        if self.trace and self.besu_trace_dir:
-            self.collect_traces(
-                output["result"]["receipts"], self.besu_trace_dir, debug_output_path
-            )
-            for i, r in enumerate(output["result"]["receipts"]):
-                trace_file_name = f"trace-{i}-{r['transactionHash']}.jsonl"
-                os.remove(os.path.join(self.besu_trace_dir.name, trace_file_name))
-
-        return output
+            if match := re.search("Transition server listening on (\\d+)", line):
+                return TransitionToolServer(
+                    process=process,
+                    url=f"http://localhost:{match.group(1)}/",
+                    trace_dir=trace_dir,
+                )
 
     def is_fork_supported(self, fork: Fork) -> bool:
         """
@@ -0,0 +1,156 @@
+"""
+Content-addressed on-disk cache of transition tool outputs.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from .file_utils import encode_json
+
+DEFAULT_CACHE_MAX_SIZE_BYTES = 1024 * 1024 * 1024  # 1 GiB
+CACHE_FILE_SUFFIX = ".json"
+SIZE_CHECK_FRACTION = 0.01
+"""
+Fraction of the maximum size of the cache that a process writes between two measurements of
+the size of the cache directory.
+"""
+
+
+class TransitionToolCache:
+    """
+    Caches the outputs (`alloc`, `result` and `body`) of transition tool evaluations on disk.
+
+    Each entry is stored in its own file, named after the hash of all the inputs of the
+    evaluation, which makes it safe to share the cache directory between several processes
+    (e.g., pytest-xdist workers). Files are written atomically and the total size of the cache
+    is bounded by evicting the least recently used entries.
+
+    Since the directory is shared, its size is measured from the files themselves, each time the
+    process wrote a fraction of the maximum size of the cache, instead of being tracked by a
+    per-process counter.
+    """
+
+    cache_dir: Path
+    max_size_bytes: int
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        max_size_bytes: int = DEFAULT_CACHE_MAX_SIZE_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self._written_bytes = 0
+        self.evict()
+
+    @staticmethod
+    def key(
+        *,
+        version: str,
+        fork_name: str,
+        chain_id: int,
+        reward: int,
+        alloc: Any,
+        env: Any,
+        txs: Any,
+    ) -> str:
+        """
+        Returns the cache key of a transition tool evaluation.
+
+        The inputs of the tool are hashed in their JSON encoded form, which is used as is if
+        they are passed already encoded.
+        """
+        key_data = {
+            "version": version,
+            "fork_name": fork_name,
+            "chain_id": chain_id,
+            "reward": reward,
+        }
+        key_hash = hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8"))
+        for t8n_input in (alloc, env, txs):
+            key_hash.update(b"\n")
+            key_hash.update(encode_json(t8n_input))
+        return key_hash.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """
+        Returns the path of the file that stores the entry with the given key.
+        """
+        return self.cache_dir / key[:2] / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def _entries(self) -> List[Tuple[Path, float, int]]:
+        """
+        Returns the path, last access time and size of all the entries in the cache.
+        """
+        entries = []
+        for path in self.cache_dir.glob(f"*/*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # removed by another process
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Returns the JSON encoded cached output for the given key, or None if not cached.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                raw_output = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return raw_output
+
+    def put(self, key: str, raw_output: bytes):
+        """
+        Stores the JSON encoded output of an evaluation in the cache.
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            previous_size = path.stat().st_size
+        except FileNotFoundError:
+            previous_size = 0
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw_output)
+        os.replace(temp_path, path)
+        self._written_bytes += len(raw_output) - previous_size
+        if self._written_bytes > self.max_size_bytes * SIZE_CHECK_FRACTION:
+            self.evict()
+
+    def evict(self):
+        """
+        Measures the size of the cache and, if it exceeds the maximum size, removes the least
+        recently used entries until the cache is below 90% of its maximum size.
+        """
+        self._written_bytes = 0
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        size_bytes = sum(size for _, _, size in entries)
+        if size_bytes <= self.max_size_bytes:
+            return
+        target_size = self.max_size_bytes * 0.9
+        for path, _, size in entries:
+            if size_bytes <= target_size:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            size_bytes -= size
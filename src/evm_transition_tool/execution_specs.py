@@ -4,20 +4,54 @@ Ethereum Specs EVM Transition tool interface.
 https://github.com/ethereum/execution-specs
 """
 
+import argparse
+import logging
+import os
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import traceback
+from io import StringIO
+from itertools import count
 from pathlib import Path
 from re import compile
-from typing import Optional
+from typing import List, Optional
+from urllib.parse import quote
+
+import requests
+import requests_unixsocket
 
 from ethereum_test_forks import Constantinople, ConstantinopleFix, Fork
 
 from .geth import GethTransitionTool
-from .transition_tool import FixtureFormats
+from .metrics import add_payload_size, timed
+from .transition_tool import FixtureFormats, TransitionTool, TransitionToolServer
 
 UNSUPPORTED_FORKS = (
     Constantinople,
     ConstantinopleFix,
 )
 
+DAEMON_STARTUP_TIMEOUT_SECONDS = 10
+
+
+def daemon_is_listening(socket_path: str) -> bool:
+    """
+    Returns True if the daemon accepts connections on the unix domain socket.
+
+    The socket file is created before the daemon starts listening on it.
+    """
+    if not os.path.exists(socket_path):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+    return True
+
 
 class ExecutionSpecsTransitionTool(GethTransitionTool):
     """
@@ -87,12 +121,102 @@ class ExecutionSpecsTransitionTool(GethTransitionTool):
             ```
             fill --evm-bin=path/to/venv-execution-specs/ethereum-spec-evm
             ```
+
+    note: Daemon mode:
+
+        If the `ethereum-spec-evm` tool provides the `daemon` subcommand, a single daemon
+        process is started listening on a unix domain socket and it is re-used for all
+        `t8n` requests instead of starting a new Python process per request.
     """
 
     default_binary = Path("ethereum-spec-evm")
     detect_binary_pattern = compile(r"^ethereum-spec-evm\b")
     statetest_subcommand: Optional[str] = None
     blocktest_subcommand: Optional[str] = None
+    server_timeout: int = 60
+    server_dir: Optional[tempfile.TemporaryDirectory] = None
+
+    def __init__(
+        self,
+        *,
+        binary: Optional[Path] = None,
+        trace: bool = False,
+    ):
+        super().__init__(binary=binary, trace=trace)
+        result = subprocess.run(
+            [str(self.binary), "daemon", "--help"], capture_output=True, text=True
+        )
+        self.t8n_use_server = result.returncode == 0
+        self.server_ids = count()
+
+    def start_server(self) -> TransitionToolServer:
+        """
+        Starts an `ethereum-spec-evm daemon` process listening on a unix domain socket and
+        leaves it running for future re-use.
+        """
+        if self.server_dir is None:
+            self.server_dir = tempfile.TemporaryDirectory()
+        server_id = next(self.server_ids)
+        socket_path = os.path.join(self.server_dir.name, f"t8n-{server_id}.sock")
+        log_path = os.path.join(self.server_dir.name, f"daemon-{server_id}.log")
+
+        with open(log_path, "wb") as log_file:
+            process = subprocess.Popen(
+                args=[
+                    str(self.binary),
+                    "daemon",
+                    "--uds",
+                    socket_path,
+                    "--timeout=0",  # the daemon is stopped on shutdown
+                ],
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            )
+
+        start = time.monotonic()
+        while not daemon_is_listening(socket_path):
+            if process.poll() is not None:
+                with open(log_path, "r") as log_file:
+                    raise Exception("Failed starting ethereum-spec-evm daemon\n" + log_file.read())
+            if time.monotonic() - start > DAEMON_STARTUP_TIMEOUT_SECONDS:
+                process.kill()
+                process.wait()
+                raise Exception("Timed out waiting for the ethereum-spec-evm daemon to start")
+            time.sleep(0.01)
+
+        return TransitionToolServer(
+            process=process,
+            url=f"http+unix://{quote(socket_path, safe='')}/",
+        )
+
+    def shutdown(self):
+        """
+        Stops the daemon processes that were started and removes their sockets.
+        """
+        super().shutdown()
+        if self.server_dir is not None:
+            self.server_dir.cleanup()
+            self.server_dir = None
+
+    def create_server_session(self) -> requests.Session:
+        """
+        Returns a session able to send requests over the daemons' unix domain sockets.
+        """
+        return requests_unixsocket.Session()
+
+    def server_curl_command(self) -> str:
+        """
+        Returns the lines used in the debug `t8n.sh` script to send a request to a manually
+        started `ethereum-spec-evm daemon --uds <socket>`.
+        """
+        return "\n".join(
+            [
+                "# Use $1 as the daemon's unix domain socket path if provided",
+                "SOCKET=${1:-/tmp/ethereum-spec-evm.sock}",
+                'curl --unix-socket "${SOCKET}" http://localhost/ -X POST \\',
+                '-H "Content-Type: application/json" \\',
+            ]
+        )
 
     def is_fork_supported(self, fork: Fork) -> bool:
         """
@@ -126,3 +250,106 @@ class ExecutionSpecsTransitionTool(GethTransitionTool):
             "The `verify_fixture()` function is not supported by the ethereum-spec-evm. "
             "Use geth's evm tool."
         )
+
+
+class ExecutionSpecsInProcessTransitionTool(ExecutionSpecsTransitionTool):
+    """
+    Ethereum Specs Transition tool that runs the `t8n` logic of the `ethereum` package within
+    the running Python process, instead of starting an `ethereum-spec-evm` process per call.
+
+    The tool is selected by name, as no binary is required:
+
+    ```console
+        fill --evm-bin=ethereum-spec-evm-in-process
+    ```
+    """
+
+    default_binary = Path("ethereum-spec-evm-in-process")
+    in_process = True
+    t8n_use_server = False
+    t8n_use_stream = True
+
+    # The `t8n` logic of the `ethereum` package uses global state (e.g., the evm trace function)
+    lock = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        binary: Optional[Path] = None,
+        trace: bool = False,
+    ):
+        TransitionTool.__init__(self, binary=binary, trace=trace)
+        from ethereum_spec_tools.evm_tools.t8n import T8N, t8n_arguments
+        from ethereum_spec_tools.evm_tools.utils import get_stream_logger
+
+        # Only the `t8n` subcommand is parsed, the parser of the `ethereum-spec-evm` entry point
+        # runs `git rev-parse HEAD` for its version string each time it is created.
+        self.parser = argparse.ArgumentParser()
+        t8n_arguments(self.parser.add_subparsers(dest="evm_tool"))
+        self.t8n_class = T8N
+        self.logger = get_stream_logger("T8N")
+        self.output_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def detect_binary(cls, binary_output: str) -> bool:
+        """
+        The in-process tool is only selected by name, never by the output of a binary.
+        """
+        return False
+
+    def version(self) -> str:
+        """
+        Return name and version of the `ethereum` package used to state transition.
+        """
+        if self.cached_version is None:
+            from ethereum import __version__
+
+            self.cached_version = f"ethereum-spec-evm {__version__} (in-process)"
+        return self.cached_version
+
+    def shutdown(self):
+        """
+        Removes the output directory of the tool.
+        """
+        super().shutdown()
+        self.output_dir.cleanup()
+
+    def _execute_stream(self, args: List[str], stdin: bytes) -> subprocess.CompletedProcess:
+        """
+        Runs the `t8n` logic of the `ethereum` package within this process.
+
+        The log output of the tool, the message of a `sys.exit` call and the traceback of any
+        unexpected exception are returned as the stderr of the call, as they would be by the
+        `ethereum-spec-evm` process.
+        """
+        if not any(arg.startswith("--output.basedir") for arg in args):
+            # The tool clears its output directory before each run, which defaults to the cwd
+            args = args + [f"--output.basedir={self.output_dir.name}"]
+        add_payload_size("input_bytes", len(stdin))
+        options, _ = self.parser.parse_known_args(args[1:])
+        out_file = StringIO()
+        err_file = StringIO()
+        log_handler = logging.StreamHandler(err_file)
+        log_handler.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+        with self.lock, timed("process_time"):
+            self.logger.addHandler(log_handler)
+            try:
+                t8n = self.t8n_class(options, out_file, StringIO(stdin.decode()))
+                returncode = t8n.run()
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    returncode = e.code or 0
+                else:
+                    err_file.write(f"{e.code}\n")
+                    returncode = 1
+            except Exception:
+                err_file.write(traceback.format_exc())
+                returncode = 1
+            finally:
+                self.logger.removeHandler(log_handler)
+        return subprocess.CompletedProcess(
+            args=args,
+            returncode=returncode,
+            stdout=out_file.getvalue().encode(),
+            stderr=err_file.getvalue().encode(),
+        )
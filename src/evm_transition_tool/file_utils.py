@@ -9,6 +9,16 @@ from json import dump
 from typing import Any, Dict
 
 
+def encode_json(data: Any) -> bytes:
+    """
+    Returns the compact JSON encoding of the data, or the data itself if it is already encoded
+    (i.e., `bytes`).
+    """
+    if isinstance(data, bytes):
+        return data
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
 def write_json_file(data: Dict[str, Any], file_path: str) -> None:
     """
     Write a JSON file to the given path.
@@ -12,6 +12,7 @@ from typing import Optional
 
 from ethereum_test_forks import Fork
 
+from .metrics import record_call, timed
 from .transition_tool import FixtureFormats, TransitionTool, dump_files_to_directory
 
 
@@ -67,6 +68,7 @@ class GethTransitionTool(TransitionTool):
             raise Exception(f"Unexpected exception calling evm tool: {e}.")
         return result.stdout
 
+    @record_call("verify_fixture")
     def verify_fixture(
         self,
         fixture_format: FixtureFormats,
@@ -97,11 +99,12 @@ class GethTransitionTool(TransitionTool):
             command.append(fixture_name)
         command.append(str(fixture_path))
 
-        result = subprocess.run(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        with timed("process_time"):
+            result = subprocess.run(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
 
         if debug_output_path:
             debug_fixture_path = debug_output_path / "fixtures.json"
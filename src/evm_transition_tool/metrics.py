@@ -0,0 +1,241 @@
+"""
+Latency and throughput metrics of the calls made to the transition tools.
+"""
+
+import csv
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from inspect import iscoroutinefunction
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, Optional
+
+CALL_FIELDS = (
+    "wall_time",
+    "process_time",
+    "spawn_time",
+    "encode_time",
+    "decode_time",
+    "input_bytes",
+    "output_bytes",
+)
+METRICS_GROUPS = ("test", "fork", "tool", "method")
+
+MetricsTotals = Dict[str, Dict[str, Dict[str, float]]]
+"""
+Totals of the call fields, and number of calls, per group (e.g., `fork`) and per key of the
+group (e.g., `Cancun`).
+"""
+
+
+@dataclass(kw_only=True)
+class TransitionToolCall:
+    """
+    Timings, in seconds, and payload sizes, in bytes, of a single call to a transition tool.
+    """
+
+    tool: str
+    """
+    Name of the transition tool class.
+    """
+    method: str
+    """
+    Name of the called method, e.g., `evaluate`.
+    """
+    fork: Optional[str] = None
+    """
+    Fork name passed to the tool, if any.
+    """
+    test_id: Optional[str] = None
+    """
+    Node ID of the test that made the call, if any.
+    """
+    wall_time: float = 0
+    """
+    Total time spent in the call.
+    """
+    process_time: float = 0
+    """
+    Time spent waiting for the tool's process or server, including the time to spawn a new
+    process if the tool is executed once per call.
+    """
+    spawn_time: float = 0
+    """
+    Time spent starting long-lived tool processes (e.g., t8n servers) or asyncio subprocesses.
+    """
+    encode_time: float = 0
+    """
+    Time spent encoding the inputs of the tool as JSON.
+    """
+    decode_time: float = 0
+    """
+    Time spent decoding the JSON outputs of the tool.
+    """
+    input_bytes: int = 0
+    """
+    Size of the encoded inputs sent to the tool.
+    """
+    output_bytes: int = 0
+    """
+    Size of the encoded outputs received from the tool.
+    """
+
+
+current_call: ContextVar[Optional[TransitionToolCall]] = ContextVar("current_call", default=None)
+
+
+@contextmanager
+def timed(call_field: str) -> Iterator[None]:
+    """
+    Adds the time spent in the context to the given field of the call being recorded, if any.
+    """
+    call = current_call.get()
+    if call is None:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        setattr(call, call_field, getattr(call, call_field) + perf_counter() - start)
+
+
+def add_payload_size(call_field: str, size: int):
+    """
+    Adds the given payload size to the given field of the call being recorded, if any.
+    """
+    call = current_call.get()
+    if call is not None:
+        setattr(call, call_field, getattr(call, call_field) + size)
+
+
+class TransitionToolMetrics:
+    """
+    Aggregates the metrics of the calls made to transition tools per test, fork, tool and
+    method.
+    """
+
+    test_id: Optional[str]
+    totals: MetricsTotals
+
+    def __init__(self):
+        self.test_id = None
+        self.totals = {group: {} for group in METRICS_GROUPS}
+        self._lock = threading.Lock()
+
+    def add(self, call: TransitionToolCall):
+        """
+        Adds the metrics of a finished call to the totals.
+        """
+        call_keys = {
+            "test": call.test_id,
+            "fork": call.fork,
+            "tool": call.tool,
+            "method": call.method,
+        }
+        with self._lock:
+            for group, key in call_keys.items():
+                if key is None:
+                    continue
+                totals = self.totals[group].setdefault(
+                    key, dict.fromkeys(("calls",) + CALL_FIELDS, 0)
+                )
+                totals["calls"] += 1
+                for call_field in CALL_FIELDS:
+                    totals[call_field] += getattr(call, call_field)
+
+    def merge(self, totals: MetricsTotals):
+        """
+        Adds the totals collected by another process, e.g., a pytest-xdist worker.
+        """
+        with self._lock:
+            for group, group_totals in totals.items():
+                for key, key_totals in group_totals.items():
+                    own_totals = self.totals[group].setdefault(key, dict.fromkeys(key_totals, 0))
+                    for name, value in key_totals.items():
+                        own_totals[name] = own_totals.get(name, 0) + value
+
+    def test_totals(self, test_id: str) -> Optional[Dict[str, float]]:
+        """
+        Returns the totals of the calls made by the given test, if any.
+        """
+        return self.totals["test"].get(test_id)
+
+    def write(self, path: Path):
+        """
+        Writes the totals to a CSV file, if the path has a `.csv` suffix, or a JSON file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".csv":
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["group", "key", "calls", *CALL_FIELDS])
+                for group, group_totals in self.totals.items():
+                    for key, totals in sorted(group_totals.items()):
+                        writer.writerow(
+                            [group, key, totals["calls"], *(totals[f] for f in CALL_FIELDS)]
+                        )
+        else:
+            with open(path, "w") as f:
+                json.dump(self.totals, f, indent=4, sort_keys=True)
+
+
+def record_call(method: str) -> Callable:
+    """
+    Decorates a method of a transition tool to record the metrics of its calls in the tool's
+    `metrics`, if set.
+
+    Calls made while another call is being recorded, e.g., `version()` within `evaluate()`,
+    are accounted to the outer call.
+    """
+
+    def start_call(tool: Any, kwargs: Dict[str, Any]) -> Optional[TransitionToolCall]:
+        if tool.metrics is None or current_call.get() is not None:
+            return None
+        return TransitionToolCall(
+            tool=tool.__class__.__name__,
+            method=method,
+            fork=kwargs.get("fork_name"),
+            test_id=tool.metrics.test_id,
+        )
+
+    def decorator(func: Callable) -> Callable:
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                call = start_call(self, kwargs)
+                if call is None:
+                    return await func(self, *args, **kwargs)
+                token = current_call.set(call)
+                start = perf_counter()
+                try:
+                    return await func(self, *args, **kwargs)
+                finally:
+                    call.wall_time = perf_counter() - start
+                    current_call.reset(token)
+                    self.metrics.add(call)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            call = start_call(self, kwargs)
+            if call is None:
+                return func(self, *args, **kwargs)
+            token = current_call.set(call)
+            start = perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                call.wall_time = perf_counter() - start
+                current_call.reset(token)
+                self.metrics.add(call)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,112 @@
+"""
+Test the transition tool output cache.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from evm_transition_tool import TransitionToolCache
+
+KEY_ARGS: Dict[str, Any] = {
+    "version": "evm version 1.14.0",
+    "fork_name": "Cancun",
+    "chain_id": 1,
+    "reward": 0,
+    "alloc": {"0x00000000000000000000000000000000000000aa": {"balance": "0x01"}},
+    "env": {"currentNumber": "0x01"},
+    "txs": [],
+}
+
+OUTPUT = {"alloc": {}, "result": {"stateRoot": "0x00"}, "body": "0xc0"}
+
+
+def test_cache_key():
+    """
+    Test that the cache key depends on all the inputs of the evaluation.
+    """
+    key = TransitionToolCache.key(**KEY_ARGS)
+    assert key == TransitionToolCache.key(**KEY_ARGS)
+    for field, value in [
+        ("version", "evm version 1.14.1"),
+        ("fork_name", "Prague"),
+        ("chain_id", 2),
+        ("reward", -1),
+        ("alloc", {}),
+        ("env", {"currentNumber": "0x02"}),
+        ("txs", [{}]),
+    ]:
+        assert key != TransitionToolCache.key(**{**KEY_ARGS, field: value}), field
+
+
+def test_cache_get_put(tmp_path: Path):
+    """
+    Test that the JSON encoded outputs are stored and retrieved as is.
+    """
+    cache = TransitionToolCache(tmp_path)
+    key = TransitionToolCache.key(**KEY_ARGS)
+    raw_output = json.dumps(OUTPUT, indent=2).encode()
+    assert cache.get(key) is None
+    cache.put(key, raw_output)
+    assert cache.get(key) == raw_output
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # A new cache instance sharing the same directory sees the entry
+    assert TransitionToolCache(tmp_path).get(key) == raw_output
+
+
+def test_cache_put_existing_entry(tmp_path: Path):
+    """
+    Test that replacing an entry only accounts for the difference in size.
+    """
+    cache = TransitionToolCache(tmp_path)
+    key = TransitionToolCache.key(**KEY_ARGS)
+    raw_output = json.dumps(OUTPUT).encode()
+    for _ in range(3):
+        cache.put(key, raw_output)
+    assert cache._written_bytes == len(raw_output)
+    cache.put(key, raw_output + b" ")
+    assert cache._written_bytes == len(raw_output) + 1
+
+
+def test_cache_shared_max_size(tmp_path: Path):
+    """
+    Test that the maximum size is enforced for the entries written by all the processes that
+    share the cache directory.
+    """
+    raw_output = json.dumps(OUTPUT).encode()
+    max_size_bytes = len(raw_output) * 10
+    caches = [TransitionToolCache(tmp_path, max_size_bytes=max_size_bytes) for _ in range(2)]
+    for i in range(8):
+        for j, cache in enumerate(caches):
+            cache.put(
+                TransitionToolCache.key(**{**KEY_ARGS, "chain_id": i, "reward": j}), raw_output
+            )
+    assert sum(size for _, _, size in caches[0]._entries()) <= max_size_bytes
+
+
+@pytest.mark.parametrize("entries", [10])
+def test_cache_eviction(tmp_path: Path, entries: int):
+    """
+    Test that the least recently used entries are evicted when the cache is full.
+    """
+    cache = TransitionToolCache(tmp_path)
+    keys = [TransitionToolCache.key(**{**KEY_ARGS, "chain_id": i}) for i in range(entries)]
+    for i, key in enumerate(keys):
+        cache.put(key, json.dumps(OUTPUT).encode())
+        os.utime(cache._path(key), (i, i))
+    entry_size = os.path.getsize(cache._path(keys[0]))
+
+    # Use the oldest entry so it becomes the most recently used
+    assert cache.get(keys[0]) is not None
+
+    cache.max_size_bytes = entry_size * (entries // 2)
+    cache.evict()
+    remaining = [key for key in keys if cache.get(key) is not None]
+    assert len(remaining) <= entries // 2
+    assert keys[0] in remaining
+    assert keys[-1] in remaining
+    assert keys[1] not in remaining
@@ -1,4 +1,5 @@
-import json  # noqa: D100
+import asyncio  # noqa: D100
+import json
 import os
 from pathlib import Path
 from shutil import which
@@ -130,3 +131,36 @@ def test_evm_t8n(t8n: TransitionTool, test_dir: str) -> None:  # noqa: D103
         print(expected.get("result"))
         assert result_alloc == expected.get("alloc")
         assert result == expected.get("result")
+
+
+@pytest.mark.parametrize("t8n", [GethTransitionTool()])
+def test_evm_t8n_async(t8n: TransitionTool) -> None:  # noqa: D103
+    test_dirs = sorted(os.listdir(path=FIXTURES_ROOT))
+    inputs = []
+    for test_dir in test_dirs:
+        with open(Path(FIXTURES_ROOT, test_dir, "alloc.json"), "r") as alloc, open(
+            Path(FIXTURES_ROOT, test_dir, "txs.json"), "r"
+        ) as txs, open(Path(FIXTURES_ROOT, test_dir, "env.json"), "r") as env:
+            inputs.append((json.load(alloc), json.load(txs), json.load(env)))
+
+    async def evaluate_all():
+        return await asyncio.gather(
+            *[
+                t8n.evaluate_async(
+                    alloc=alloc,
+                    txs=txs,
+                    env=env_json,
+                    fork_name=Berlin.transition_tool_name(
+                        block_number=int(env_json["currentNumber"], 0),
+                        timestamp=int(env_json["currentTimestamp"], 0),
+                    ),
+                )
+                for alloc, txs, env_json in inputs
+            ]
+        )
+
+    for test_dir, t8n_output in zip(test_dirs, asyncio.run(evaluate_all())):
+        with open(Path(FIXTURES_ROOT, test_dir, "exp.json"), "r") as exp:
+            expected = json.load(exp)
+        assert t8n_output["alloc"] == expected.get("alloc")
+        assert t8n_output["result"] == expected.get("result")
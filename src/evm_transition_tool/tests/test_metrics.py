@@ -0,0 +1,109 @@
+"""
+Test the transition tool call metrics.
+"""
+
+import asyncio
+import csv
+import json
+from pathlib import Path
+from typing import Optional
+
+from evm_transition_tool import TransitionToolMetrics
+from evm_transition_tool.metrics import add_payload_size, record_call, timed
+
+
+class MockTool:
+    """
+    Minimal tool whose calls are recorded.
+    """
+
+    metrics: Optional[TransitionToolMetrics] = None
+
+    @record_call("version")
+    def version(self) -> str:
+        """
+        Mock version call.
+        """
+        with timed("process_time"):
+            pass
+        return "mock 1.0.0"
+
+    @record_call("evaluate")
+    def evaluate(self, *, fork_name: str) -> str:
+        """
+        Mock evaluation that calls `version()` and exchanges payloads with the tool.
+        """
+        self.version()
+        with timed("encode_time"):
+            add_payload_size("input_bytes", 10)
+        add_payload_size("output_bytes", 20)
+        return fork_name
+
+    @record_call("evaluate")
+    async def evaluate_async(self, *, fork_name: str) -> str:
+        """
+        Mock asynchronous evaluation.
+        """
+        add_payload_size("input_bytes", 5)
+        return fork_name
+
+
+def test_record_call():
+    """
+    Test that the calls are aggregated per test, fork, tool and method.
+    """
+    tool = MockTool()
+    assert tool.evaluate(fork_name="Cancun") == "Cancun"  # not recorded
+
+    tool.metrics = TransitionToolMetrics()
+    tool.metrics.test_id = "test_a"
+    tool.evaluate(fork_name="Cancun")
+    tool.evaluate(fork_name="Shanghai")
+    tool.metrics.test_id = None
+    tool.version()
+
+    async def evaluate_concurrently():
+        await asyncio.gather(*[tool.evaluate_async(fork_name="Cancun") for _ in range(2)])
+
+    asyncio.run(evaluate_concurrently())
+
+    totals = tool.metrics.totals
+    assert totals["test"]["test_a"]["calls"] == 2
+    assert totals["test"]["test_a"]["input_bytes"] == 20
+    assert totals["test"]["test_a"]["output_bytes"] == 40
+    assert totals["fork"]["Cancun"]["calls"] == 3
+    assert totals["fork"]["Cancun"]["input_bytes"] == 20
+    assert totals["fork"]["Shanghai"]["calls"] == 1
+    # The nested `version()` calls are accounted to `evaluate()`
+    assert totals["method"]["evaluate"]["calls"] == 4
+    assert totals["method"]["version"]["calls"] == 1
+    assert totals["tool"]["MockTool"]["calls"] == 5
+    assert totals["tool"]["MockTool"]["wall_time"] > 0
+
+
+def test_merge_and_write(tmp_path: Path):
+    """
+    Test merging the totals of several processes and writing them to JSON and CSV files.
+    """
+    metrics = TransitionToolMetrics()
+    worker_metrics = TransitionToolMetrics()
+    tool = MockTool()
+    for tool.metrics in [metrics, worker_metrics, worker_metrics]:
+        tool.evaluate(fork_name="Cancun")
+    metrics.merge(worker_metrics.totals)
+    assert metrics.totals["fork"]["Cancun"]["calls"] == 3
+    assert metrics.totals["fork"]["Cancun"]["input_bytes"] == 30
+
+    metrics.write(tmp_path / "metrics.json")
+    with open(tmp_path / "metrics.json") as f:
+        assert json.load(f) == metrics.totals
+
+    metrics.write(tmp_path / "metrics.csv")
+    with open(tmp_path / "metrics.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert {(row["group"], row["key"]) for row in rows} == {
+        ("fork", "Cancun"),
+        ("tool", "MockTool"),
+        ("method", "evaluate"),
+    }
+    assert all(row["calls"] == "3" for row in rows)
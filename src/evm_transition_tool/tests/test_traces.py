@@ -0,0 +1,75 @@
+"""
+Test the lazily loaded transition tool traces.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from evm_transition_tool import TraceFilter, TransactionTrace
+
+STEPS: List[Dict] = [
+    {"pc": 0, "op": 96, "opName": "PUSH1", "depth": 1},
+    {"pc": 2, "op": 84, "opName": "SLOAD", "depth": 1},
+    {"pc": 0, "op": 96, "opName": "PUSH1", "depth": 2},
+    {"pc": 2, "op": 85, "opName": "SSTORE", "depth": 2},
+    {"pc": 3, "op": 0, "opName": "STOP", "depth": 1},
+    {"output": "", "gasUsed": "0x5208"},
+]
+
+
+@pytest.fixture
+def trace_file(tmp_path: Path) -> Path:
+    """
+    Writes the trace steps to a file, one JSON object per line.
+    """
+    path = tmp_path / "trace-0-0x00.jsonl"
+    path.write_text("".join(json.dumps(step) + "\n" for step in STEPS))
+    return path
+
+
+@pytest.mark.parametrize(
+    "trace_filter,expected_steps",
+    [
+        (None, STEPS),
+        (TraceFilter(), STEPS),
+        (TraceFilter(opcodes={"SLOAD", "SSTORE"}), [STEPS[1], STEPS[3], STEPS[5]]),
+        (TraceFilter(max_depth=1), [STEPS[0], STEPS[1], STEPS[4], STEPS[5]]),
+        (TraceFilter(opcodes={"PUSH1"}, max_depth=1), [STEPS[0], STEPS[5]]),
+        (TraceFilter(last_steps=2), STEPS[-2:]),
+        (TraceFilter(opcodes={"PUSH1"}, last_steps=2), [STEPS[2], STEPS[5]]),
+    ],
+)
+def test_transaction_trace(
+    trace_file: Path, trace_filter: TraceFilter | None, expected_steps: List[Dict]
+):
+    """
+    Test that the trace steps are read from the file and filtered.
+    """
+    trace = TransactionTrace(trace_file, tx_index=0, trace_filter=trace_filter)
+    assert list(trace) == expected_steps
+    # The trace can be iterated more than once
+    assert list(trace) == expected_steps
+
+
+def test_transaction_trace_empty(tmp_path: Path):
+    """
+    Test that empty and missing trace files yield no steps.
+    """
+    empty_trace_file = tmp_path / "empty.jsonl"
+    empty_trace_file.touch()
+    assert list(TransactionTrace(empty_trace_file, tx_index=0)) == []
+    assert list(TransactionTrace(tmp_path / "missing.jsonl", tx_index=0)) == []
+
+
+def test_trace_filter_tx_indexes():
+    """
+    Test the transaction index filter.
+    """
+    assert TraceFilter().includes_tx(5)
+    trace_filter = TraceFilter(tx_indexes={0, 2})
+    assert trace_filter.includes_tx(0)
+    assert not trace_filter.includes_tx(1)
+    assert trace_filter.includes_tx(2)
@@ -2,22 +2,39 @@
 Test the transition tool and subclasses.
 """
 
+import json
+import os
 import shutil
 import subprocess
+import sys
 from pathlib import Path
-from typing import Type
+from typing import Any, Dict, Type
 
 import pytest
+import requests
 
 from evm_transition_tool import (
     EvmOneTransitionTool,
+    ExecutionSpecsInProcessTransitionTool,
     GethTransitionTool,
     NimbusTransitionTool,
     TransitionTool,
     TransitionToolNotFoundInPath,
+    TransitionToolServer,
 )
 
 
+class MockCompletedProcess:
+    """
+    Successful `subprocess.run` result with the given output.
+    """
+
+    def __init__(self, stdout):
+        self.stdout = stdout
+        self.stderr = b""
+        self.returncode = 0
+
+
 def test_default_tool():
     """
     Tests that the default t8n tool is set.
@@ -65,12 +82,6 @@ def test_from_binary(
     Test that `from_binary` instantiates the correct subclass.
     """
 
-    class MockCompletedProcess:
-        def __init__(self, stdout):
-            self.stdout = stdout
-            self.stderr = None
-            self.returncode = 0
-
     def mock_which(self):
         return which_result
 
@@ -90,3 +101,226 @@ def test_unknown_binary_path():
     """
     with pytest.raises(TransitionToolNotFoundInPath):
         TransitionTool.from_binary_path(binary_path=Path("unknown_binary_path"))
+
+
+def test_in_process_tool_from_name():
+    """
+    Test that `from_binary_path` selects the in-process tool by name, without a binary.
+    """
+    t8n = TransitionTool.from_binary_path(binary_path=Path("ethereum-spec-evm-in-process"))
+    assert isinstance(t8n, ExecutionSpecsInProcessTransitionTool)
+    t8n.shutdown()
+
+
+@pytest.mark.parametrize(
+    "fork_name,env,expected_error",
+    [
+        ("Unknown", {}, "Unsupported state fork: Unknown"),
+        ("Cancun", {}, "KeyError: 'currentCoinbase'"),
+    ],
+)
+def test_in_process_tool_error(monkeypatch, fork_name: str, env: Dict, expected_error: str):
+    """
+    Test that the in-process tool doesn't start any process, and that the errors of the tool
+    are returned as the stderr of the call.
+    """
+    t8n = TransitionTool.from_binary_path(binary_path=Path("ethereum-spec-evm-in-process"))
+
+    def mock_run(args, **kwargs):
+        raise AssertionError(f"unexpected process started: {args}")
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    try:
+        result = t8n._execute_stream(
+            [
+                str(t8n.binary),
+                "t8n",
+                "--input.alloc=stdin",
+                "--input.txs=stdin",
+                "--input.env=stdin",
+                "--output.result=stdout",
+                "--output.alloc=stdout",
+                f"--state.fork={fork_name}",
+            ],
+            json.dumps({"alloc": {}, "txs": [], "env": env}).encode(),
+        )
+    finally:
+        t8n.shutdown()
+    assert result.returncode == 1
+    assert result.stdout == b""
+    assert expected_error in result.stderr.decode()
+
+
+def test_evaluate_memoization(monkeypatch):
+    """
+    Test that identical evaluations are only executed once by the transition tool.
+    """
+    t8n_output = {"alloc": {}, "result": {"receipts": []}, "body": "0xc0"}
+    t8n_calls = []
+
+    def mock_run(args, **kwargs):
+        if "--state.fork=Cancun" in args:
+            t8n_calls.append(args)
+            return MockCompletedProcess(json.dumps(t8n_output).encode())
+        return MockCompletedProcess(b"evm version 1.14.0")
+
+    monkeypatch.setattr(shutil, "which", lambda binary: "evm")
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    t8n = GethTransitionTool()
+    evaluate_args: Dict[str, Any] = {
+        "alloc": {},
+        "txs": [],
+        "env": {"currentNumber": "0x1"},
+        "fork_name": "Cancun",
+    }
+    first_output = t8n.evaluate(**evaluate_args)
+    first_output["alloc"]["0x00"] = {}  # modifying an output must not affect the memo
+    assert t8n.evaluate(**evaluate_args) == t8n_output
+    assert len(t8n_calls) == 1
+    assert list(t8n._evaluation_memo.values()) == [json.dumps(t8n_output).encode()]
+    t8n.evaluate(**{**evaluate_args, "env": {"currentNumber": "0x2"}})
+    assert len(t8n_calls) == 2
+
+    # The memo is bounded by the total size of the outputs
+    raw_output_size = len(json.dumps(t8n_output).encode())
+    t8n.evaluation_memo_max_bytes = raw_output_size * 2
+    t8n.evaluate(**{**evaluate_args, "env": {"currentNumber": "0x3"}})
+    assert len(t8n._evaluation_memo) == 2
+    assert t8n._evaluation_memo_bytes == raw_output_size * 2
+    t8n.evaluate(**evaluate_args)
+    assert len(t8n_calls) == 4
+
+
+def test_work_dir_reuse(monkeypatch):
+    """
+    Test that the work directories of the t8n calls are emptied and re-used.
+    """
+    monkeypatch.setattr(shutil, "which", lambda binary: "evm")
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: MockCompletedProcess(b""))
+
+    t8n = GethTransitionTool()
+    work_dir = t8n._acquire_work_dir()
+    os.makedirs(os.path.join(work_dir.name, "output"))
+    with open(os.path.join(work_dir.name, "output", "result.json"), "w") as f:
+        f.write("{}")
+    t8n._release_work_dir(work_dir)
+
+    reused_work_dir = t8n._acquire_work_dir()
+    assert reused_work_dir is work_dir
+    assert os.listdir(os.path.join(work_dir.name, "output")) == []
+    t8n._release_work_dir(reused_work_dir)
+
+    t8n.shutdown()
+    assert not os.path.exists(work_dir.name)
+
+
+def test_work_dir_removed_on_failure(monkeypatch):
+    """
+    Test that the work directory of a failed t8n call is removed instead of being re-used.
+    """
+
+    def mock_run(args, **kwargs):
+        if "--state.fork=Cancun" in args:
+            return subprocess.CompletedProcess(args, 1, b"", b"t8n error")
+        return subprocess.CompletedProcess(args, 0, b"evm version 1.14.0", b"")
+
+    monkeypatch.setattr(shutil, "which", lambda binary: "evm")
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    t8n = GethTransitionTool()
+    acquired_work_dirs = []
+    acquire_work_dir = t8n._acquire_work_dir
+
+    def mock_acquire_work_dir():
+        acquired_work_dirs.append(acquire_work_dir())
+        return acquired_work_dirs[-1]
+
+    monkeypatch.setattr(t8n, "_acquire_work_dir", mock_acquire_work_dir)
+    with pytest.raises(Exception, match="t8n error"):
+        t8n.evaluate(alloc={}, txs=[], env={"currentNumber": "0x1"}, fork_name="Cancun")
+    assert len(acquired_work_dirs) == 1
+    assert not os.path.exists(acquired_work_dirs[0].name)
+    assert t8n._work_dirs == []
+    t8n.shutdown()
+
+
+def test_server_pool(monkeypatch):
+    """
+    Test that the t8n servers are started on demand, used exclusively by one call at a time
+    and restarted if they crashed.
+    """
+    monkeypatch.setattr(shutil, "which", lambda binary: "evm")
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: MockCompletedProcess(b""))
+
+    t8n = GethTransitionTool()
+    started_servers = []
+
+    def mock_start_server() -> TransitionToolServer:
+        server = TransitionToolServer(
+            process=subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"]),
+            url=f"http://localhost:{3000 + len(started_servers)}/",
+        )
+        started_servers.append(server)
+        return server
+
+    monkeypatch.setattr(t8n, "start_server", mock_start_server)
+    t8n.server_count = 2
+
+    first_server_index = t8n._acquire_server()
+    second_server_index = t8n._acquire_server()
+    assert first_server_index != second_server_index
+    assert len(started_servers) == 2
+
+    # Idle servers are re-used
+    t8n._release_server(first_server_index)
+    assert t8n._acquire_server() == first_server_index
+    assert len(started_servers) == 2
+
+    # Crashed servers are restarted
+    crashed_server = started_servers[first_server_index]
+    crashed_server.process.kill()
+    crashed_server.process.wait()
+    t8n._release_server(first_server_index)
+    assert t8n._acquire_server() == first_server_index
+    assert len(started_servers) == 3
+    assert t8n._servers[first_server_index] is started_servers[2]
+
+    t8n.shutdown()
+    assert all(not server.is_running() for server in started_servers)
+
+
+@pytest.mark.parametrize("response_body", [b"", b'{"alloc": {}, "res'])
+def test_server_invalid_response(monkeypatch, response_body: bytes):
+    """
+    Test that an empty or truncated server response is reported with the request's state and
+    the response body.
+    """
+    monkeypatch.setattr(shutil, "which", lambda binary: "evm")
+    monkeypatch.setattr(subprocess, "run", lambda args, **kwargs: MockCompletedProcess(b""))
+
+    t8n = GethTransitionTool()
+    t8n.t8n_use_server = True
+
+    def mock_server_post(server_index: int, request_body: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = response_body
+        return response
+
+    monkeypatch.setattr(
+        t8n,
+        "start_server",
+        lambda: TransitionToolServer(
+            process=subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"]),
+            url="http://localhost:3000/",
+        ),
+    )
+    monkeypatch.setattr(t8n, "_server_post", mock_server_post)
+    try:
+        with pytest.raises(Exception, match="invalid t8n-server response") as e:
+            t8n.evaluate(alloc={}, txs=[], env={"currentNumber": "0x1"}, fork_name="Cancun")
+    finally:
+        t8n.shutdown()
+    assert "'fork': 'Cancun'" in str(e.value)
+    assert repr(response_body.decode()) in str(e.value)
@@ -0,0 +1,116 @@
+"""
+Lazily loaded execution traces of the transition tools.
+"""
+
+import json
+import mmap
+import os
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Generator, Iterator, List, Optional, Set
+
+
+@dataclass(kw_only=True)
+class TraceFilter:
+    """
+    Filters applied to the traces collected from the transition tool.
+
+    Only the steps that match all the specified filters are kept. The lines of a trace that
+    are not execution steps, e.g., the summary line written at the end of a transaction, are
+    always kept.
+    """
+
+    opcodes: Optional[Set[str]] = None
+    """
+    Names of the opcodes to keep, e.g., `{"SSTORE", "SLOAD"}`.
+    """
+    max_depth: Optional[int] = None
+    """
+    Maximum call depth of the steps to keep; the depth of the top-level call is 1.
+    """
+    tx_indexes: Optional[Set[int]] = None
+    """
+    Indexes, within their block, of the transactions whose traces are kept.
+    """
+    last_steps: Optional[int] = None
+    """
+    Only keep the last N steps of each transaction, e.g., the steps leading to a failure.
+    """
+
+    def includes_tx(self, tx_index: int) -> bool:
+        """
+        Returns True if the trace of the transaction at the given index is kept.
+        """
+        return self.tx_indexes is None or tx_index in self.tx_indexes
+
+    def includes_step(self, step: Dict) -> bool:
+        """
+        Returns True if the trace step is kept.
+        """
+        if "opName" not in step:
+            return True
+        if self.opcodes is not None and step["opName"] not in self.opcodes:
+            return False
+        if self.max_depth is not None and step.get("depth", 1) > self.max_depth:
+            return False
+        return True
+
+
+class TransactionTrace:
+    """
+    Trace of a single transaction, backed by the trace file written by the transition tool.
+
+    The steps are only parsed when the trace is iterated, one line at a time from the
+    memory-mapped file, so the trace of a transaction never has to be kept in memory as a whole.
+    """
+
+    path: Path
+    tx_index: int
+    trace_filter: Optional[TraceFilter]
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        tx_index: int,
+        trace_filter: Optional[TraceFilter] = None,
+    ):
+        self.path = path
+        self.tx_index = tx_index
+        self.trace_filter = trace_filter
+
+    def steps(self) -> Generator[Dict, None, None]:
+        """
+        Yields the steps of the trace that match the filter.
+        """
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return
+        with open(self.path, "rb") as trace_file:
+            with mmap.mmap(trace_file.fileno(), 0, access=mmap.ACCESS_READ) as trace_map:
+                for trace_line in iter(trace_map.readline, b""):
+                    if not trace_line.strip():
+                        continue
+                    step = json.loads(trace_line)
+                    if self.trace_filter is None or self.trace_filter.includes_step(step):
+                        yield step
+
+    def __iter__(self) -> Iterator[Dict]:
+        """
+        Iterates over the steps of the trace, only keeping the last steps in ring-buffer mode.
+        """
+        if self.trace_filter is not None and self.trace_filter.last_steps is not None:
+            return iter(deque(self.steps(), maxlen=self.trace_filter.last_steps))
+        return self.steps()
+
+    def __repr__(self) -> str:
+        """
+        Returns a short representation of the trace that does not load the trace file.
+        """
+        return f"TransactionTrace(tx_index={self.tx_index}, path={str(self.path)!r})"
+
+
+Traces = List[List[TransactionTrace]]
+"""
+Traces of all the state transitions of a test, one list of transaction traces per transition.
+"""
@@ -2,23 +2,49 @@
 Transition tool abstract class.
 """
 
+import asyncio
 import json
 import os
 import shutil
 import subprocess
 import tempfile
 import textwrap
+import threading
 from abc import abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from itertools import groupby
+from functools import cached_property
+from itertools import count, groupby
 from pathlib import Path
+from queue import Queue
 from re import Pattern
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from ethereum_test_forks import Fork
 
-from .file_utils import dump_files_to_directory, write_json_file
+from .cache import TransitionToolCache
+from .file_utils import dump_files_to_directory, encode_json
+from .metrics import TransitionToolMetrics, add_payload_size, record_call, timed
+from .traces import TraceFilter, Traces, TransactionTrace
+
+
+def default_work_dir_base() -> Optional[str]:
+    """
+    Returns the directory where the work directories of the t8n calls are created: shared
+    memory if available, otherwise the system's default temporary directory.
+    """
+    shared_memory_dir = "/dev/shm"
+    if os.path.isdir(shared_memory_dir) and os.access(shared_memory_dir, os.W_OK):
+        return shared_memory_dir
+    return None
+
+
+WORK_DIR_BASE = default_work_dir_base()
 
 
 class UnknownTransitionTool(Exception):
@@ -103,13 +129,50 @@ class FixtureFormats(Enum):
         return ".json"
 
 
+@dataclass(kw_only=True)
+class TransitionToolServer:
+    """
+    Long-lived t8n server process started by a transition tool.
+    """
+
+    process: subprocess.Popen
+    """
+    Server process.
+    """
+    url: str
+    """
+    URL where the server accepts `t8n` requests.
+    """
+    trace_dir: Optional[tempfile.TemporaryDirectory] = None
+    """
+    Directory where the server writes the traces of all requests, if the traces are not
+    written to a directory specified per request.
+    """
+
+    def is_running(self) -> bool:
+        """
+        Health check for the server: returns True if the server process is alive.
+        """
+        return self.process.poll() is None
+
+    def stop(self):
+        """
+        Stops the server process and removes its trace directory.
+        """
+        self.process.kill()
+        self.process.wait()
+        if self.trace_dir is not None:
+            self.trace_dir.cleanup()
+
+
 class TransitionTool:
     """
     Transition tool abstract base class which should be inherited by all transition tool
     implementations.
     """
 
-    traces: List[List[List[Dict]]] | None = None
+    traces: Traces | None = None
+    trace_filter: Optional[TraceFilter] = None
 
     registered_tools: List[Type["TransitionTool"]] = []
     default_tool: Optional[Type["TransitionTool"]] = None
@@ -121,6 +184,13 @@ class TransitionTool:
     blocktest_subcommand: Optional[str] = None
     cached_version: Optional[str] = None
     t8n_use_stream: bool = True
+    in_process: bool = False
+    t8n_use_server: bool = False
+    server_count: int = 1
+    server_timeout: int = 5
+    cache: Optional[TransitionToolCache] = None
+    metrics: Optional[TransitionToolMetrics] = None
+    evaluation_memo_max_bytes: int = 64 * 1024 * 1024
 
     # Abstract methods that each tool must implement
 
@@ -136,16 +206,28 @@ class TransitionTool:
         """
         if binary is None:
             binary = self.default_binary
-        else:
+        elif not self.in_process:
             # improve behavior of which by resolving the path: ~/relative paths don't work
             resolved_path = Path(os.path.expanduser(binary)).resolve()
             if resolved_path.exists():
                 binary = resolved_path
-        binary = shutil.which(binary)  # type: ignore
-        if not binary:
-            raise TransitionToolNotFoundInPath(binary=binary)
+        if not self.in_process:
+            binary = shutil.which(binary)  # type: ignore
+            if not binary:
+                raise TransitionToolNotFoundInPath(binary=binary)
         self.binary = Path(binary)
         self.trace = trace
+        self._evaluation_memo: OrderedDict[str, bytes] = OrderedDict()
+        self._evaluation_memo_bytes = 0
+        self._evaluation_memo_lock = threading.Lock()
+        self._work_dirs: List[tempfile.TemporaryDirectory] = []
+        self._work_dirs_lock = threading.Lock()
+        self._trace_store: Optional[tempfile.TemporaryDirectory] = None
+        self._servers: List[Optional[TransitionToolServer]] = []
+        self._idle_servers: Optional[Queue[int]] = None
+        self._server_session: Optional[requests.Session] = None
+        self._servers_lock = threading.Lock()
+        self._trace_file_counter = count()
 
     def __init_subclass__(cls):
         """
@@ -178,6 +260,11 @@ class TransitionTool:
         if binary_path is None:
             return cls.default_tool(binary=binary_path, **kwargs)
 
+        # Tools that run within this process are selected by their name instead of a binary
+        for tool in cls.registered_tools:
+            if tool.in_process and Path(binary_path) == tool.default_binary:
+                return tool(binary=binary_path, **kwargs)
+
         resolved_path = Path(os.path.expanduser(binary_path)).resolve()
         if resolved_path.exists():
             binary_path = resolved_path
@@ -233,15 +320,17 @@ class TransitionTool:
         """
         return False
 
+    @record_call("version")
     def version(self) -> str:
         """
         Return name and version of tool used to state transition
         """
         if self.cached_version is None:
-            result = subprocess.run(
-                [str(self.binary), self.version_flag],
-                stdout=subprocess.PIPE,
-            )
+            with timed("process_time"):
+                result = subprocess.run(
+                    [str(self.binary), self.version_flag],
+                    stdout=subprocess.PIPE,
+                )
 
             if result.returncode != 0:
                 raise Exception("failed to evaluate: " + result.stderr.decode())
@@ -250,6 +339,13 @@ class TransitionTool:
 
         return self.cached_version
 
+    @cached_property
+    def _cache_key_version(self) -> str:
+        """
+        The version of the tool, included in the cache key of every evaluation.
+        """
+        return self.version()
+
     @abstractmethod
     def is_fork_supported(self, fork: Fork) -> bool:
         """
@@ -261,15 +357,188 @@ class TransitionTool:
         """
         Perform any cleanup tasks related to the tested tool.
         """
-        pass
+        self.stop_servers()
+        with self._work_dirs_lock:
+            for work_dir in self._work_dirs:
+                work_dir.cleanup()
+            self._work_dirs.clear()
+        self.traces = None
+        if self._trace_store is not None:
+            self._trace_store.cleanup()
+            self._trace_store = None
+
+    def _acquire_work_dir(self) -> tempfile.TemporaryDirectory:
+        """
+        Returns an empty work directory for a single t8n call.
+
+        Directories released by previous calls are re-used, instead of creating and removing
+        a temporary directory for every call. Directories are created in shared memory if
+        available. A directory is not re-used if the call that acquired it failed.
+        """
+        with self._work_dirs_lock:
+            if self._work_dirs:
+                return self._work_dirs.pop()
+        return tempfile.TemporaryDirectory(dir=WORK_DIR_BASE)
+
+    def _release_work_dir(self, work_dir: tempfile.TemporaryDirectory):
+        """
+        Removes all the files in a work directory and makes it available to subsequent calls.
+        """
+        for root, _, files in os.walk(work_dir.name):
+            for file in files:
+                os.remove(os.path.join(root, file))
+        with self._work_dirs_lock:
+            self._work_dirs.append(work_dir)
+
+    @contextmanager
+    def _work_dir(self) -> Iterator[tempfile.TemporaryDirectory]:
+        """
+        Acquires a work directory for a single t8n call, which is released if the call succeeds
+        and removed if it fails.
+        """
+        work_dir = self._acquire_work_dir()
+        try:
+            yield work_dir
+        except BaseException:
+            work_dir.cleanup()
+            raise
+        self._release_work_dir(work_dir)
+
+    def start_server(self) -> TransitionToolServer:
+        """
+        Starts a long-lived t8n server process that is re-used by subsequent `evaluate()` calls.
+
+        Must be implemented by tools that set `t8n_use_server`.
+        """
+        raise NotImplementedError(
+            f"The `start_server()` function is not supported by {self.__class__.__name__}."
+        )
+
+    def stop_servers(self):
+        """
+        Stops all the t8n server processes that were started.
+        """
+        with self._servers_lock:
+            if self._server_session is not None:
+                self._server_session.close()
+                self._server_session = None
+            for server in self._servers:
+                if server is not None:
+                    server.stop()
+            self._servers = []
+            self._idle_servers = None
+
+    def create_server_session(self) -> requests.Session:
+        """
+        Returns a new session used to send requests to the t8n servers.
+
+        The session keeps one connection alive per server. Can be overridden by tools whose
+        server does not listen on a TCP port.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.server_count, pool_maxsize=1)
+        session.mount("http://", adapter)
+        return session
+
+    def _acquire_server(self) -> int:
+        """
+        Returns the index of an idle t8n server, waiting for one if all the servers are busy.
+
+        The server at the returned index is started, or restarted if it crashed, before it is
+        returned, and it is not used by any other call until it is released.
+        """
+        with self._servers_lock:
+            if self._idle_servers is None:
+                self._servers = [None] * self.server_count
+                self._idle_servers = Queue()
+                for server_index in range(self.server_count):
+                    self._idle_servers.put(server_index)
+            if self._server_session is None:
+                self._server_session = self.create_server_session()
+            idle_servers = self._idle_servers
+        server_index = idle_servers.get()
+        server = self._servers[server_index]
+        if server is None or not server.is_running():
+            try:
+                self._restart_server(server_index)
+            except Exception:
+                idle_servers.put(server_index)
+                raise
+        return server_index
+
+    def _release_server(self, server_index: int):
+        """
+        Makes the server at the given index available to subsequent calls.
+        """
+        with self._servers_lock:
+            if self._idle_servers is not None:
+                self._idle_servers.put(server_index)
+
+    def _restart_server(self, server_index: int):
+        """
+        Stops the server at the given index, if running, and starts a fresh one.
+        """
+        server = self._servers[server_index]
+        if server is not None:
+            server.stop()
+        self._servers[server_index] = None
+        with timed("spawn_time"):
+            self._servers[server_index] = self.start_server()
+
+    def _server_post(self, server_index: int, request_body: bytes) -> requests.Response:
+        """
+        Sends a request to the t8n server at the given index.
+
+        If the connection fails because the server crashed, the server is restarted and the
+        request is sent one more time.
+        """
+        try:
+            return self._send_server_request(server_index, request_body)
+        except requests.exceptions.ConnectionError:
+            server = self._servers[server_index]
+            if server is not None and server.is_running():
+                raise
+            self._restart_server(server_index)
+            return self._send_server_request(server_index, request_body)
+
+    def _send_server_request(self, server_index: int, request_body: bytes) -> requests.Response:
+        """
+        Posts the JSON request body to the t8n server at the given index using the shared
+        session.
+        """
+        server = self._servers[server_index]
+        assert server is not None and self._server_session is not None
+        add_payload_size("input_bytes", len(request_body))
+        with timed("process_time"):
+            return self._server_session.post(
+                server.url,
+                data=request_body,
+                headers={"Content-Type": "application/json"},
+                timeout=self.server_timeout,
+            )
+
+    def server_curl_command(self) -> str:
+        """
+        Returns the lines used in the debug `t8n.sh` script to send a request to a manually
+        started t8n server.
+        """
+        return textwrap.dedent(
+            """\
+            # Use $1 as t8n-server port if provided, else default to 3000
+            PORT=${1:-3000}
+            curl http://localhost:${PORT}/ -X POST -H "Content-Type: application/json" \\"""
+        )
 
     def reset_traces(self):
         """
         Resets the internal trace storage for a new test to begin
         """
         self.traces = None
+        if self._trace_store is not None:
+            for trace_file in os.listdir(self._trace_store.name):
+                os.remove(os.path.join(self._trace_store.name, trace_file))
 
-    def append_traces(self, new_traces: List[List[Dict]]):
+    def append_traces(self, new_traces: List[TransactionTrace]):
         """
         Appends a list of traces of a state transition to the current list
         """
@@ -277,7 +546,7 @@ class TransitionTool:
             self.traces = []
         self.traces.append(new_traces)
 
-    def get_traces(self) -> List[List[List[Dict]]] | None:
+    def get_traces(self) -> Traces | None:
         """
         Returns the accumulated traces
         """
@@ -291,31 +560,43 @@ class TransitionTool:
     ) -> None:
         """
         Collect the traces from the t8n tool output and store them in the traces list.
+
+        The trace files are moved out of the tool's output directory and are only parsed when
+        the traces are consumed, keeping only the steps that match the tool's trace filter.
         """
-        traces: List[List[Dict]] = []
+        if self._trace_store is None:
+            self._trace_store = tempfile.TemporaryDirectory()
+        traces: List[TransactionTrace] = []
         for i, r in enumerate(receipts):
             trace_file_name = f"trace-{i}-{r['transactionHash']}.jsonl"
+            trace_file_path = os.path.join(temp_dir.name, trace_file_name)
             if debug_output_path:
-                shutil.copy(
-                    os.path.join(temp_dir.name, trace_file_name),
-                    os.path.join(debug_output_path, trace_file_name),
+                shutil.copy(trace_file_path, os.path.join(debug_output_path, trace_file_name))
+            if self.trace_filter is not None and not self.trace_filter.includes_tx(i):
+                os.remove(trace_file_path)
+                continue
+            stored_trace_file_path = os.path.join(
+                self._trace_store.name, f"{next(self._trace_file_counter)}-{trace_file_name}"
+            )
+            shutil.move(trace_file_path, stored_trace_file_path)
+            traces.append(
+                TransactionTrace(
+                    Path(stored_trace_file_path), tx_index=i, trace_filter=self.trace_filter
                 )
-            with open(os.path.join(temp_dir.name, trace_file_name), "r") as trace_file:
-                tx_traces: List[Dict] = []
-                for trace_line in trace_file.readlines():
-                    tx_traces.append(json.loads(trace_line))
-                traces.append(tx_traces)
+            )
         self.append_traces(traces)
 
     @dataclass
     class TransitionToolData:
         """
         Transition tool files and data to pass between methods
+
+        The inputs of the tool (`alloc`, `txs` and `env`) are JSON encoded.
         """
 
-        alloc: Any
-        txs: Any
-        env: Any
+        alloc: bytes
+        txs: bytes
+        env: bytes
         fork_name: str
         chain_id: int = field(default=1)
         reward: int = field(default=0)
@@ -326,21 +607,39 @@ class TransitionTool:
             Ensure that the `to` field of transactions is not None
             """
             if self.empty_string_to:
-                for tx in self.txs:
+                txs = json.loads(self.txs)
+                for tx in txs:
                     tx["to"] = tx.get("to") or ""
+                self.txs = encode_json(txs)
 
     def _evaluate_filesystem(
         self,
         *,
         t8n_data: TransitionToolData,
         debug_output_path: str = "",
-    ) -> Dict[str, Any]:
+    ) -> Tuple[Dict[str, Any], bytes]:
         """
         Executes a transition tool using the filesystem for its inputs and outputs.
+
+        Returns the output of the tool, and its JSON encoding.
         """
-        temp_dir = tempfile.TemporaryDirectory()
-        os.mkdir(os.path.join(temp_dir.name, "input"))
-        os.mkdir(os.path.join(temp_dir.name, "output"))
+        with self._work_dir() as temp_dir:
+            return self._evaluate_filesystem_in_work_dir(
+                t8n_data=t8n_data, temp_dir=temp_dir, debug_output_path=debug_output_path
+            )
+
+    def _evaluate_filesystem_in_work_dir(
+        self,
+        *,
+        t8n_data: TransitionToolData,
+        temp_dir: tempfile.TemporaryDirectory,
+        debug_output_path: str = "",
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """
+        Executes a transition tool using the given work directory for its inputs and outputs.
+        """
+        os.makedirs(os.path.join(temp_dir.name, "input"), exist_ok=True)
+        os.makedirs(os.path.join(temp_dir.name, "output"), exist_ok=True)
 
         input_contents = {
             "alloc": t8n_data.alloc,
@@ -352,7 +651,9 @@ class TransitionTool:
             k: os.path.join(temp_dir.name, "input", f"{k}.json") for k in input_contents.keys()
         }
         for key, file_path in input_paths.items():
-            write_json_file(input_contents[key], file_path)
+            with open(file_path, "wb") as f:
+                f.write(input_contents[key])
+            add_payload_size("input_bytes", len(input_contents[key]))
 
         output_paths = {
             output: os.path.join("output", f"{output}.json") for output in ["alloc", "result"]
@@ -387,16 +688,21 @@ class TransitionTool:
         if self.trace:
             args.append("--trace")
 
-        result = subprocess.run(
-            args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        with timed("process_time"):
+            result = subprocess.run(
+                args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
 
         if debug_output_path:
             if os.path.exists(debug_output_path):
                 shutil.rmtree(debug_output_path)
             shutil.copytree(temp_dir.name, debug_output_path)
+            dump_files_to_directory(  # indented copies of the compact inputs
+                debug_output_path,
+                {f"input/{k}.json": json.loads(v) for k, v in input_contents.items()},
+            )
             t8n_output_base_dir = os.path.join(debug_output_path, "t8n.sh.out")
             t8n_call = " ".join(args)
             for file_path in input_paths.values():  # update input paths
@@ -433,50 +739,114 @@ class TransitionTool:
             output_paths[key] = os.path.join(temp_dir.name, file_path)
 
         output_contents = {}
-        for key, file_path in output_paths.items():
-            if "txs.rlp" in file_path:
-                continue
-            with open(file_path, "r+") as file:
-                output_contents[key] = json.load(file)
+        raw_output_contents = {}
+        with timed("decode_time"):
+            for key, file_path in output_paths.items():
+                if "txs.rlp" in file_path:
+                    continue
+                with open(file_path, "rb") as file:
+                    raw_output_contents[key] = file.read()
+                add_payload_size("output_bytes", len(raw_output_contents[key]))
+                output_contents[key] = json.loads(raw_output_contents[key])
+        raw_output = (
+            b"{"
+            + b",".join(
+                encode_json(key) + b":" + value for key, value in raw_output_contents.items()
+            )
+            + b"}"
+        )
 
         if self.trace:
             self.collect_traces(output_contents["result"]["receipts"], temp_dir, debug_output_path)
 
-        temp_dir.cleanup()
-
-        return output_contents
+        return output_contents, raw_output
 
     def _evaluate_stream(
         self,
         *,
         t8n_data: TransitionToolData,
         debug_output_path: str = "",
-    ) -> Dict[str, Any]:
+    ) -> Tuple[Dict[str, Any], bytes]:
         """
         Executes a transition tool using stdin and stdout for its inputs and outputs.
+
+        Returns the output of the tool, and its JSON encoding.
         """
-        temp_dir = tempfile.TemporaryDirectory()
-        args = self.construct_args_stream(t8n_data, temp_dir)
+        with self._work_dir() as temp_dir:
+            args = self.construct_args_stream(t8n_data, temp_dir)
+            stdin = self.construct_stdin_stream(t8n_data)
 
-        stdin = {
-            "alloc": t8n_data.alloc,
-            "txs": t8n_data.txs,
-            "env": t8n_data.env,
-        }
+            result = self._execute_stream(args, stdin)
+
+            return self._process_stream_result(debug_output_path, temp_dir, stdin, args, result)
+
+    async def _evaluate_stream_async(
+        self,
+        *,
+        t8n_data: TransitionToolData,
+        debug_output_path: str = "",
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """
+        Executes a transition tool as an asyncio subprocess using stdin and stdout for its inputs
+        and outputs.
+        """
+        with self._work_dir() as temp_dir:
+            args = self.construct_args_stream(t8n_data, temp_dir)
+            stdin = self.construct_stdin_stream(t8n_data)
+
+            add_payload_size("input_bytes", len(stdin))
+            with timed("spawn_time"):
+                process = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            with timed("process_time"):
+                stdout, stderr = await process.communicate(stdin)
+            assert process.returncode is not None
+            result = subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
 
-        result = subprocess.run(
-            args,
-            input=str.encode(json.dumps(stdin)),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            return self._process_stream_result(debug_output_path, temp_dir, stdin, args, result)
+
+    def construct_stdin_stream(self, t8n_data: TransitionToolData) -> bytes:
+        """
+        Construct the JSON input written to the t8n's stdin when interacting via streams
+
+        The inputs are already encoded, so they are only concatenated.
+        """
+        return b"".join(
+            [
+                b'{"alloc":',
+                t8n_data.alloc,
+                b',"txs":',
+                t8n_data.txs,
+                b',"env":',
+                t8n_data.env,
+                b"}",
+            ]
         )
 
+    def _process_stream_result(
+        self,
+        debug_output_path: str,
+        temp_dir: tempfile.TemporaryDirectory,
+        stdin: bytes,
+        args: List[str],
+        result: subprocess.CompletedProcess,
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """
+        Checks the result of a t8n execution via streams and returns its parsed output, and
+        the output as written by the tool.
+        """
         self.dump_debug_stream(debug_output_path, temp_dir, stdin, args, result)
 
         if result.returncode != 0:
             raise Exception("failed to evaluate: " + result.stderr.decode())
 
-        output = json.loads(result.stdout)
+        add_payload_size("output_bytes", len(result.stdout))
+        with timed("decode_time"):
+            output = json.loads(result.stdout)
 
         if not all([x in output for x in ["alloc", "result", "body"]]):
             raise Exception("Malformed t8n output: missing 'alloc', 'result' or 'body'.")
@@ -493,9 +863,169 @@ class TransitionTool:
 
         if self.trace:
             self.collect_traces(output["result"]["receipts"], temp_dir, debug_output_path)
-            temp_dir.cleanup()
 
-        return output
+        return output, result.stdout
+
+    def _evaluate_server(
+        self,
+        *,
+        t8n_data: TransitionToolData,
+        debug_output_path: str = "",
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """
+        Executes the transition tool by sending a request to a long-lived t8n server.
+
+        Returns the output of the tool, and its JSON encoding.
+        """
+        server_index = self._acquire_server()
+        try:
+            # Servers started with a trace directory write all traces there, otherwise the
+            # trace output directory is specified per request
+            server = self._servers[server_index]
+            assert server is not None
+            if self.trace and server.trace_dir is None:
+                with self._work_dir() as temp_dir:
+                    return self._evaluate_server_request(
+                        server_index=server_index,
+                        t8n_data=t8n_data,
+                        debug_output_path=debug_output_path,
+                        temp_dir=temp_dir,
+                    )
+            return self._evaluate_server_request(
+                server_index=server_index,
+                t8n_data=t8n_data,
+                debug_output_path=debug_output_path,
+            )
+        finally:
+            self._release_server(server_index)
+
+    def _evaluate_server_request(
+        self,
+        *,
+        server_index: int,
+        t8n_data: TransitionToolData,
+        debug_output_path: str = "",
+        temp_dir: Optional[tempfile.TemporaryDirectory] = None,
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """
+        Sends a `t8n` request to the server at the given index and processes its response.
+
+        If a work directory is given, the server is requested to write the traces there.
+        """
+        state_json = {
+            "fork": t8n_data.fork_name,
+            "chainid": t8n_data.chain_id,
+            "reward": t8n_data.reward,
+        }
+
+        # The fields of the request are JSON encoded
+        post_data: Dict[str, bytes] = {
+            "state": encode_json(state_json),
+            "input": self.construct_stdin_stream(t8n_data),
+        }
+
+        if temp_dir is not None:
+            post_data["trace"] = encode_json(True)
+            post_data["output-basedir"] = encode_json(temp_dir.name)
+
+        request_body = b"".join(
+            [
+                b"{",
+                b",".join(encode_json(key) + b":" + value for key, value in post_data.items()),
+                b"}",
+            ]
+        )
+
+        if debug_output_path:
+            post_data_string = json.dumps(json.loads(request_body), indent=4)
+            t8n_script = "\n".join(
+                [
+                    "#!/bin/bash",
+                    self.server_curl_command(),
+                    f"--data '{post_data_string}'",
+                    "",
+                ]
+            )
+            dump_files_to_directory(
+                debug_output_path,
+                {
+                    "state.json": state_json,
+                    "input/alloc.json": json.loads(t8n_data.alloc),
+                    "input/env.json": json.loads(t8n_data.env),
+                    "input/txs.json": json.loads(t8n_data.txs),
+                    "t8n.sh+x": t8n_script,
+                },
+            )
+
+        response = self._server_post(server_index, request_body)
+        response.raise_for_status()  # exception visible in pytest failure output
+        add_payload_size("output_bytes", len(response.content))
+
+        if debug_output_path:
+            dump_files_to_directory(
+                debug_output_path,
+                {
+                    "response.txt": response.text,
+                    "status_code.txt": response.status_code,
+                    "time_elapsed_seconds.txt": response.elapsed.total_seconds(),
+                },
+            )
+
+        # The server might send its headers before running the tool, in which case a failure
+        # of the tool results in an empty or truncated response body
+        try:
+            with timed("decode_time"):
+                output = json.loads(response.content)
+        except json.JSONDecodeError as e:
+            raise Exception(
+                f"failed to evaluate: invalid t8n-server response for state {state_json}, "
+                f"response: {response.text!r}"
+            ) from e
+
+        if response.status_code != 200:
+            raise Exception(
+                f"t8n-server returned status code {response.status_code}, "
+                f"response: {response.text}"
+            )
+        if not all([x in output for x in ["alloc", "result", "body"]]):
+            raise Exception(
+                "Malformed t8n output: missing 'alloc', 'result' or 'body', server response: "
+                f"{response.text}"
+            )
+
+        if debug_output_path:
+            dump_files_to_directory(
+                debug_output_path,
+                {
+                    "output/alloc.json": output["alloc"],
+                    "output/result.json": output["result"],
+                    "output/txs.rlp": output["body"],
+                },
+            )
+
+        if self.trace:
+            # The server might have been restarted by the request
+            server = self._servers[server_index]
+            assert server is not None
+            trace_dir = server.trace_dir or temp_dir
+            assert trace_dir is not None
+            # The trace files are moved out of the server's trace directory, if it is used
+            self.collect_traces(output["result"]["receipts"], trace_dir, debug_output_path)
+
+        return output, response.content
+
+    def _execute_stream(self, args: List[str], stdin: bytes) -> subprocess.CompletedProcess:
+        """
+        Runs the transition tool with the given arguments, writing the inputs to its stdin.
+        """
+        add_payload_size("input_bytes", len(stdin))
+        with timed("process_time"):
+            return subprocess.run(
+                args,
+                input=stdin,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
 
     def construct_args_stream(
         self, t8n_data: TransitionToolData, temp_dir: tempfile.TemporaryDirectory
@@ -528,7 +1058,7 @@ class TransitionTool:
         self,
         debug_output_path: str,
         temp_dir: tempfile.TemporaryDirectory,
-        stdin: Dict[str, Any],
+        stdin: bytes,
         args: List[str],
         result: subprocess.CompletedProcess,
     ):
@@ -538,6 +1068,8 @@ class TransitionTool:
         if not debug_output_path:
             return
 
+        stdin_json = json.loads(stdin)
+
         t8n_call = " ".join(args)
         t8n_output_base_dir = os.path.join(debug_output_path, "t8n.sh.out")
         if self.trace:
@@ -554,17 +1086,122 @@ class TransitionTool:
             debug_output_path,
             {
                 "args.py": args,
-                "input/alloc.json": stdin["alloc"],
-                "input/env.json": stdin["env"],
-                "input/txs.json": stdin["txs"],
+                "input/alloc.json": stdin_json["alloc"],
+                "input/env.json": stdin_json["env"],
+                "input/txs.json": stdin_json["txs"],
                 "returncode.txt": result.returncode,
-                "stdin.txt": stdin,
+                "stdin.txt": stdin_json,
                 "stdout.txt": result.stdout.decode(),
                 "stderr.txt": result.stderr.decode(),
                 "t8n.sh+x": t8n_script,
             },
         )
 
+    def _prepare_evaluation(
+        self,
+        *,
+        alloc: Any,
+        txs: Any,
+        env: Any,
+        fork_name: str,
+        chain_id: int,
+        reward: int,
+        eips: Optional[List[int]],
+        debug_output_path: str,
+    ) -> Tuple[TransitionToolData, Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Prepares the data of an evaluation and looks up its output in the memo and cache.
+
+        Returns the data to pass to the tool, the cache key of the evaluation, and the output
+        of the evaluation if it was memoized or cached.
+
+        Memoized and cached outputs are stored in their JSON encoding, and decoded on every
+        hit, so that the returned output can be modified by the caller.
+
+        The inputs are JSON encoded once, unless already encoded, and the encoded form is used
+        both for the cache key and as the input of the tool.
+        """
+        if eips is not None:
+            fork_name = "+".join([fork_name] + [str(eip) for eip in eips])
+        with timed("encode_time"):
+            alloc = encode_json(alloc)
+            txs = encode_json(txs)
+            env = encode_json(env)
+        if int(json.loads(env)["currentNumber"], 0) == 0:
+            reward = -1
+
+        # Identical evaluations are memoized in memory, e.g., the same blocks are filled for
+        # both the blockchain_test and blockchain_test_hive formats, and optionally cached on
+        # disk. Both are bypassed if the tool's traces or debug output are requested.
+        cache_key = None
+        cached_output = None
+        if not self.trace and not debug_output_path:
+            cache_key = TransitionToolCache.key(
+                version=self._cache_key_version,
+                fork_name=fork_name,
+                chain_id=chain_id,
+                reward=reward,
+                alloc=alloc,
+                env=env,
+                txs=txs,
+            )
+            raw_output = None
+            with self._evaluation_memo_lock:
+                if cache_key in self._evaluation_memo:
+                    self._evaluation_memo.move_to_end(cache_key)
+                    raw_output = self._evaluation_memo[cache_key]
+            if raw_output is not None:
+                with timed("decode_time"):
+                    cached_output = json.loads(raw_output)
+            elif self.cache is not None:
+                raw_output = self.cache.get(cache_key)
+                if raw_output is not None:
+                    try:
+                        with timed("decode_time"):
+                            cached_output = json.loads(raw_output)
+                    except json.JSONDecodeError:  # treated as a cache miss
+                        pass
+                    else:
+                        self._memoize_evaluation(cache_key, raw_output)
+
+        t8n_data = TransitionTool.TransitionToolData(
+            alloc=alloc,
+            txs=txs,
+            env=env,
+            fork_name=fork_name,
+            chain_id=chain_id,
+            reward=reward,
+            empty_string_to=self.empty_string_to(),
+        )
+        return t8n_data, cache_key, cached_output
+
+    def _store_evaluation(self, cache_key: Optional[str], raw_output: bytes):
+        """
+        Stores the JSON encoded output of an evaluation in the memo and cache.
+        """
+        if cache_key is not None:
+            self._memoize_evaluation(cache_key, raw_output)
+            if self.cache is not None:
+                self.cache.put(cache_key, raw_output)
+
+    def _memoize_evaluation(self, cache_key: str, raw_output: bytes):
+        """
+        Stores the JSON encoded output of an evaluation in the in-memory memo, which is bounded
+        by the total size of the outputs, evicting the least recently used outputs.
+        """
+        if len(raw_output) > self.evaluation_memo_max_bytes:
+            return
+        with self._evaluation_memo_lock:
+            previous_output = self._evaluation_memo.pop(cache_key, None)
+            if previous_output is not None:
+                self._evaluation_memo_bytes -= len(previous_output)
+            self._evaluation_memo[cache_key] = raw_output
+            self._evaluation_memo_bytes += len(raw_output)
+            while self._evaluation_memo_bytes > self.evaluation_memo_max_bytes:
+                _, evicted_output = self._evaluation_memo.popitem(last=False)
+                self._evaluation_memo_bytes -= len(evicted_output)
+
+    @record_call("evaluate")
     def evaluate(
         self,
         *,
@@ -580,31 +1217,97 @@ class TransitionTool:
         """
         Executes the relevant evaluate method as required by the `t8n` tool.
 
+        The `alloc`, `txs` and `env` inputs can either be JSON serializable data or already
+        JSON encoded `bytes`, e.g., serialized directly from the models.
+
         If a client's `t8n` tool varies from the default behavior, this method
         can be overridden.
         """
-        if eips is not None:
-            fork_name = "+".join([fork_name] + [str(eip) for eip in eips])
-        if int(env["currentNumber"], 0) == 0:
-            reward = -1
-        t8n_data = TransitionTool.TransitionToolData(
+        t8n_data, cache_key, cached_output = self._prepare_evaluation(
             alloc=alloc,
             txs=txs,
             env=env,
             fork_name=fork_name,
             chain_id=chain_id,
             reward=reward,
-            empty_string_to=self.empty_string_to(),
+            eips=eips,
+            debug_output_path=debug_output_path,
         )
+        if cached_output is not None:
+            return cached_output
 
-        if self.t8n_use_stream:
-            return self._evaluate_stream(t8n_data=t8n_data, debug_output_path=debug_output_path)
+        if self.t8n_use_server:
+            output, raw_output = self._evaluate_server(
+                t8n_data=t8n_data, debug_output_path=debug_output_path
+            )
+        elif self.t8n_use_stream:
+            output, raw_output = self._evaluate_stream(
+                t8n_data=t8n_data, debug_output_path=debug_output_path
+            )
         else:
-            return self._evaluate_filesystem(
+            output, raw_output = self._evaluate_filesystem(
                 t8n_data=t8n_data,
                 debug_output_path=debug_output_path,
             )
 
+        self._store_evaluation(cache_key, raw_output)
+        return output
+
+    @record_call("evaluate")
+    async def evaluate_async(
+        self,
+        *,
+        alloc: Any,
+        txs: Any,
+        env: Any,
+        fork_name: str,
+        chain_id: int = 1,
+        reward: int = 0,
+        eips: Optional[List[int]] = None,
+        debug_output_path: str = "",
+    ) -> Dict[str, Any]:
+        """
+        Asynchronous variant of `evaluate` that allows several independent evaluations to be in
+        flight at the same time, e.g., using `asyncio.gather`.
+
+        Tools that use streams are executed via `asyncio.create_subprocess_exec`, all other
+        tools run the blocking `evaluate` in a separate thread. If traces are collected, they
+        are appended in the order in which the evaluations finish.
+        """
+        if self.t8n_use_server or not self.t8n_use_stream or self.in_process:
+            return await asyncio.to_thread(
+                self.evaluate,
+                alloc=alloc,
+                txs=txs,
+                env=env,
+                fork_name=fork_name,
+                chain_id=chain_id,
+                reward=reward,
+                eips=eips,
+                debug_output_path=debug_output_path,
+            )
+
+        t8n_data, cache_key, cached_output = self._prepare_evaluation(
+            alloc=alloc,
+            txs=txs,
+            env=env,
+            fork_name=fork_name,
+            chain_id=chain_id,
+            reward=reward,
+            eips=eips,
+            debug_output_path=debug_output_path,
+        )
+        if cached_output is not None:
+            return cached_output
+
+        output, raw_output = await self._evaluate_stream_async(
+            t8n_data=t8n_data, debug_output_path=debug_output_path
+        )
+
+        self._store_evaluation(cache_key, raw_output)
+        return output
+
+    @record_call("verify_fixture")
     def verify_fixture(
         self,
         fixture_format: FixtureFormats,
@@ -15,6 +15,7 @@ import rich
 
 from cli.gen_index import generate_fixtures_index
 from ethereum_test_tools.spec.consume.types import TestCases
+from ethereum_test_tools.spec.file.binary import BINARY_FIXTURES_FILE_EXTENSION
 from evm_transition_tool import FixtureFormats
 
 cached_downloads_directory = Path("./cached_downloads")
@@ -122,9 +123,12 @@ def pytest_configure(config):  # noqa: D103
     input_source = Path(input_source)
     if not input_source.exists():
         pytest.exit(f"Specified fixture directory '{input_source}' does not exist.")
-    if not any(input_source.glob("**/*.json")):
+    if not any(input_source.glob("**/*.json")) and not any(
+        input_source.glob(f"**/*{BINARY_FIXTURES_FILE_EXTENSION}")
+    ):
         pytest.exit(
-            f"Specified fixture directory '{input_source}' does not contain any JSON files."
+            f"Specified fixture directory '{input_source}' does not contain any JSON or binary "
+            "fixture files."
         )
 
     index_file = input_source / "index.json"
@@ -14,6 +14,7 @@ import pytest
 
 from ethereum_test_tools.common.json import to_json
 from ethereum_test_tools.spec.consume.types import TestCaseIndexFile, TestCaseStream
+from ethereum_test_tools.spec.file.binary import is_binary_fixtures_file, read_binary_fixtures
 from ethereum_test_tools.spec.file.types import Fixtures
 from evm_transition_tool import TransitionTool
 
@@ -106,7 +107,8 @@ def fixture_path(test_case: TestCaseIndexFile | TestCaseStream, fixture_source):
     """
     The path to the current JSON fixture file.
 
-    If the fixture source is stdin, the fixture is written to a temporary json file.
+    If the fixture source is stdin, or the fixture is read from a binary fixture file, the
+    fixture is written to a temporary json file.
     """
     if fixture_source == "stdin":
         assert isinstance(test_case, TestCaseStream)
@@ -119,7 +121,17 @@ def fixture_path(test_case: TestCaseIndexFile | TestCaseStream, fixture_source):
         temp_dir.cleanup()
     else:
         assert isinstance(test_case, TestCaseIndexFile)
-        yield fixture_source / test_case.json_path
+        fixture_path = fixture_source / test_case.json_path
+        if not is_binary_fixtures_file(fixture_path):
+            yield fixture_path
+            return
+        temp_dir = tempfile.TemporaryDirectory()
+        json_fixture_path = Path(temp_dir.name) / f"{fixture_path.stem}.json"
+        payload = read_binary_fixtures(fixture_path)[test_case.id]
+        with open(json_fixture_path, "w") as f:
+            json.dump({test_case.id: json.loads(payload)}, f, indent=4)
+        yield json_fixture_path
+        temp_dir.cleanup()
 
 
 @pytest.fixture(scope="function")
@@ -9,7 +9,8 @@ import pytest
 
 from ethereum_test_tools.spec.blockchain.types import Fixture
 from ethereum_test_tools.spec.consume.types import TestCaseIndexFile, TestCaseStream
-from ethereum_test_tools.spec.file.types import BlockchainFixtures
+from ethereum_test_tools.spec.file.types import LazyFixtures
+from evm_transition_tool import FixtureFormats
 from pytest_plugins.consume.consume import JsonSource
 
 TestCase = TestCaseIndexFile | TestCaseStream
@@ -33,8 +34,13 @@ def fixture(fixture_source: JsonSource, test_case: TestCase) -> Fixture:
         # TODO: Optimize, json files will be loaded multiple times. This pytest fixture
         # is executed per test case, and a fixture json will contain multiple test cases.
         # Use cache fixtures as for statetest in consume direct?
-        fixtures = BlockchainFixtures.from_file(Path(fixture_source) / test_case.json_path)
-        fixture = fixtures[test_case.id]
+        fixtures = LazyFixtures.from_file(
+            Path(fixture_source) / test_case.json_path,
+            fixture_format=FixtureFormats.BLOCKCHAIN_TEST,
+        )
+        blockchain_fixture = fixtures[test_case.id]
+        assert isinstance(blockchain_fixture, Fixture), "Expected a blockchain test fixture"
+        fixture = blockchain_fixture
     return fixture
 
 
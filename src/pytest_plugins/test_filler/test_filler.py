@@ -24,14 +24,30 @@ from ethereum_test_forks import (
     get_closest_fork_with_solc_support,
     get_forks_with_solc_support,
 )
-from ethereum_test_tools import SPEC_TYPES, Alloc, BaseTest, FixtureCollector, TestInfo, Yul
+from ethereum_test_tools import (
+    SPEC_TYPES,
+    Alloc,
+    BaseTest,
+    FixtureCollector,
+    FixtureFileWriter,
+    TestInfo,
+    Yul,
+)
 from ethereum_test_tools.code import Solc
 from ethereum_test_tools.common.types import AllocMode, contract_address_iterator
+from ethereum_test_tools.spec.file.binary import BINARY_FIXTURES_FILE_EXTENSION
 from ethereum_test_tools.utility.versioning import (
     generate_github_url,
     get_current_commit_hash_or_tag,
 )
-from evm_transition_tool import FixtureFormats, TransitionTool
+from evm_transition_tool import (
+    DEFAULT_CACHE_MAX_SIZE_BYTES,
+    FixtureFormats,
+    TraceFilter,
+    TransitionTool,
+    TransitionToolCache,
+    TransitionToolMetrics,
+)
 from pytest_plugins.spec_version_checker.spec_version_checker import EIPSpecTestItem
 
 
@@ -89,6 +105,50 @@ def pytest_addoption(parser):
         default=None,
         help="Collect traces of the execution information from the transition tool.",
     )
+    evm_group.addoption(
+        "--trace-opcodes",
+        action="store",
+        dest="trace_opcodes",
+        type=str,
+        default=None,
+        help=(
+            "Comma-separated list of opcode names, e.g., 'SSTORE,SLOAD'; only the trace steps of "
+            "these opcodes are printed. Requires --traces. Default: All opcodes."
+        ),
+    )
+    evm_group.addoption(
+        "--trace-max-depth",
+        action="store",
+        dest="trace_max_depth",
+        type=int,
+        default=None,
+        help=(
+            "Only print the trace steps up to this call depth (the top-level call has depth 1). "
+            "Requires --traces. Default: No limit."
+        ),
+    )
+    evm_group.addoption(
+        "--trace-tx-index",
+        action="append",
+        dest="trace_tx_indexes",
+        type=int,
+        default=None,
+        help=(
+            "Only keep the traces of the transaction at this index within its block; may be "
+            "specified multiple times. Requires --traces. Default: All transactions."
+        ),
+    )
+    evm_group.addoption(
+        "--trace-last-steps",
+        action="store",
+        dest="trace_last_steps",
+        type=int,
+        default=None,
+        help=(
+            "Only print the last N trace steps of each transaction. Requires --traces. "
+            "Default: All steps."
+        ),
+    )
     evm_group.addoption(
         "--verify-fixtures",
         action="store_true",
@@ -113,6 +173,43 @@ def pytest_addoption(parser):
         ),
     )
 
+    evm_group.addoption(
+        "--t8n-cache-dir",
+        action="store",
+        dest="t8n_cache_dir",
+        type=Path,
+        default=None,
+        help=(
+            "Directory used to cache the outputs of the transition tool. Evaluations with "
+            "identical inputs, tool version and fork are not re-executed. The cache is not used "
+            "with --traces or --evm-dump-dir. Default: Disabled."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-cache-max-size",
+        action="store",
+        dest="t8n_cache_max_size",
+        type=int,
+        default=DEFAULT_CACHE_MAX_SIZE_BYTES // (1024 * 1024),
+        help=(
+            "Maximum size of the transition tool cache in MiB; least recently used entries are "
+            f"evicted. Default: {DEFAULT_CACHE_MAX_SIZE_BYTES // (1024 * 1024)}."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-metrics",
+        action="store",
+        dest="t8n_metrics_path",
+        type=Path,
+        default=None,
+        help=(
+            "Write the timings (wall, process, spawn, JSON encode/decode) and payload sizes of "
+            "the transition tool calls, aggregated per test, fork, tool and method, to this "
+            "file at the end of the session; CSV if the path ends with '.csv', else JSON. "
+            "Default: Disabled."
+        ),
+    )
+
     solc_group = parser.getgroup("solc", "Arguments defining the solc executable")
     solc_group.addoption(
         "--solc-bin",
@@ -164,6 +261,40 @@ def pytest_addoption(parser):
             "file. This can be used to increase the granularity of --verify-fixtures."
         ),
     )
+    test_group.addoption(
+        "--binary-output",
+        action="store_true",
+        dest="binary_output",
+        default=False,
+        help=(
+            "Write the fixtures to binary fixture files ('.bin') instead of indented JSON files. "
+            "Binary fixture files are faster to load and can be read by the consume commands, "
+            "but can't be verified with --verify-fixtures."
+        ),
+    )
+    test_group.addoption(
+        "--compress-output",
+        action="store_true",
+        dest="compress_output",
+        default=False,
+        help=(
+            "Write the fixtures to compressed binary fixture files ('.bin'), implies "
+            "--binary-output. Each fixture is compressed separately, so that single fixtures "
+            "can still be read without decompressing the whole file."
+        ),
+    )
+    test_group.addoption(
+        "--fixture-writers",
+        action="store",
+        dest="fixture_writers",
+        type=int,
+        default=0,
+        help=(
+            "Number of worker processes that write the fixture files in the background while "
+            "the remaining tests are executed. Default: 0, the fixture files are written in the "
+            "test process."
+        ),
+    )
     test_group.addoption(
         "--no-html",
         action="store_true",
@@ -253,6 +384,14 @@ def pytest_configure(config):
     )
     if config.option.collectonly:
         return
+    if config.getoption("compress_output"):
+        config.option.binary_output = True
+    if config.getoption("binary_output") and config.getoption("verify_fixtures"):
+        pytest.exit(
+            "The --binary-output (or --compress-output) and --verify-fixtures flags can't be "
+            "used together.",
+            returncode=pytest.ExitCode.USAGE_ERROR,
+        )
     if not config.getoption("disable_html") and config.getoption("htmlpath") is None:
         # generate an html report by default, unless explicitly disabled
         config.option.htmlpath = (
@@ -264,15 +403,7 @@ def pytest_configure(config):
     t8n = TransitionTool.from_binary_path(
         binary_path=config.getoption("evm_bin"), trace=config.getoption("evm_collect_traces")
     )
-    if (
-        isinstance(config.getoption("numprocesses"), int)
-        and config.getoption("numprocesses") > 0
-        and "Besu" in str(t8n.detect_binary_pattern)
-    ):
-        pytest.exit(
-            "The Besu t8n tool does not work well with the xdist plugin; use -n=0.",
-            returncode=pytest.ExitCode.USAGE_ERROR,
-        )
+    config.t8n_metrics = TransitionToolMetrics()
     config.solc_version = Solc(config.getoption("solc_bin")).version
     if config.solc_version < Frontier.solc_min_version():
         pytest.exit(
@@ -326,6 +457,7 @@ def pytest_html_results_table_header(cells):
     """
     cells.insert(3, '<th class="sortable" data-column-type="fixturePath">JSON Fixture File</th>')
     cells.insert(4, '<th class="sortable" data-column-type="evmDumpDir">EVM Dump Dir</th>')
+    cells.insert(5, '<th class="sortable" data-column-type="t8nTime">t8n Time (s)</th>')
     del cells[-1]  # Remove the "Links" column
 
 
@@ -360,6 +492,7 @@ def pytest_html_results_table_row(report, cells):
                 else:
                     evm_dump_entry = f'<a href="{evm_dump_dir}" target="_blank">{evm_dump_dir}</a>'
                 cells.insert(4, f"<td>{evm_dump_entry}</td>")
+        cells.insert(5, f"<td>{user_props.get('t8n_time', '')}</td>")
     del cells[-1]  # Remove the "Links" column
 
 
@@ -393,6 +526,49 @@ def pytest_runtest_makereport(item, call):
                 report.user_properties.append(("evm_dump_dir", item.config.evm_dump_dir))
             else:
                 report.user_properties.append(("evm_dump_dir", "N/A"))  # not yet for EOF
+        if hasattr(item.config, "t8n_metrics"):
+            t8n_totals = item.config.t8n_metrics.test_totals(item.nodeid)
+            if t8n_totals is not None:
+                report.user_properties.append(("t8n_time", f"{t8n_totals['wall_time']:.3f}"))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """
+    Account the transition tool calls made while running a test function to the test.
+    """
+    if not hasattr(pyfuncitem.config, "t8n_metrics"):
+        yield
+        return
+    pyfuncitem.config.t8n_metrics.test_id = pyfuncitem.nodeid
+    try:
+        yield
+    finally:
+        pyfuncitem.config.t8n_metrics.test_id = None
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Collect the transition tool metrics of a finished pytest-xdist worker.
+    """
+    if hasattr(node.config, "t8n_metrics") and "t8n_metrics" in node.workeroutput:
+        node.config.t8n_metrics.merge(node.workeroutput["t8n_metrics"])
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Pass the transition tool metrics of an xdist worker to the controller, or write the
+    metrics of the whole session to the file specified via `--t8n-metrics`.
+    """
+    if not hasattr(session.config, "t8n_metrics"):
+        return
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["t8n_metrics"] = session.config.t8n_metrics.totals
+        return
+    t8n_metrics_path = session.config.getoption("t8n_metrics_path")
+    if t8n_metrics_path is not None:
+        session.config.t8n_metrics.write(t8n_metrics_path)
 
 
 def pytest_html_report_title(report):
@@ -435,6 +611,23 @@ def t8n(request, evm_bin: Path) -> Generator[TransitionTool, None, None]:
     t8n = TransitionTool.from_binary_path(
         binary_path=evm_bin, trace=request.config.getoption("evm_collect_traces")
     )
+    trace_opcodes = request.config.getoption("trace_opcodes")
+    trace_tx_indexes = request.config.getoption("trace_tx_indexes")
+    trace_filter = TraceFilter(
+        opcodes=set(trace_opcodes.split(",")) if trace_opcodes is not None else None,
+        max_depth=request.config.getoption("trace_max_depth"),
+        tx_indexes=set(trace_tx_indexes) if trace_tx_indexes is not None else None,
+        last_steps=request.config.getoption("trace_last_steps"),
+    )
+    if trace_filter != TraceFilter():
+        t8n.trace_filter = trace_filter
+    t8n.metrics = getattr(request.config, "t8n_metrics", None)
+    t8n_cache_dir = request.config.getoption("t8n_cache_dir")
+    if t8n_cache_dir is not None:
+        t8n.cache = TransitionToolCache(
+            t8n_cache_dir,
+            max_size_bytes=request.config.getoption("t8n_cache_max_size") * 1024 * 1024,
+        )
     yield t8n
     t8n.shutdown()
 
@@ -494,6 +687,7 @@ def evm_fixture_verification(
             "Either remove --verify-fixtures or set --verify-fixtures-bin to a Geth evm binary.",
             returncode=pytest.ExitCode.USAGE_ERROR,
         )
+    evm_fixture_verification.metrics = getattr(request.config, "t8n_metrics", None)
     yield evm_fixture_verification
     evm_fixture_verification.shutdown()
 
@@ -583,7 +777,7 @@ def create_tarball(
     Create a tarball of json files the output directory if the configured
     output ends with '.tar.gz'.
 
-    Only include .json and .ini files in the archive.
+    Only include .json, .ini and binary fixture files in the archive.
     """
     yield
     if is_output_tarball:
@@ -591,7 +785,7 @@ def create_tarball(
         tarball_filename = request.config.getoption("output")
         with tarfile.open(tarball_filename, "w:gz") as tar:
             for file in source_dir.rglob("*"):
-                if file.suffix in {".json", ".ini"}:
+                if file.suffix in {".json", ".ini", BINARY_FIXTURES_FILE_EXTENSION}:
                     arcname = Path("fixtures") / file.relative_to(source_dir)
                     tar.add(file, arcname=arcname)
 
@@ -633,9 +827,23 @@ def get_fixture_collection_scope(fixture_name, config):
     return "module"
 
 
+@pytest.fixture(scope="session")
+def fixture_file_writer(request) -> Generator[FixtureFileWriter, None, None]:
+    """
+    Returns the writer shared by all fixture collectors, that writes the fixture files from
+    a pool of worker processes if requested with `--fixture-writers`.
+    """
+    fixture_file_writer = FixtureFileWriter(
+        max_workers=request.config.getoption("fixture_writers")
+    )
+    yield fixture_file_writer
+    fixture_file_writer.shutdown()
+
+
 @pytest.fixture(scope=get_fixture_collection_scope)
 def fixture_collector(
     request,
+    fixture_file_writer: FixtureFileWriter,
     do_fixture_verification: bool,
     evm_fixture_verification: TransitionTool,
     filler_path: Path,
@@ -652,6 +860,9 @@ def fixture_collector(
         single_fixture_per_file=request.config.getoption("single_fixture_per_file"),
         filler_path=filler_path,
         base_dump_dir=base_dump_dir,
+        binary_output=request.config.getoption("binary_output"),
+        compress_output=request.config.getoption("compress_output"),
+        writer=fixture_file_writer,
     )
     yield fixture_collector
     fixture_collector.dump_fixtures()
@@ -5,6 +5,7 @@ Test the forks plugin.
 import configparser
 import json
 import os
+import tarfile
 import textwrap
 from datetime import datetime
 from pathlib import Path
@@ -545,3 +546,34 @@ def test_fixture_output_based_on_command_line_args(
         assert "build" in properties
         build_name = args[args.index("--build-name") + 1]
         assert properties["build"] == build_name
+
+
+@pytest.mark.parametrize("args", [["--binary-output"], ["--compress-output"]])
+def test_binary_fixture_output_tarball(testdir, args):
+    """
+    Test that the binary fixture files are included in the output tarball.
+    """
+    tests_dir = testdir.mkdir("tests")
+    paris_tests_dir = tests_dir.mkdir("paris")
+    test_module = paris_tests_dir.join("test_module_paris.py")
+    test_module.write(test_module_paris)
+
+    testdir.copy_example(name="pytest.ini")
+    result = testdir.runpytest(*args, "--output", "fixtures.tar.gz", "-v", "--no-html")
+    result.assert_outcomes(
+        passed=test_count_paris * 3,
+        failed=0,
+        skipped=0,
+        errors=0,
+    )
+    output_dir = Path("fixtures").absolute()
+    expected_members = {
+        str(Path("fixtures") / file.relative_to(output_dir))
+        for file in output_dir.rglob("*")
+        if file.is_file()
+    }
+    assert (output_dir / "state_tests" / "paris" / "module_paris" / "paris_one.bin").exists()
+    with tarfile.open("fixtures.tar.gz", "r:gz") as tar:
+        members = {member.name for member in tar.getmembers() if member.isfile()}
+    assert members == expected_members
+    assert "fixtures/fixtures.ini" in members
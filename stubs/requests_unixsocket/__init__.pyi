@@ -0,0 +1,6 @@
+from requests import Session as RequestsSession
+
+class Session(RequestsSession):
+    def __init__(self, url_scheme: str = ..., *args, **kwargs) -> None: ...
+
+__all__ = ("Session",)